@@ -0,0 +1,50 @@
+from models import ClonePlan, RepositoryMetadata
+from config import CLONE_ADMISSION
+
+DEGRADED_STRATEGIES = ('shallow', 'sparse')
+
+class AdmissionController:
+    def __init__(self, limits: dict = None):
+        self.limits = dict(CLONE_ADMISSION, **(limits or {}))
+    
+    def estimate_files(self, size_kb: int) -> int:
+        return int(size_kb / self.limits['kb_per_file'])
+    
+    def plan(self, repo_metadata: RepositoryMetadata) -> ClonePlan:
+        size_kb = repo_metadata.size_kb
+        if size_kb is None:
+            return ClonePlan('full', 'repository size unknown')
+        
+        limits = self.limits
+        estimated_files = self.estimate_files(size_kb)
+        size_mb = size_kb / 1024
+        
+        if size_kb > limits['sparse_max_kb']:
+            return ClonePlan(
+                'refuse',
+                f"repository is {size_mb:.0f} MB, above the {limits['sparse_max_kb'] / 1024:.0f} MB limit",
+                size_kb, estimated_files
+            )
+        
+        if size_kb > limits['shallow_max_kb'] or estimated_files > limits['max_estimated_files']:
+            return ClonePlan(
+                'sparse',
+                f"repository is {size_mb:.0f} MB with ~{estimated_files} files; checking out top-level files only",
+                size_kb, estimated_files, depth=1
+            )
+        
+        if size_kb > limits['blobless_max_kb']:
+            return ClonePlan(
+                'shallow',
+                f"repository is {size_mb:.0f} MB; fetching the last {limits['shallow_depth']} commits",
+                size_kb, estimated_files, depth=limits['shallow_depth']
+            )
+        
+        if size_kb > limits['full_max_kb']:
+            return ClonePlan(
+                'blobless',
+                f"repository is {size_mb:.0f} MB; fetching file contents for HEAD only",
+                size_kb, estimated_files
+            )
+        
+        return ClonePlan('full', f"repository is {size_mb:.0f} MB", size_kb, estimated_files)
\ No newline at end of file
@@ -0,0 +1,494 @@
+from dataclasses import replace
+from typing import List
+import numpy as np
+from models import AnalysisResult, DimensionScore
+from insight_generator import InsightGenerator
+from scoring_engine import ScoringEngine
+
+DOC_EXTENSIONS = ['.md', '.rst', '.txt']
+
+def _pick(conditions: list, values: list, default) -> np.ndarray:
+    return np.select(conditions, values, default)
+
+class MetricColumns:
+    def __init__(self, results: List[AnalysisResult]):
+        self.size = len(results)
+        
+        def column(getter, dtype=np.float64):
+            return np.fromiter((getter(r) for r in results), dtype=dtype, count=self.size)
+        
+        self.comment_ratio = column(lambda r: r.code_metrics.comment_ratio)
+        self.avg_complexity = column(lambda r: r.code_metrics.avg_complexity)
+        self.avg_file_length = column(lambda r: r.code_metrics.avg_file_length)
+        self.avg_function_length = column(lambda r: r.code_metrics.avg_function_length)
+        self.max_complexity = column(lambda r: r.code_metrics.max_complexity, np.int64)
+        self.functions_count = column(lambda r: r.code_metrics.functions_count, np.int64)
+        self.high_complexity = column(
+            lambda r: r.code_metrics.complexity_distribution.get('high', 0) +
+            r.code_metrics.complexity_distribution.get('very_high', 0),
+            np.int64
+        )
+        self.sampling_error = column(
+            lambda r: r.code_metrics.sampling['sampling_error'] if r.code_metrics.sampling else 0.0
+        )
+        
+        self.total_files = column(lambda r: r.file_structure.total_files, np.int64)
+        self.total_code_files = column(lambda r: r.file_structure.total_code_files, np.int64)
+        self.max_depth = column(lambda r: r.file_structure.max_depth, np.int64)
+        self.directories = column(lambda r: r.file_structure.directories, np.int64)
+        self.extension_diversity = column(lambda r: len(r.file_structure.file_types), np.int64)
+        self.doc_files = column(
+            lambda r: sum(count for ext, count in r.file_structure.file_types.items() if ext in DOC_EXTENSIONS),
+            np.int64
+        )
+        self.key_files = {
+            key: column(lambda r, key=key: r.file_structure.key_files_present.get(key, False), np.bool_)
+            for key in ['readme', 'license', 'contributing', 'changelog', 'code_of_conduct', 'gitignore']
+        }
+        
+        self.has_test_directory = column(lambda r: r.testing_metrics.has_test_directory, np.bool_)
+        self.test_to_code_ratio = column(lambda r: r.testing_metrics.test_to_code_ratio)
+        self.has_ci_cd = column(lambda r: r.testing_metrics.has_ci_cd, np.bool_)
+        self.has_linter_config = column(lambda r: r.testing_metrics.has_linter_config, np.bool_)
+        
+        self.total_commits = column(lambda r: r.git_metrics.total_commits, np.int64)
+        self.good_commit_messages = column(lambda r: r.git_metrics.good_commit_messages, np.int64)
+        self.incremental_commits = column(lambda r: r.git_metrics.incremental_commits, np.int64)
+        self.commit_sizes_known = column(lambda r: r.git_metrics.commit_sizes_known, np.bool_)
+        self.total_branches = column(lambda r: r.git_metrics.total_branches, np.int64)
+        trend_codes = {'active': 0, 'moderate': 1, 'inactive': 2}
+        self.trend = column(lambda r: trend_codes.get(r.git_metrics.commit_frequency_trend, 3), np.int64)
+        
+        self.has_package_manager = column(lambda r: r.maturity_metrics.has_package_manager, np.bool_)
+        self.has_config_example = column(lambda r: r.maturity_metrics.has_config_example, np.bool_)
+        self.has_deployment_config = column(lambda r: r.maturity_metrics.has_deployment_config, np.bool_)
+        self.feature_count = column(
+            lambda r: sum(1 for v in r.maturity_metrics.real_world_features.values() if v), np.int64
+        )
+        self.error_handling_score = column(lambda r: r.maturity_metrics.error_handling_score)
+        self.partial = column(lambda r: r.partial, np.bool_)
+
+class BatchRescorer:
+    def __init__(self, scoring_engine: ScoringEngine = None):
+        self.scoring_engine = scoring_engine or ScoringEngine()
+        self.weights = self.scoring_engine.weights
+        self.tier_thresholds = self.scoring_engine.tier_thresholds
+        self.confidence_thresholds = self.scoring_engine.confidence_thresholds
+        self.insight_generator = InsightGenerator()
+    
+    def _finish(self, score: np.ndarray, weight_key: str):
+        score = np.clip(score, 0, 100)
+        percentage = score / 100
+        weighted = percentage * self.weights[weight_key] * 100
+        return score, percentage, weighted
+    
+    def score_code_quality(self, c: MetricColumns) -> dict:
+        comment_level = _pick([c.comment_ratio >= 0.15, c.comment_ratio >= 0.08], [0, 1], 2)
+        complexity_level = _pick([c.avg_complexity <= 5, c.avg_complexity <= 10], [0, 1], 2)
+        file_level = _pick([c.avg_file_length <= 300, c.avg_file_length <= 500], [0, 1], 2)
+        function_level = _pick([c.avg_function_length <= 30, c.avg_function_length <= 50], [0, 1], 2)
+        very_complex = c.max_complexity > 20
+        many_complex = c.high_complexity > c.functions_count * 0.2
+        
+        score = (np.array([25, 15, 5])[comment_level] + np.array([30, 20, 10])[complexity_level] +
+                 np.array([20, 12, 5])[file_level] + np.array([15, 10, 3])[function_level] -
+                 10 * very_complex - 5 * many_complex + 10)
+        
+        return {
+            'levels': (comment_level, complexity_level, file_level, function_level, very_complex, many_complex),
+            'totals': self._finish(score, 'code_quality')
+        }
+    
+    def score_structure_modularity(self, c: MetricColumns) -> dict:
+        files = c.total_files
+        depth = c.max_depth
+        file_level = _pick([(files >= 5) & (files <= 50), files <= 100, files > 200], [0, 1, 2], 3)
+        depth_level = _pick([(depth >= 2) & (depth <= 5), depth <= 7, depth > 10], [0, 1, 2], 3)
+        code_ratio = np.divide(c.total_code_files, files, out=np.zeros(c.size), where=files > 0)
+        ratio_level = _pick([code_ratio >= 0.6, code_ratio >= 0.3], [0, 1], 2)
+        organization_level = _pick([c.directories >= 3, c.directories >= 1], [0, 1], 2)
+        diversity_level = _pick([c.extension_diversity >= 5, c.extension_diversity >= 3], [0, 1], 2)
+        
+        score = (np.array([25, 20, 10, 15])[file_level] + np.array([25, 18, 8, 15])[depth_level] +
+                 np.array([20, 15, 8])[ratio_level] + np.array([15, 10, 3])[organization_level] +
+                 np.array([15, 10, 5])[diversity_level])
+        score = np.where(files == 0, 0, score)
+        
+        return {
+            'levels': (file_level, depth_level, ratio_level, organization_level, diversity_level, files == 0),
+            'totals': self._finish(score, 'structure_modularity')
+        }
+    
+    def score_documentation(self, c: MetricColumns) -> dict:
+        k = c.key_files
+        doc_level = _pick([c.doc_files >= 5, c.doc_files >= 2], [0, 1], 2)
+        
+        score = (40 * k['readme'] + 20 * k['license'] + 15 * k['contributing'] +
+                 10 * k['changelog'] + 10 * k['code_of_conduct'] + np.array([5, 3, 0])[doc_level])
+        
+        return {
+            'levels': (doc_level,),
+            'totals': self._finish(score, 'documentation')
+        }
+    
+    def score_testing_maintainability(self, c: MetricColumns) -> dict:
+        ratio = c.test_to_code_ratio
+        coverage_level = _pick([ratio >= 0.3, ratio >= 0.15, ratio > 0], [0, 1, 2], 3)
+        maintainability_level = _pick([c.avg_complexity <= 8, c.avg_complexity <= 15], [0, 1], 2)
+        
+        score = (25 * c.has_test_directory + np.array([25, 15, 8, 0])[coverage_level] +
+                 20 * c.has_ci_cd + 15 * c.has_linter_config +
+                 np.array([15, 10, 5])[maintainability_level])
+        
+        return {
+            'levels': (coverage_level, maintainability_level),
+            'totals': self._finish(score, 'testing_maintainability')
+        }
+    
+    def score_git_practices(self, c: MetricColumns) -> dict:
+        commits = c.total_commits
+        safe_commits = np.maximum(commits, 1)
+        count_level = _pick([commits >= 20, commits >= 10, commits >= 5], [0, 1, 2], 3)
+        good_ratio = c.good_commit_messages / safe_commits
+        message_level = _pick([good_ratio >= 0.7, good_ratio >= 0.5, good_ratio >= 0.3], [0, 1, 2], 3)
+        incremental_ratio = c.incremental_commits / safe_commits
+        style_level = _pick([~c.commit_sizes_known, incremental_ratio >= 0.7, incremental_ratio >= 0.4], [3, 0, 1], 2)
+        branching = c.total_branches > 1
+        
+        score = (np.array([20, 15, 10, 5])[count_level] + np.array([25, 18, 10, 5])[message_level] +
+                 np.array([20, 12, 5, 10])[c.trend] + np.array([20, 12, 5, 12])[style_level] +
+                 15 * branching)
+        score = np.where(commits == 0, 0, score)
+        
+        return {
+            'levels': (count_level, message_level, style_level, branching, commits == 0),
+            'totals': self._finish(score, 'git_practices')
+        }
+    
+    def score_real_world_readiness(self, c: MetricColumns) -> dict:
+        features = c.feature_count
+        errors = c.error_handling_score
+        feature_level = _pick([features >= 3, features >= 2, features >= 1], [0, 1, 2], 3)
+        error_level = _pick([errors >= 0.6, errors >= 0.3, errors > 0], [0, 1, 2], 3)
+        
+        score = (25 * c.has_package_manager + 10 * c.key_files['gitignore'] + 15 * c.has_config_example +
+                 np.array([25, 18, 10, 0])[feature_level] + np.array([15, 10, 5, 0])[error_level] +
+                 10 * c.has_deployment_config)
+        
+        return {
+            'levels': (feature_level, error_level),
+            'totals': self._finish(score, 'real_world_readiness')
+        }
+    
+    def determine_tiers(self, overall: np.ndarray) -> np.ndarray:
+        return _pick(
+            [overall >= self.tier_thresholds['advanced'], overall >= self.tier_thresholds['intermediate']],
+            ["Advanced", "Intermediate"],
+            "Beginner"
+        )
+    
+    def determine_confidences(self, c: MetricColumns) -> np.ndarray:
+        levels = []
+        for name in ['high', 'medium']:
+            threshold = self.confidence_thresholds[name]
+            levels.append(
+                (c.total_files >= threshold['min_files']) &
+                (c.total_commits >= threshold['min_commits']) &
+                (c.sampling_error <= threshold['max_sampling_error'])
+            )
+        rank = _pick(levels, [0, 1], 2)
+        rank = np.where(c.partial, np.minimum(rank + 1, 2), rank)
+        return np.array(["High", "Medium", "Low"])[rank]
+    
+    def score_columns(self, c: MetricColumns) -> dict:
+        dimensions = {
+            'code_quality': self.score_code_quality(c),
+            'structure_modularity': self.score_structure_modularity(c),
+            'documentation': self.score_documentation(c),
+            'testing_maintainability': self.score_testing_maintainability(c),
+            'git_practices': self.score_git_practices(c),
+            'real_world_readiness': self.score_real_world_readiness(c)
+        }
+        
+        rounded = {}
+        overall = np.zeros(c.size)
+        for key, scored in dimensions.items():
+            score, percentage, weighted = scored['totals']
+            rounded[key] = (
+                [round(value, 3) for value in percentage.tolist()],
+                [round(value, 2) for value in weighted.tolist()]
+            )
+            overall = overall + np.array(rounded[key][1])
+        
+        overall_scores = [round(value, 2) for value in overall.tolist()]
+        
+        return {
+            'dimensions': dimensions,
+            'rounded': rounded,
+            'overall': overall_scores,
+            'tiers': self.determine_tiers(np.array(overall_scores)).tolist(),
+            'confidences': self.determine_confidences(c).tolist()
+        }
+    
+    def rescore(self, results: List[AnalysisResult], with_insights: bool = True) -> List[AnalysisResult]:
+        if not results:
+            return []
+        
+        batch = self.score_columns(MetricColumns(results))
+        details_by_key = {
+            'code_quality': self._code_quality_details,
+            'structure_modularity': self._structure_details,
+            'documentation': self._documentation_details,
+            'testing_maintainability': self._testing_details,
+            'git_practices': self._git_details,
+            'real_world_readiness': self._readiness_details
+        }
+        dimensions = [
+            (key, scored, details_by_key[key]) for key, scored in batch['dimensions'].items()
+        ]
+        rounded = batch['rounded']
+        overall_scores = batch['overall']
+        tiers = batch['tiers']
+        confidences = batch['confidences']
+        
+        rescored = []
+        for row, analysis in enumerate(results):
+            dimension_scores = []
+            for key, scored, details in dimensions:
+                name, empty_reasoning, signals, reasons = details(analysis, scored['levels'], row)
+                score = int(scored['totals'][0][row])
+                percentage, weighted = rounded[key][0][row], rounded[key][1][row]
+                if empty_reasoning is not None:
+                    dimension_scores.append(DimensionScore(
+                        name=name, score=0, max_score=100, percentage=0, weight=self.weights[key],
+                        weighted_score=0, signals={}, reasoning=empty_reasoning
+                    ))
+                    continue
+                dimension_scores.append(DimensionScore(
+                    name=name,
+                    score=score,
+                    max_score=100,
+                    percentage=percentage,
+                    weight=self.weights[key],
+                    weighted_score=weighted,
+                    signals=signals,
+                    reasoning=reasons
+                ))
+            
+            result = replace(
+                analysis,
+                dimension_scores=dimension_scores,
+                overall_score=overall_scores[row],
+                tier=tiers[row],
+                confidence=confidences[row]
+            )
+            if with_insights:
+                result.strengths = self.insight_generator.generate_strengths(result)
+                result.weaknesses = self.insight_generator.generate_weaknesses(result)
+            rescored.append(result)
+        
+        return rescored
+    
+    def _code_quality_details(self, analysis: AnalysisResult, levels: tuple, row: int):
+        cm = analysis.code_metrics
+        comment_level, complexity_level, file_level, function_level, very_complex, many_complex = \
+            (level[row] for level in levels)
+        reasons = []
+        
+        comment_signal = ['excellent', 'adequate', 'poor'][comment_level]
+        reasons.append([
+            f"Good comment ratio ({cm.comment_ratio:.1%})",
+            f"Adequate comment ratio ({cm.comment_ratio:.1%})",
+            f"Low comment ratio ({cm.comment_ratio:.1%})"
+        ][comment_level])
+        
+        complexity_signal = ['low', 'moderate', 'high'][complexity_level]
+        reasons.append([
+            f"Low average complexity ({cm.avg_complexity:.1f})",
+            f"Moderate complexity ({cm.avg_complexity:.1f})",
+            f"High complexity ({cm.avg_complexity:.1f})"
+        ][complexity_level])
+        
+        file_signal = ['optimal', 'acceptable', 'long'][file_level]
+        if file_level == 0:
+            reasons.append(f"Good file length ({cm.avg_file_length:.0f} lines)")
+        elif file_level == 2:
+            reasons.append(f"Files are long ({cm.avg_file_length:.0f} lines avg)")
+        
+        function_signal = ['optimal', 'acceptable', 'long'][function_level]
+        if function_level == 0:
+            reasons.append("Functions are concise")
+        elif function_level == 2:
+            reasons.append(f"Functions are long ({cm.avg_function_length:.0f} lines)")
+        
+        if very_complex:
+            reasons.append(f"Some functions are very complex (max: {cm.max_complexity})")
+        if many_complex:
+            reasons.append("Many functions have high complexity")
+        
+        signals = {
+            'comment_ratio': comment_signal,
+            'complexity': complexity_signal,
+            'file_length': file_signal,
+            'function_length': function_signal
+        }
+        return "Code Quality", None, signals, "; ".join(reasons) if reasons else "Code quality metrics analyzed"
+    
+    def _structure_details(self, analysis: AnalysisResult, levels: tuple, row: int):
+        fs = analysis.file_structure
+        file_level, depth_level, ratio_level, organization_level, diversity_level, empty = \
+            (level[row] for level in levels)
+        if empty:
+            return "Structure & Modularity", "No files found in repository", {}, None
+        
+        reasons = []
+        if file_level == 0:
+            reasons.append("Well-sized project")
+        elif file_level == 2:
+            reasons.append("Large project with many files")
+        if depth_level == 0:
+            reasons.append(f"Good directory depth ({fs.max_depth})")
+        elif depth_level == 2:
+            reasons.append(f"Deep directory nesting ({fs.max_depth} levels)")
+        if ratio_level == 0:
+            reasons.append("High proportion of code files")
+        if organization_level == 0:
+            reasons.append("Well-organized with multiple directories")
+        elif organization_level == 2:
+            reasons.append("Flat structure with few directories")
+        
+        signals = {
+            'file_count': ['optimal', 'good', 'large', 'moderate'][file_level],
+            'depth': ['optimal', 'acceptable', 'too_deep', 'moderate'][depth_level],
+            'code_ratio': ['high', 'moderate', 'low'][ratio_level],
+            'diversity': ['high', 'moderate', 'low'][diversity_level]
+        }
+        return "Structure & Modularity", None, signals, "; ".join(reasons) if reasons else "Structure metrics analyzed"
+    
+    def _documentation_details(self, analysis: AnalysisResult, levels: tuple, row: int):
+        key_files = analysis.file_structure.key_files_present
+        doc_level = levels[0][row]
+        signals = {}
+        reasons = []
+        
+        for key, present_reason, missing_reason in [
+            ('readme', "README present", "Missing README"),
+            ('license', "LICENSE present", "Missing LICENSE"),
+            ('contributing', "CONTRIBUTING guide present", None),
+            ('changelog', "CHANGELOG present", None),
+            ('code_of_conduct', None, None)
+        ]:
+            present = bool(key_files.get(key, False))
+            signals[key] = present
+            reason = present_reason if present else missing_reason
+            if reason:
+                reasons.append(reason)
+        
+        if doc_level == 0:
+            reasons.append("Multiple documentation files")
+        
+        return "Documentation", None, signals, "; ".join(reasons) if reasons else "Documentation assessed"
+    
+    def _testing_details(self, analysis: AnalysisResult, levels: tuple, row: int):
+        testing = analysis.testing_metrics
+        coverage_level, maintainability_level = (level[row] for level in levels)
+        reasons = []
+        
+        reasons.append("Test directory present" if testing.has_test_directory else "No test directory found")
+        reasons.append([
+            f"High test coverage ({testing.test_to_code_ratio:.1%})",
+            f"Moderate test coverage ({testing.test_to_code_ratio:.1%})",
+            f"Low test coverage ({testing.test_to_code_ratio:.1%})",
+            "No tests detected"
+        ][coverage_level])
+        reasons.append(
+            f"CI/CD configured ({', '.join(testing.ci_cd_tools)})" if testing.has_ci_cd
+            else "No CI/CD configuration"
+        )
+        reasons.append("Linter configured" if testing.has_linter_config else "No linter configuration")
+        if maintainability_level == 0:
+            reasons.append("Low complexity improves maintainability")
+        elif maintainability_level == 2:
+            reasons.append("High complexity reduces maintainability")
+        
+        signals = {
+            'test_directory': bool(testing.has_test_directory),
+            'test_coverage': ['excellent', 'good', 'low', 'none'][coverage_level],
+            'ci_cd': bool(testing.has_ci_cd),
+            'linter': bool(testing.has_linter_config),
+            'maintainability': ['high', 'moderate', 'low'][maintainability_level]
+        }
+        return "Testing & Maintainability", None, signals, "; ".join(reasons)
+    
+    def _git_details(self, analysis: AnalysisResult, levels: tuple, row: int):
+        git = analysis.git_metrics
+        count_level, message_level, style_level, branching, empty = (level[row] for level in levels)
+        if empty:
+            return "Git Practices", "No commit history", {}, None
+        
+        reasons = []
+        if count_level == 0:
+            reasons.append(f"Healthy commit history ({git.total_commits} commits)")
+        elif count_level == 3:
+            reasons.append(f"Few commits ({git.total_commits})")
+        reason = ["Excellent commit message quality", "Good commit messages", None,
+                  "Poor commit message quality"][message_level]
+        if reason:
+            reasons.append(reason)
+        
+        trend = git.commit_frequency_trend
+        if trend == 'active':
+            reasons.append("Recently active development")
+        elif trend == 'inactive':
+            reasons.append("Low recent activity")
+        
+        if style_level == 0:
+            reasons.append("Incremental development approach")
+        elif style_level == 2:
+            reasons.append("Many large commits")
+        elif style_level == 3:
+            reasons.append("Commit sizes unavailable for this clone")
+        reasons.append(f"Uses branches ({git.total_branches})" if branching else "Single branch development")
+        
+        signals = {
+            'commit_count': ['high', 'moderate', 'low', 'very_low'][count_level],
+            'message_quality': ['excellent', 'good', 'moderate', 'poor'][message_level],
+            'activity': trend if trend in ('active', 'moderate', 'inactive') else 'unknown',
+            'commit_style': ['incremental', 'mixed', 'large_commits', 'unknown'][style_level],
+            'branching': bool(branching)
+        }
+        return "Git Practices", None, signals, "; ".join(reasons)
+    
+    def _readiness_details(self, analysis: AnalysisResult, levels: tuple, row: int):
+        maturity = analysis.maturity_metrics
+        has_gitignore = bool(analysis.file_structure.key_files_present.get('gitignore', False))
+        feature_level, error_level = (level[row] for level in levels)
+        feature_count = sum(1 for v in maturity.real_world_features.values() if v)
+        reasons = []
+        
+        reasons.append(
+            f"Package manager configured ({', '.join(maturity.package_managers)})" if maturity.has_package_manager
+            else "No package manager detected"
+        )
+        if not has_gitignore:
+            reasons.append("Missing .gitignore")
+        reasons.append("Configuration examples provided" if maturity.has_config_example else "No config examples")
+        reason = [f"Production features detected ({feature_count})", "Some production features", None,
+                  "Few production features"][feature_level]
+        if reason:
+            reasons.append(reason)
+        reason = ["Strong error handling", None, None, "No error handling detected"][error_level]
+        if reason:
+            reasons.append(reason)
+        if maturity.has_deployment_config:
+            reasons.append("Deployment configuration present")
+        
+        signals = {
+            'package_manager': bool(maturity.has_package_manager),
+            'gitignore': has_gitignore,
+            'config_example': bool(maturity.has_config_example),
+            'features': ['production_ready', 'intermediate', 'basic', 'minimal'][feature_level],
+            'error_handling': ['excellent', 'adequate', 'minimal', 'none'][error_level],
+            'deployment': bool(maturity.has_deployment_config)
+        }
+        return "Real-World Readiness", None, signals, "; ".join(reasons)
\ No newline at end of file
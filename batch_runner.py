@@ -0,0 +1,156 @@
+import time
+from datetime import datetime
+from typing import Dict, List
+from repository_mirror import RepositoryMirror
+from result_store import ResultStore
+from batch_scheduler import CostEstimator, ShortestJobFirstScheduler, latency_summary
+from clone_prefetcher import ClonePrefetcher
+from config import BATCH_SCHEDULING
+
+class BatchRunner:
+    def __init__(self, mirror: RepositoryMirror, store: ResultStore = None, estimator: CostEstimator = None):
+        self.mirror = mirror
+        self.store = store
+        self.estimator = estimator or CostEstimator(store.runtime_history() if store is not None else None)
+        self.stats = {}
+    
+    def _identity(self, repo_url: str, local: bool) -> tuple:
+        if local:
+            from git import Repo
+            from git_metadata import repository_identity
+            
+            owner, repo_name, _ = repository_identity(Repo(repo_url))
+            return owner, repo_name
+        return self.mirror.github_client.parse_repo_url(repo_url)
+    
+    def plan(self, repo_urls: List[str], local: bool = False) -> List[Dict]:
+        jobs = []
+        for index, repo_url in enumerate(repo_urls):
+            job = {'index': index, 'url': repo_url, 'repo_metadata': None, 'estimated_seconds': None}
+            jobs.append(job)
+            
+            try:
+                owner, repo_name = self._identity(repo_url, local)
+            except Exception:
+                continue
+            
+            commit_count = None
+            if not local:
+                try:
+                    job['repo_metadata'] = self.mirror.github_client.get_repository_metadata(owner, repo_name)
+                    if BATCH_SCHEDULING['fetch_commit_counts']:
+                        commit_count = self.mirror.github_client.get_commit_count(owner, repo_name)
+                except Exception:
+                    pass
+            
+            job['estimated_seconds'] = self.estimator.estimate(owner, repo_name, job['repo_metadata'], commit_count)
+        
+        return jobs
+    
+    def _scheduled(self, scheduler: ShortestJobFirstScheduler):
+        while len(scheduler):
+            job, waited = scheduler.pop()
+            yield job, waited, None, 0
+    
+    def run(self, repo_urls: List[str], local: bool = False, schedule: bool = True, prefetch: int = 0,
+            **analyze_options) -> List[Dict]:
+        analyze = self.mirror.analyze_local if local else self.mirror.analyze
+        results = [None] * len(repo_urls)
+        analyses = []
+        runtimes = []
+        turnaround = []
+        service_times = []
+        
+        if schedule:
+            print(f"Estimating cost of {len(repo_urls)} repositories...")
+            jobs = self.plan(repo_urls, local)
+            scheduler = ShortestJobFirstScheduler()
+        else:
+            jobs = [
+                {'index': index, 'url': repo_url, 'repo_metadata': None, 'estimated_seconds': None}
+                for index, repo_url in enumerate(repo_urls)
+            ]
+            scheduler = ShortestJobFirstScheduler()
+        
+        unknown_cost = max([job['estimated_seconds'] or 0 for job in jobs] + [BATCH_SCHEDULING['base_seconds']])
+        for job in jobs:
+            estimated = job['estimated_seconds']
+            scheduler.push(job, unknown_cost if estimated is None else estimated)
+        
+        prefetcher = None
+        if prefetch and not local:
+            prefetcher = ClonePrefetcher(self.mirror, scheduler, depth=prefetch, analyze_options=analyze_options)
+            prefetcher.start()
+        
+        batch_started = time.monotonic()
+        try:
+            for position, (job, waited, prepared, size) in enumerate(prefetcher or self._scheduled(scheduler), 1):
+                repo_url = job['url']
+                estimate = f" (estimated {job['estimated_seconds']:.0f}s)" if job['estimated_seconds'] is not None else ''
+                print(f"\n[{position}/{len(jobs)}] Processing: {repo_url}{estimate}")
+                
+                options = dict(analyze_options)
+                if job['repo_metadata'] is not None:
+                    options['repo_metadata'] = job['repo_metadata']
+                
+                started = time.monotonic()
+                started_at = datetime.utcnow()
+                try:
+                    if isinstance(prepared, Exception):
+                        raise prepared
+                    elif prepared is not None:
+                        try:
+                            analysis = self.mirror.analyze_prepared(prepared)
+                        finally:
+                            prepared.cleanup()
+                            prefetcher.release(size)
+                    else:
+                        analysis = analyze(repo_url, **options)
+                    analyses.append(analysis)
+                    result = {
+                        'url': repo_url,
+                        'analysis': analysis,
+                        'output': self.mirror.generate_output(analysis),
+                        'error': None
+                    }
+                    if analysis.timestamp >= started_at:
+                        clone_seconds = prepared.clone_seconds if prepared is not None else 0.0
+                        runtimes.append((
+                            analysis.repository.owner, analysis.repository.name, started_at.isoformat(),
+                            time.monotonic() - started + clone_seconds, analysis.repository.size_kb
+                        ))
+                except Exception as e:
+                    print(f"\nERROR analyzing {repo_url}: {str(e)}")
+                    result = {
+                        'url': repo_url,
+                        'analysis': None,
+                        'output': None,
+                        'error': str(e)
+                    }
+                
+                finished = time.monotonic()
+                result['estimated_seconds'] = job['estimated_seconds']
+                result['seconds'] = round(finished - started, 2)
+                result['waited_seconds'] = round(waited, 2)
+                results[job['index']] = result
+                service_times.append(finished - started)
+                turnaround.append(finished - batch_started)
+        finally:
+            if prefetcher is not None:
+                prefetcher.stop()
+        
+        if self.store is not None:
+            if analyses:
+                self.store.add_many(analyses)
+            if runtimes:
+                self.store.record_runtimes(runtimes)
+        
+        self.stats = {
+            'repositories': len(jobs),
+            'wall_seconds': round(time.monotonic() - batch_started, 2),
+            'turnaround': latency_summary(turnaround),
+            'runtime': latency_summary(service_times)
+        }
+        if prefetcher is not None:
+            self.stats['prefetch'] = prefetcher.summary()
+        return results
\ No newline at end of file
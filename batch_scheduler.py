@@ -0,0 +1,68 @@
+import math
+import time
+import heapq
+import itertools
+from typing import Dict, List, Optional, Sequence
+from models import RepositoryMetadata
+from config import BATCH_SCHEDULING
+
+def percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+def latency_summary(values: Sequence[float], percentiles: Sequence[int] = BATCH_SCHEDULING['latency_percentiles']) -> Dict[str, float]:
+    summary = {f"p{q}": round(percentile(values, q), 2) for q in percentiles}
+    summary['max'] = round(max(values), 2) if values else 0.0
+    summary['mean'] = round(sum(values) / len(values), 2) if values else 0.0
+    return summary
+
+class CostEstimator:
+    def __init__(self, runtime_history: Dict[tuple, List[float]] = None, settings: dict = None):
+        self.runtime_history = runtime_history or {}
+        self.settings = dict(BATCH_SCHEDULING, **(settings or {}))
+    
+    def _past_runtime(self, owner: str, name: str) -> Optional[float]:
+        runs = self.runtime_history.get((owner.lower(), name.lower()))
+        if not runs:
+            return None
+        
+        weight = self.settings['history_weight']
+        estimate = runs[0]
+        for seconds in runs[1:]:
+            estimate = weight * seconds + (1 - weight) * estimate
+        return estimate
+    
+    def estimate(self, owner: str, name: str, repo_metadata: RepositoryMetadata = None,
+                 commit_count: int = None) -> float:
+        past = self._past_runtime(owner, name)
+        if past is not None:
+            return past
+        
+        cost = self.settings['base_seconds']
+        if repo_metadata is not None and repo_metadata.size_kb is not None:
+            cost += repo_metadata.size_kb / 1024 * self.settings['seconds_per_mb']
+        if commit_count:
+            cost += commit_count * self.settings['seconds_per_commit']
+        return cost
+
+class ShortestJobFirstScheduler:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.heap = []
+        self.sequence = itertools.count()
+    
+    def push(self, job, estimated_cost: float):
+        heapq.heappush(self.heap, (estimated_cost, next(self.sequence), self.clock(), job))
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def pop(self):
+        if not self.heap:
+            raise IndexError("pop from an empty scheduler")
+        
+        _, _, enqueued_at, job = heapq.heappop(self.heap)
+        return job, self.clock() - enqueued_at
\ No newline at end of file
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import CODE_EXTENSIONS, EXCLUDED_DIRS
+from fast_complexity import FastComplexityEstimator, LANGUAGE_CONDITIONS
+
+def source_files(path: str, language: str, limit: int) -> list:
+    extensions = tuple(CODE_EXTENSIONS[language])
+    found = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        found.extend(os.path.join(root, name) for name in files if name.endswith(extensions))
+    return sorted(found)[:limit] if limit else sorted(found)
+
+def mean(values: list) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the fast complexity estimator with lizard')
+    parser.add_argument('path', help='Directory to scan for source files')
+    parser.add_argument('--language', required=True, choices=sorted(LANGUAGE_CONDITIONS),
+                        help='Language to benchmark')
+    parser.add_argument('--limit', type=int, default=0, help='Analyze at most this many files')
+    args = parser.parse_args()
+    
+    import lizard
+    
+    paths = source_files(args.path, args.language, args.limit)
+    contents = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            contents[path] = f.read()
+    
+    started = time.perf_counter()
+    lizard_results = {path: lizard.analyze_file.analyze_source_code(path, content) for path, content in contents.items()}
+    lizard_seconds = time.perf_counter() - started
+    
+    estimator = FastComplexityEstimator()
+    started = time.perf_counter()
+    fast_results = {path: estimator.analyze(content, args.language) for path, content in contents.items()}
+    fast_seconds = time.perf_counter() - started
+    
+    lizard_functions = fast_functions = matched = same_complexity = same_length = 0
+    complexity_error = 0
+    file_average_error = []
+    for path in paths:
+        functions = lizard_results[path].function_list
+        estimate = fast_results[path]
+        lizard_functions += len(functions)
+        fast_functions += len(estimate['complexities'])
+        
+        by_line = {func.start_line: func for func in functions}
+        for line, complexity, length in zip(estimate['function_lines'], estimate['complexities'],
+                                            estimate['function_lengths']):
+            func = by_line.get(line)
+            if func is None:
+                continue
+            matched += 1
+            same_complexity += func.cyclomatic_complexity == complexity
+            same_length += func.length == length
+            complexity_error += abs(func.cyclomatic_complexity - complexity)
+        
+        if functions and estimate['complexities']:
+            file_average_error.append(abs(
+                mean([func.cyclomatic_complexity for func in functions]) - mean(estimate['complexities'])
+            ))
+    
+    print(f"files:              {len(paths)}")
+    print(f"lizard:             {lizard_seconds:.2f}s")
+    print(f"fast:               {fast_seconds:.2f}s  ({lizard_seconds / fast_seconds if fast_seconds else 0:.1f}x)")
+    print(f"functions:          lizard {lizard_functions}, fast {fast_functions}, matched by start line {matched}")
+    if matched:
+        print(f"same complexity:    {same_complexity / matched:.1%}  (mean abs difference {complexity_error / matched:.3f})")
+        print(f"same length:        {same_length / matched:.1%}")
+    print(f"file average error: {mean(file_average_error):.3f} (mean abs difference of per-file average complexity)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
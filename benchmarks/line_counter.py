@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from code_analyzer import CodeAnalyzer
+from line_counter import count_file_lines
+
+CHUNK_SIZES = (1, 3, 7, 4096)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Check the chunked line counter against count_lines and compare time and peak memory'
+    )
+    parser.add_argument('path', help='Directory whose code files are compared')
+    parser.add_argument('--limit', type=int, default=0, help='Compare at most this many files')
+    args = parser.parse_args()
+    
+    analyzer = CodeAnalyzer(args.path)
+    paths = [str(path) for path in sorted(analyzer.collect_files())]
+    if args.limit:
+        paths = paths[:args.limit]
+    
+    tracemalloc.start()
+    started = time.perf_counter()
+    expected = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            expected[path] = analyzer.count_lines(f.read())
+    memory_seconds = time.perf_counter() - started
+    memory_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    started = time.perf_counter()
+    streamed = {path: count_file_lines(path) for path in paths}
+    stream_seconds = time.perf_counter() - started
+    stream_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    
+    mismatches = [path for path in paths if streamed[path] != expected[path]]
+    for chunk_bytes in CHUNK_SIZES:
+        mismatches.extend(path for path in paths if count_file_lines(path, chunk_bytes) != expected[path])
+    
+    print(f"files:       {len(paths)}")
+    print(f"in memory:   {memory_seconds:.2f}s  peak {memory_peak / 1024 / 1024:.1f} MB")
+    print(f"streaming:   {stream_seconds:.2f}s  peak {stream_peak / 1024 / 1024:.1f} MB")
+    print(f"mismatches:  {len(mismatches)} (default chunk and {', '.join(map(str, CHUNK_SIZES))} byte chunks)")
+    for path in sorted(set(mismatches))[:10]:
+        print(f"  {path}")
+    return 1 if mismatches else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
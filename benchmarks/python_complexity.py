@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from config import EXCLUDED_DIRS
+from code_analyzer import CodeAnalyzer
+from python_ast_analyzer import PythonAstAnalyzer
+
+def python_files(path: str, limit: int) -> list:
+    found = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        found.extend(os.path.join(root, name) for name in files if name.endswith('.py'))
+    return sorted(found)[:limit] if limit else sorted(found)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare the AST analyzer with lizard and count_lines on Python files'
+    )
+    parser.add_argument('path', help='Directory to scan for .py files')
+    parser.add_argument('--limit', type=int, default=0, help='Analyze at most this many files')
+    args = parser.parse_args()
+    
+    import lizard
+    
+    paths = python_files(args.path, args.limit)
+    contents = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            contents[path] = f.read()
+    
+    line_counter = CodeAnalyzer(args.path)
+    started = time.perf_counter()
+    lizard_results = {}
+    for path, content in contents.items():
+        line_counter.count_lines(content)
+        lizard_results[path] = lizard.analyze_file.analyze_source_code(path, content)
+    lizard_seconds = time.perf_counter() - started
+    
+    analyzer = PythonAstAnalyzer(cache_entries=0)
+    started = time.perf_counter()
+    ast_results = {path: analyzer.analyze(content) for path, content in contents.items()}
+    ast_seconds = time.perf_counter() - started
+    
+    cached = PythonAstAnalyzer()
+    PythonAstAnalyzer.clear_cache()
+    for content in contents.values():
+        cached.analyze(content)
+    started = time.perf_counter()
+    for content in contents.values():
+        cached.analyze(content)
+    cached_seconds = time.perf_counter() - started
+    
+    parsed = matched = same_complexity = same_length = 0
+    lizard_functions = ast_functions = 0
+    complexity_error = 0
+    for path in paths:
+        result = ast_results[path]
+        if result is None:
+            continue
+        parsed += 1
+        
+        by_line = {func.start_line: func for func in lizard_results[path].function_list}
+        lizard_functions += len(by_line)
+        ast_functions += len(result['function_lines'])
+        for line, complexity, length in zip(result['function_lines'], result['complexities'], result['function_lengths']):
+            func = by_line.get(line)
+            if func is None:
+                continue
+            matched += 1
+            same_complexity += func.cyclomatic_complexity == complexity
+            same_length += func.length == length
+            complexity_error += abs(func.cyclomatic_complexity - complexity)
+    
+    print(f"files:            {len(paths)} ({parsed} parsed by ast)")
+    print(f"lizard + lines:   {lizard_seconds:.2f}s  ({len(paths) / lizard_seconds if lizard_seconds else 0:.0f} files/s)")
+    print(f"ast:              {ast_seconds:.2f}s  ({len(paths) / ast_seconds if ast_seconds else 0:.0f} files/s, "
+          f"{lizard_seconds / ast_seconds if ast_seconds else 0:.1f}x)")
+    print(f"ast (cached):     {cached_seconds:.3f}s")
+    print(f"functions:        lizard {lizard_functions}, ast {ast_functions}, matched by start line {matched}")
+    if matched:
+        print(f"same complexity:  {same_complexity / matched:.1%}  (mean abs difference {complexity_error / matched:.3f})")
+        print(f"same length:      {same_length / matched:.1%}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ('github', 'git', 'lizard', 'numpy', 'pyarrow')
+
+def import_profile(module: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    
+    profile = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        if cumulative_us.strip().isdigit():
+            profile[name.strip()] = int(cumulative_us)
+    return profile
+
+def wall_time(args: list) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable] + args, cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure cold-start import time of the CLI')
+    parser.add_argument('--runs', type=int, default=5, help='Number of cold starts to measure (default: 5)')
+    parser.add_argument('--module', default='main', help='Module to import (default: main)')
+    parser.add_argument('--max-ms', type=float, default=None, help='Exit non-zero if the median import exceeds this')
+    args = parser.parse_args()
+    
+    import_ms = []
+    heavy = set()
+    for _ in range(args.runs):
+        profile = import_profile(args.module)
+        import_ms.append(profile.get(args.module, 0) / 1000)
+        heavy.update(name for name in profile if name in HEAVY_MODULES)
+    
+    help_ms = [wall_time(['main.py', '--help']) * 1000 for _ in range(args.runs)]
+    median_import = statistics.median(import_ms)
+    
+    print(f"import {args.module}:  median {median_import:.1f} ms  (min {min(import_ms):.1f}, max {max(import_ms):.1f})")
+    print(f"main.py --help:  median {statistics.median(help_ms):.1f} ms  (min {min(help_ms):.1f}, max {max(help_ms):.1f})")
+    print(f"heavy modules loaded at startup: {', '.join(sorted(heavy)) or 'none'}")
+    
+    if args.max_ms is not None and median_import > args.max_ms:
+        print(f"FAIL: median import {median_import:.1f} ms exceeds {args.max_ms:.1f} ms")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
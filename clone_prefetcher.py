@@ -0,0 +1,122 @@
+import time
+import queue
+import threading
+from typing import Iterator, Tuple
+from repository_mirror import RepositoryMirror
+from batch_scheduler import ShortestJobFirstScheduler
+from repo_cloner import directory_size
+from config import PREFETCH
+
+class ClonePrefetcher:
+    def __init__(self, mirror: RepositoryMirror, scheduler: ShortestJobFirstScheduler,
+                 depth: int = PREFETCH['depth'], disk_budget_mb: int = PREFETCH['disk_budget_mb'],
+                 analyze_options: dict = None):
+        self.mirror = mirror
+        self.scheduler = scheduler
+        self.depth = depth
+        self.disk_budget = disk_budget_mb * 1024 * 1024 if disk_budget_mb else None
+        self.analyze_options = analyze_options or {}
+        self.ready = queue.Queue(maxsize=depth)
+        self.held_bytes = 0
+        self.disk_available = threading.Condition()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stats = {
+            'clones': 0,
+            'prefetch_blocked_seconds': 0.0,
+            'analyzer_idle_seconds': 0.0,
+            'occupancy_samples': []
+        }
+    
+    def start(self):
+        self.thread = threading.Thread(target=self._prefetch, name='clone-prefetch', daemon=True)
+        self.thread.start()
+    
+    def _wait_for_disk(self):
+        if self.disk_budget is None:
+            return
+        
+        with self.disk_available:
+            while self.held_bytes >= self.disk_budget and not self.stop_event.is_set():
+                self.disk_available.wait(PREFETCH['poll_interval'])
+    
+    def _prefetch(self):
+        while len(self.scheduler) and not self.stop_event.is_set():
+            job, waited = self.scheduler.pop()
+            
+            blocked_since = time.monotonic()
+            self._wait_for_disk()
+            self.stats['prefetch_blocked_seconds'] += time.monotonic() - blocked_since
+            
+            options = dict(self.analyze_options)
+            if job.get('repo_metadata') is not None:
+                options['repo_metadata'] = job['repo_metadata']
+            
+            size = 0
+            try:
+                prepared = self.mirror.prepare(job['url'], **options)
+                if prepared.cloner is not None:
+                    size = directory_size(prepared.cloner.get_repo_path())
+                    self.stats['clones'] += 1
+            except Exception as e:
+                prepared = e
+            
+            with self.disk_available:
+                self.held_bytes += size
+            
+            blocked_since = time.monotonic()
+            self._put((job, waited, prepared, size))
+            self.stats['prefetch_blocked_seconds'] += time.monotonic() - blocked_since
+        
+        self._put(None)
+    
+    def _put(self, item):
+        while not self.stop_event.is_set():
+            try:
+                self.ready.put(item, timeout=PREFETCH['poll_interval'])
+                return
+            except queue.Full:
+                continue
+        
+        if item is not None and not isinstance(item[2], Exception):
+            item[2].cleanup()
+    
+    def release(self, size: int):
+        with self.disk_available:
+            self.held_bytes -= size
+            self.disk_available.notify_all()
+    
+    def __iter__(self) -> Iterator[Tuple]:
+        while True:
+            self.stats['occupancy_samples'].append(self.ready.qsize())
+            idle_since = time.monotonic()
+            item = self.ready.get()
+            self.stats['analyzer_idle_seconds'] += time.monotonic() - idle_since
+            
+            if item is None:
+                return
+            yield item
+    
+    def stop(self):
+        self.stop_event.set()
+        while True:
+            try:
+                item = self.ready.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and not isinstance(item[2], Exception):
+                item[2].cleanup()
+        
+        if self.thread is not None:
+            self.thread.join()
+    
+    def summary(self) -> dict:
+        samples = self.stats['occupancy_samples']
+        return {
+            'depth': self.depth,
+            'clones': self.stats['clones'],
+            'mean_queue_occupancy': round(sum(samples) / len(samples), 2) if samples else 0.0,
+            'empty_queue_ratio': round(sum(1 for sample in samples if sample == 0) / len(samples), 2) if samples else 0.0,
+            'analyzer_idle_seconds': round(self.stats['analyzer_idle_seconds'], 2),
+            'prefetch_blocked_seconds': round(self.stats['prefetch_blocked_seconds'], 2)
+        }
\ No newline at end of file
@@ -2,20 +2,99 @@ import os
 import re
 from pathlib import Path
 from collections import defaultdict
-from typing import Dict, List
-from models import CodeMetrics
-from config import CODE_EXTENSIONS, EXCLUDED_DIRS
-import lizard
+from typing import Dict, Iterable, Iterator, List, Optional
+from models import CodeMetrics, FileMetrics
+from config import CODE_EXTENSIONS, EXCLUDED_DIRS, PYTHON_AST, FAST_COMPLEXITY, LARGE_FILES
+from file_sampler import FileSampler
+from language_stats import language_key, is_vendored
+from python_ast_analyzer import PythonAstAnalyzer
+from fast_complexity import FastComplexityEstimator
+from line_counter import count_file_lines
+from worker_pool import WorkerPool, WorkerDied
+from rollup_tree import DirectoryTree
+
+COMMENT_LINE_PATTERN = re.compile(r'^\s*(?:#|//|/\*|\*|"""' + r"|''')")
+
+SAMPLED_TOTALS = {
+    'total_lines': 'total',
+    'code_lines': 'code',
+    'comment_lines': 'comment',
+    'blank_lines': 'blank',
+    'functions_count': 'functions',
+    'classes_count': 'classes'
+}
+
+def count_line_kinds(lines: Iterable[str]) -> Dict[str, int]:
+    total = 0
+    blank = 0
+    comment = 0
+    in_block_comment = False
+    
+    for line in lines:
+        total += 1
+        stripped = line.strip()
+        if not stripped:
+            blank += 1
+        
+        if '"""' in stripped or "'''" in stripped:
+            in_block_comment = not in_block_comment
+            comment += 1
+            continue
+        
+        if in_block_comment:
+            comment += 1
+            continue
+        
+        if COMMENT_LINE_PATTERN.match(line):
+            comment += 1
+    
+    code = total - blank - comment
+    
+    return {
+        'total': total,
+        'code': max(0, code),
+        'comment': comment,
+        'blank': blank
+    }
+
+def analyze_file_batch(repo_path: str, primary_language: str, languages: List[str], paths: List[str]) -> List[Optional[tuple]]:
+    analyzer = CodeAnalyzer(repo_path, primary_language, languages=languages)
+    return [analyzer.analyze_file(Path(path)) for path in paths]
 
 class CodeAnalyzer:
-    def __init__(self, repo_path: str, primary_language: str = None):
+    def __init__(self, repo_path: str, primary_language: str = None, sampler: FileSampler = None,
+                 record_files: bool = False, languages: List[str] = None, worker_pool: WorkerPool = None,
+                 directory_tree: DirectoryTree = None):
         self.repo_path = Path(repo_path)
-        self.primary_language = primary_language
+        self.primary_language = language_key(primary_language)
+        self.languages = languages or []
+        self.sampler = sampler
+        self.record_files = record_files
+        self.worker_pool = worker_pool
+        self.directory_tree = directory_tree
+        self.file_metrics = []
+        self.complete = True
+        self.python_analyzer = PythonAstAnalyzer() if PYTHON_AST['enabled'] else None
+        self.fast_estimator = FastComplexityEstimator()
         self.code_extensions = self._get_relevant_extensions()
     
+    def language_of(self, path: Path) -> str:
+        for language in [self.primary_language] + self.languages:
+            if path.suffix in CODE_EXTENSIONS.get(language, []):
+                return language
+        
+        for language, exts in CODE_EXTENSIONS.items():
+            if path.suffix in exts:
+                return language
+        return 'unknown'
+    
     def _get_relevant_extensions(self) -> set:
-        if self.primary_language and self.primary_language.lower() in CODE_EXTENSIONS:
-            return set(CODE_EXTENSIONS[self.primary_language.lower()])
+        languages = [language for language in self.languages if language in CODE_EXTENSIONS]
+        if languages:
+            return {ext for language in languages for ext in CODE_EXTENSIONS[language]}
+        
+        if self.primary_language in CODE_EXTENSIONS:
+            return set(CODE_EXTENSIONS[self.primary_language])
         
         all_exts = set()
         for exts in CODE_EXTENSIONS.values():
@@ -23,87 +102,140 @@ class CodeAnalyzer:
         return all_exts
     
     def should_analyze(self, path: Path) -> bool:
-        if any(excluded in path.parts for excluded in EXCLUDED_DIRS):
+        relative = path.relative_to(self.repo_path)
+        if any(excluded in relative.parts for excluded in EXCLUDED_DIRS):
             return False
         
-        return path.suffix in self.code_extensions
+        if path.suffix not in self.code_extensions:
+            return False
+        
+        return not is_vendored(str(relative))
     
     def count_lines(self, content: str) -> Dict[str, int]:
-        lines = content.split('\n')
-        total = len(lines)
-        blank = sum(1 for line in lines if not line.strip())
-        
-        comment_patterns = [
-            r'^\s*#',
-            r'^\s*//',
-            r'^\s*/\*',
-            r'^\s*\*',
-            r'^\s*"""',
-            r"^\s*'''",
-        ]
-        
-        comment = 0
-        in_block_comment = False
-        
-        for line in lines:
-            stripped = line.strip()
-            
-            if '"""' in stripped or "'''" in stripped:
-                in_block_comment = not in_block_comment
-                comment += 1
-                continue
-            
-            if in_block_comment:
-                comment += 1
-                continue
-            
-            for pattern in comment_patterns:
-                if re.match(pattern, line):
-                    comment += 1
-                    break
-        
-        code = total - blank - comment
+        return count_line_kinds(content.split('\n'))
+    
+    def count_lines_streaming(self, file_path: Path) -> Dict[str, int]:
+        return count_file_lines(str(file_path))
+    
+    def summarize_complexity(self, complexities: List[int], function_lengths: List[int]) -> Dict:
+        distribution = defaultdict(int)
+        for cc in complexities:
+            if cc <= 5:
+                distribution['low'] += 1
+            elif cc <= 10:
+                distribution['medium'] += 1
+            elif cc <= 20:
+                distribution['high'] += 1
+            else:
+                distribution['very_high'] += 1
         
         return {
-            'total': total,
-            'code': max(0, code),
-            'comment': comment,
-            'blank': blank
+            'functions': len(complexities),
+            'avg_complexity': sum(complexities) / len(complexities) if complexities else 0,
+            'max_complexity': max(complexities) if complexities else 0,
+            'avg_function_length': sum(function_lengths) / len(function_lengths) if function_lengths else 0,
+            'distribution': dict(distribution)
         }
     
-    def analyze_complexity(self, file_path: Path) -> Dict:
+    def use_fast_complexity(self, language: str, size: int) -> bool:
+        if not self.fast_estimator.supports(language):
+            return False
+        if language in FAST_COMPLEXITY['languages']:
+            return True
+        return bool(FAST_COMPLEXITY['min_bytes']) and size >= FAST_COMPLEXITY['min_bytes']
+    
+    def analyze_complexity(self, file_path: Path, content: str = None) -> Dict:
+        if content is not None:
+            language = self.language_of(file_path)
+            if self.use_fast_complexity(language, len(content)):
+                estimate = self.fast_estimator.analyze(content, language)
+                return self.summarize_complexity(estimate['complexities'], estimate['function_lengths'])
+        
+        import lizard
+        
         try:
             analysis = lizard.analyze_file(str(file_path))
+            return self.summarize_complexity(
+                [func.cyclomatic_complexity for func in analysis.function_list],
+                [func.length for func in analysis.function_list]
+            )
+        except Exception as e:
+            return self.summarize_complexity([], [])
+    
+    def analyze_python(self, content: str) -> Optional[tuple]:
+        parsed = self.python_analyzer.analyze(content)
+        if parsed is None:
+            return None
+        
+        complexity_data = self.summarize_complexity(parsed['complexities'], parsed['function_lengths'])
+        complexity_data['classes'] = parsed['classes']
+        return parsed['line_counts'], complexity_data
+    
+    def analyze_large_file(self, file_path: Path) -> Optional[tuple]:
+        try:
+            return self.count_lines_streaming(file_path), self.summarize_complexity([], [])
+        except Exception as e:
+            return None
+    
+    def analyze_file(self, file_path: Path) -> Optional[tuple]:
+        content = None
+        try:
+            if LARGE_FILES['stream_above_bytes'] and file_path.stat().st_size > LARGE_FILES['stream_above_bytes']:
+                return self.analyze_large_file(file_path)
             
-            complexities = [func.cyclomatic_complexity for func in analysis.function_list]
-            function_lengths = [func.length for func in analysis.function_list]
+            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
             
-            distribution = defaultdict(int)
-            for cc in complexities:
-                if cc <= 5:
-                    distribution['low'] += 1
-                elif cc <= 10:
-                    distribution['medium'] += 1
-                elif cc <= 20:
-                    distribution['high'] += 1
-                else:
-                    distribution['very_high'] += 1
+            parsed = None
+            if self.python_analyzer is not None and file_path.suffix in CODE_EXTENSIONS['python']:
+                parsed = self.analyze_python(content)
             
-            return {
-                'functions': len(analysis.function_list),
-                'avg_complexity': sum(complexities) / len(complexities) if complexities else 0,
-                'max_complexity': max(complexities) if complexities else 0,
-                'avg_function_length': sum(function_lengths) / len(function_lengths) if function_lengths else 0,
-                'distribution': dict(distribution)
-            }
+            if parsed is not None:
+                return parsed
+            return self.count_lines(content), self.analyze_complexity(file_path, content)
+        except MemoryError:
+            content = None
+            return self.analyze_large_file(file_path)
         except Exception as e:
-            return {
-                'functions': 0,
-                'avg_complexity': 0,
-                'max_complexity': 0,
-                'avg_function_length': 0,
-                'distribution': {}
-            }
+            return None
+    
+    def _worker_lost(self, error: WorkerDied, files: int):
+        print(f"  Warning: {error}; {files} files skipped")
+        self.complete = False
+    
+    def _file_results(self, file_paths: List[Path]) -> Iterator[Optional[tuple]]:
+        if self.worker_pool is None:
+            for file_path in file_paths:
+                if self.sampler and self.sampler.expired():
+                    return
+                yield self.analyze_file(file_path)
+            return
+        
+        results = self.worker_pool.imap_chunked(
+            analyze_file_batch, [str(path) for path in file_paths],
+            args=(str(self.repo_path), self.primary_language, self.languages), on_lost=self._worker_lost
+        )
+        try:
+            for analyzed in results:
+                if self.sampler and self.sampler.expired():
+                    return
+                yield analyzed
+        finally:
+            results.close()
+    
+    def collect_files(self) -> List[Path]:
+        file_paths = []
+        
+        for root, dirs, files in os.walk(self.repo_path):
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+            
+            for file in files:
+                file_path = Path(root) / file
+                
+                if self.should_analyze(file_path):
+                    file_paths.append(file_path)
+        
+        return file_paths
     
     def analyze(self) -> CodeMetrics:
         total_lines = 0
@@ -115,53 +247,105 @@ class CodeAnalyzer:
         all_complexities = []
         all_function_lengths = []
         total_functions = 0
+        total_classes = 0
         complexity_dist = defaultdict(int)
         
         file_lengths = []
+        observations = defaultdict(list)
         
-        for root, dirs, files in os.walk(self.repo_path):
-            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+        file_paths = self.collect_files()
+        if self.sampler:
+            selected = self.sampler.select([str(p) for p in file_paths], str(self.repo_path))
+            file_paths = [Path(p) for p in selected]
+        
+        for file_path, analyzed in zip(file_paths, self._file_results(file_paths)):
+            if self.sampler and self.sampler.expired():
+                break
             
-            for file in files:
-                file_path = Path(root) / file
+            if analyzed is None:
+                continue
+            
+            try:
+                line_counts, complexity_data = analyzed
+                
+                total_lines += line_counts['total']
+                code_lines += line_counts['code']
+                comment_lines += line_counts['comment']
+                blank_lines += line_counts['blank']
+                
+                file_lengths.append(line_counts['total'])
+                
+                total_functions += complexity_data['functions']
+                total_classes += complexity_data.get('classes', 0)
+                
+                if complexity_data['avg_complexity'] > 0:
+                    all_complexities.append(complexity_data['avg_complexity'])
                 
-                if not self.should_analyze(file_path):
-                    continue
+                if complexity_data['avg_function_length'] > 0:
+                    all_function_lengths.append(complexity_data['avg_function_length'])
                 
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    line_counts = self.count_lines(content)
-                    total_lines += line_counts['total']
-                    code_lines += line_counts['code']
-                    comment_lines += line_counts['comment']
-                    blank_lines += line_counts['blank']
-                    
-                    file_lengths.append(line_counts['total'])
-                    
-                    complexity_data = self.analyze_complexity(file_path)
-                    total_functions += complexity_data['functions']
-                    
-                    if complexity_data['avg_complexity'] > 0:
-                        all_complexities.append(complexity_data['avg_complexity'])
-                    
-                    if complexity_data['avg_function_length'] > 0:
-                        all_function_lengths.append(complexity_data['avg_function_length'])
-                    
-                    for key, value in complexity_data['distribution'].items():
-                        complexity_dist[key] += value
-                    
-                    files_analyzed += 1
+                for key, value in complexity_data['distribution'].items():
+                    complexity_dist[key] += value
                 
-                except Exception as e:
-                    continue
+                if self.record_files:
+                    self.file_metrics.append(FileMetrics(
+                        path=file_path.relative_to(self.repo_path).as_posix(),
+                        language=self.language_of(file_path),
+                        total_lines=line_counts['total'],
+                        code_lines=line_counts['code'],
+                        comment_lines=line_counts['comment'],
+                        blank_lines=line_counts['blank'],
+                        functions=complexity_data['functions'],
+                        avg_complexity=round(complexity_data['avg_complexity'], 2),
+                        max_complexity=complexity_data['max_complexity']
+                    ))
+                
+                if self.directory_tree is not None:
+                    self.directory_tree.add_metrics(
+                        self.directory_tree.directory(file_path.parent.relative_to(self.repo_path).as_posix()),
+                        lines=line_counts['total'],
+                        code_lines=line_counts['code'],
+                        functions=complexity_data['functions'],
+                        complexity=int(round(complexity_data['avg_complexity'] * complexity_data['functions'])),
+                        max_complexity=complexity_data['max_complexity']
+                    )
+                
+                if self.sampler:
+                    relative = str(file_path.relative_to(self.repo_path))
+                    observations[self.sampler.stratum_key(relative)].append(
+                        dict(line_counts, functions=complexity_data['functions'],
+                             classes=complexity_data.get('classes', 0))
+                    )
+                
+                files_analyzed += 1
+            
+            except Exception as e:
+                continue
         
         avg_file_length = sum(file_lengths) / len(file_lengths) if file_lengths else 0
         avg_function_length = sum(all_function_lengths) / len(all_function_lengths) if all_function_lengths else 0
         avg_complexity = sum(all_complexities) / len(all_complexities) if all_complexities else 0
         max_complexity = max(all_complexities) if all_complexities else 0
         
+        sampling = None
+        if self.sampler:
+            estimates = self.sampler.extrapolate(observations, list(SAMPLED_TOTALS.values()))
+            total_lines = int(round(estimates['total']['estimate']))
+            code_lines = int(round(estimates['code']['estimate']))
+            comment_lines = int(round(estimates['comment']['estimate']))
+            blank_lines = int(round(estimates['blank']['estimate']))
+            total_functions = int(round(estimates['functions']['estimate']))
+            total_classes = int(round(estimates['classes']['estimate']))
+            
+            sampling = self.sampler.describe(files_analyzed)
+            population = sampling['population']
+            avg_file_length = total_lines / population if population else 0
+            sampling['sampling_error'] = round(estimates['total']['relative_error'], 4)
+            sampling['confidence_intervals'] = {
+                field_name: [int(estimates[key]['low']), int(round(estimates[key]['high']))]
+                for field_name, key in SAMPLED_TOTALS.items()
+            }
+        
         comment_ratio = comment_lines / code_lines if code_lines > 0 else 0
         
         return CodeMetrics(
@@ -174,8 +358,9 @@ class CodeAnalyzer:
             comment_ratio=round(comment_ratio, 3),
             files_analyzed=files_analyzed,
             functions_count=total_functions,
-            classes_count=0,
+            classes_count=total_classes,
             avg_complexity=round(avg_complexity, 2),
             max_complexity=int(max_complexity),
-            complexity_distribution=dict(complexity_dist)
+            complexity_distribution=dict(complexity_dist),
+            sampling=sampling
         )
\ No newline at end of file
@@ -0,0 +1,184 @@
+from typing import Dict, List, Sequence
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from models import AnalysisResult, dimension_key
+from config import SCORING_WEIGHTS, COLUMNAR_EXPORT
+
+FORMATS = ('parquet', 'arrow')
+
+MAGIC_BYTES = {b'PAR1': 'parquet', b'ARROW1': 'arrow'}
+
+def _dimension_fields() -> List[pa.Field]:
+    fields = []
+    for key in SCORING_WEIGHTS:
+        fields.extend([
+            pa.field(f"{key}_score", pa.float64()),
+            pa.field(f"{key}_percentage", pa.float64()),
+            pa.field(f"{key}_weighted_score", pa.float64())
+        ])
+    return fields
+
+RESULT_SCHEMA = pa.schema([
+    pa.field('owner', pa.string()),
+    pa.field('name', pa.string()),
+    pa.field('package', pa.string()),
+    pa.field('commit_sha', pa.string()),
+    pa.field('analyzed_at', pa.timestamp('us')),
+    pa.field('primary_language', pa.string()),
+    pa.field('stars', pa.int64()),
+    pa.field('size_kb', pa.int64()),
+    pa.field('score', pa.float64()),
+    pa.field('tier', pa.dictionary(pa.int8(), pa.string())),
+    pa.field('confidence', pa.dictionary(pa.int8(), pa.string())),
+    pa.field('partial', pa.bool_()),
+    pa.field('total_files', pa.int64()),
+    pa.field('total_code_files', pa.int64()),
+    pa.field('total_lines', pa.int64()),
+    pa.field('code_lines', pa.int64()),
+    pa.field('comment_ratio', pa.float64()),
+    pa.field('functions_count', pa.int64()),
+    pa.field('avg_complexity', pa.float64()),
+    pa.field('max_complexity', pa.int64()),
+    pa.field('total_commits', pa.int64()),
+    pa.field('unique_authors', pa.int64()),
+    pa.field('test_files_count', pa.int64()),
+    pa.field('test_to_code_ratio', pa.float64()),
+    pa.field('has_ci_cd', pa.bool_())
+] + _dimension_fields())
+
+FILE_SCHEMA = pa.schema([
+    pa.field('owner', pa.string()),
+    pa.field('name', pa.string()),
+    pa.field('package', pa.string()),
+    pa.field('commit_sha', pa.string()),
+    pa.field('path', pa.string()),
+    pa.field('language', pa.dictionary(pa.int16(), pa.string())),
+    pa.field('total_lines', pa.int64()),
+    pa.field('code_lines', pa.int64()),
+    pa.field('comment_lines', pa.int64()),
+    pa.field('blank_lines', pa.int64()),
+    pa.field('functions', pa.int64()),
+    pa.field('avg_complexity', pa.float64()),
+    pa.field('max_complexity', pa.int64())
+])
+
+def result_row(analysis: AnalysisResult) -> Dict:
+    row = {
+        'owner': analysis.repository.owner,
+        'name': analysis.repository.name,
+        'package': analysis.package_path,
+        'commit_sha': analysis.commit_sha,
+        'analyzed_at': analysis.timestamp,
+        'primary_language': analysis.repository.primary_language,
+        'stars': analysis.repository.stars,
+        'size_kb': analysis.repository.size_kb,
+        'score': analysis.overall_score,
+        'tier': analysis.tier,
+        'confidence': analysis.confidence,
+        'partial': analysis.partial,
+        'total_files': analysis.file_structure.total_files,
+        'total_code_files': analysis.file_structure.total_code_files,
+        'total_lines': analysis.code_metrics.total_lines,
+        'code_lines': analysis.code_metrics.code_lines,
+        'comment_ratio': analysis.code_metrics.comment_ratio,
+        'functions_count': analysis.code_metrics.functions_count,
+        'avg_complexity': analysis.code_metrics.avg_complexity,
+        'max_complexity': analysis.code_metrics.max_complexity,
+        'total_commits': analysis.git_metrics.total_commits,
+        'unique_authors': analysis.git_metrics.unique_authors,
+        'test_files_count': analysis.testing_metrics.test_files_count,
+        'test_to_code_ratio': analysis.testing_metrics.test_to_code_ratio,
+        'has_ci_cd': analysis.testing_metrics.has_ci_cd
+    }
+    
+    for dim in analysis.dimension_scores:
+        key = dimension_key(dim.name)
+        row[f"{key}_score"] = dim.score
+        row[f"{key}_percentage"] = dim.percentage
+        row[f"{key}_weighted_score"] = dim.weighted_score
+    
+    return row
+
+def results_table(analyses: Sequence[AnalysisResult]) -> pa.Table:
+    return pa.Table.from_pylist([result_row(analysis) for analysis in analyses], schema=RESULT_SCHEMA)
+
+def file_metrics_table(analyses: Sequence[AnalysisResult]) -> pa.Table:
+    rows = [
+        {
+            'owner': analysis.repository.owner,
+            'name': analysis.repository.name,
+            'package': analysis.package_path,
+            'commit_sha': analysis.commit_sha,
+            'path': item.path,
+            'language': item.language,
+            'total_lines': item.total_lines,
+            'code_lines': item.code_lines,
+            'comment_lines': item.comment_lines,
+            'blank_lines': item.blank_lines,
+            'functions': item.functions,
+            'avg_complexity': item.avg_complexity,
+            'max_complexity': item.max_complexity
+        }
+        for analysis in analyses
+        for item in analysis.file_metrics
+    ]
+    return pa.Table.from_pylist(rows, schema=FILE_SCHEMA)
+
+def write_table(table: pa.Table, path: str, format: str = 'parquet'):
+    if format == 'parquet':
+        pq.write_table(
+            table, path,
+            compression=COLUMNAR_EXPORT['parquet_compression'],
+            row_group_size=COLUMNAR_EXPORT['row_group_size']
+        )
+    elif format == 'arrow':
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=COLUMNAR_EXPORT['row_group_size'])
+    else:
+        raise Exception(f"Unsupported export format: {format}")
+
+def export_results(analyses: Sequence[AnalysisResult], path: str, format: str = 'parquet',
+                   file_metrics_path: str = None) -> Dict[str, int]:
+    results = results_table(analyses)
+    write_table(results, path, format)
+    written = {'results': results.num_rows}
+    
+    if file_metrics_path:
+        files = file_metrics_table(analyses)
+        write_table(files, file_metrics_path, format)
+        written['files'] = files.num_rows
+    
+    return written
+
+def _filter_expression(filters: Dict[str, Sequence]):
+    expression = None
+    for column, values in (filters or {}).items():
+        condition = pc.field(column).isin(list(values))
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def detect_format(path: str) -> str:
+    with open(path, 'rb') as f:
+        header = f.read(max(len(magic) for magic in MAGIC_BYTES))
+    
+    for magic, format in MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return format
+    raise Exception(f"Not a Parquet or Arrow IPC file: {path}")
+
+def read_table(path: str, columns: List[str] = None, filters: Dict[str, Sequence] = None,
+               format: str = None) -> pa.Table:
+    format = format or detect_format(path)
+    expression = _filter_expression(filters)
+    
+    if format == 'parquet':
+        return pq.read_table(path, columns=columns, filters=expression)
+    if format != 'arrow':
+        raise Exception(f"Unsupported export format: {format}")
+    
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    if expression is not None:
+        table = table.filter(expression)
+    return table.select(columns) if columns else table
\ No newline at end of file
@@ -2,6 +2,102 @@ import os
 
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', '')
 
+ANALYZER_VERSION = '1.2.0'
+
+RESULT_CACHE = {
+    'directory': os.getenv('REPO_MIRROR_CACHE_DIR', ''),
+    'max_entries': 500,
+    'memory_entries': 64,
+    'ls_remote_timeout': 30
+}
+
+RESULT_STORE = {
+    'path': os.getenv('REPO_MIRROR_STORE', '')
+}
+
+SERVICE = {
+    'host': '127.0.0.1',
+    'port': 8765,
+    'workers': 4,
+    'max_pending': 16,
+    'ticket_retention': 1000,
+    'max_wait': 60,
+    'retry_after': 5
+}
+
+PYTHON_AST = {
+    'enabled': True,
+    'cache_entries': 20000
+}
+
+FAST_COMPLEXITY = {
+    'languages': [],
+    'min_bytes': 256 * 1024
+}
+
+BATCH_SCHEDULING = {
+    'base_seconds': 5.0,
+    'seconds_per_mb': 0.4,
+    'seconds_per_commit': 0.002,
+    'fetch_commit_counts': True,
+    'history_weight': 0.5,
+    'latency_percentiles': [50, 95, 99]
+}
+
+MIRROR_STORE = {
+    'path': os.getenv('REPO_MIRROR_MIRRORS', ''),
+    'git_timeout': 600,
+    'max_tips': 256
+}
+
+WORKER_POOL = {
+    'workers': 0,
+    'max_tasks_per_worker': 200,
+    'max_memory_mb': 1024,
+    'address_space_mb': 4096,
+    'rss_limit_mb': 2048,
+    'chunk_size': 32,
+    'start_method': 'forkserver',
+    'poll_interval': 0.5,
+    'preload': ['code_analyzer', 'testing_maturity_analyzer', 'git_analyzer', 'lizard', 'git']
+}
+
+LARGE_FILES = {
+    'stream_above_bytes': 16 * 1024 * 1024,
+    'chunk_bytes': 1024 * 1024
+}
+
+MONOREPO = {
+    'max_packages': 200,
+    'parallel_packages': 4,
+    'ignored_dirs': ['test', 'tests', 'testdata', 'fixtures', '__fixtures__', 'node_modules']
+}
+
+PREFETCH = {
+    'depth': 2,
+    'disk_budget_mb': 4096,
+    'poll_interval': 0.5
+}
+
+CLONE_ADMISSION = {
+    'full_max_kb': 250 * 1024,
+    'blobless_max_kb': 1024 * 1024,
+    'shallow_max_kb': 4 * 1024 * 1024,
+    'sparse_max_kb': 16 * 1024 * 1024,
+    'max_estimated_files': 100000,
+    'kb_per_file': 25,
+    'shallow_depth': 1000,
+    'timeout': 900,
+    'max_disk_mb': 8 * 1024,
+    'poll_interval': 0.5,
+    'disk_check_interval': 2.0
+}
+
+COLUMNAR_EXPORT = {
+    'parquet_compression': 'zstd',
+    'row_group_size': 64 * 1024
+}
+
 SCORING_WEIGHTS = {
     'code_quality': 0.30,
     'structure_modularity': 0.20,
@@ -35,6 +131,14 @@ PACKAGE_MANAGERS = {
     'php': ['composer.json', 'composer.lock']
 }
 
+PACKAGE_ROOT_MAX_DEPTH = 3
+
+STRUCTURE_STATS = {
+    'largest_files': 10,
+    'histogram_sub_buckets': 8,
+    'size_quantiles': [0.5, 0.9, 0.99]
+}
+
 LINTER_CONFIGS = {
     'python': ['.pylintrc', 'pylint.rc', '.flake8', 'setup.cfg', 'tox.ini', '.ruff.toml'],
     'javascript': ['.eslintrc', '.eslintrc.js', '.eslintrc.json', '.eslintrc.yml', 'eslint.config.js'],
@@ -57,6 +161,21 @@ REAL_WORLD_INDICATORS = {
     'ci_cd': ['.github/workflows', '.gitlab-ci.yml', '.travis.yml', 'Jenkinsfile', '.circleci']
 }
 
+ERROR_HANDLING_CONSTRUCTS = {
+    'try': r'\btry\b',
+    'catch': r'\bcatch\b',
+    'except': r'\bexcept\b',
+    'finally': r'\bfinally\b',
+    'throw': r'\bthrow\b',
+    'raise': r'\braise\b',
+    'promise_catch': r'\.catch\(',
+    'promise_then': r'\.then\(',
+    'error': r'\bError\b',
+    'exception': r'\bException\b'
+}
+
+ERROR_HANDLING_TIME_BUDGET = 30.0
+
 TIER_THRESHOLDS = {
     'advanced': 80,
     'intermediate': 60,
@@ -64,9 +183,21 @@ TIER_THRESHOLDS = {
 }
 
 CONFIDENCE_THRESHOLDS = {
-    'high': {'min_files': 10, 'min_commits': 5},
-    'medium': {'min_files': 3, 'min_commits': 2},
-    'low': {'min_files': 0, 'min_commits': 0}
+    'high': {'min_files': 10, 'min_commits': 5, 'max_sampling_error': 0.05},
+    'medium': {'min_files': 3, 'min_commits': 2, 'max_sampling_error': 0.15},
+    'low': {'min_files': 0, 'min_commits': 0, 'max_sampling_error': None}
+}
+
+PROGRESSIVE_ANALYSIS = {
+    'initial_sample_files': 200,
+    'sample_growth': 4,
+    'initial_max_commits': 200
+}
+
+SAMPLING_DEFAULTS = {
+    'seed': 0,
+    'confidence_z': 1.96,
+    'confidence_level': 0.95
 }
 
 EXCLUDED_DIRS = [
@@ -99,4 +230,54 @@ CODE_EXTENSIONS = {
     'php': ['.php'],
     'swift': ['.swift'],
     'kotlin': ['.kt', '.kts']
+}
+
+LANGUAGE_FILENAMES = {
+    'Rakefile': 'ruby',
+    'Gemfile': 'ruby',
+    'Guardfile': 'ruby',
+    'Podfile': 'ruby',
+    'Vagrantfile': 'ruby',
+    'SConstruct': 'python',
+    'SConscript': 'python',
+    'wscript': 'python',
+    'Jakefile': 'javascript'
+}
+
+LANGUAGE_INTERPRETERS = {
+    'python': 'python',
+    'python2': 'python',
+    'python3': 'python',
+    'node': 'javascript',
+    'nodejs': 'javascript',
+    'deno': 'typescript',
+    'ts-node': 'typescript',
+    'ruby': 'ruby',
+    'php': 'php',
+    'kotlin': 'kotlin'
+}
+
+LANGUAGE_ALIASES = {
+    'c++': 'cpp',
+    'c#': 'csharp'
+}
+
+VENDORED_PATTERNS = [
+    r'(^|/)(third[-_]?party|3rdparty|external|extern|deps|bower_components|jspm_packages)/',
+    r'(^|/)Pods/',
+    r'\.min\.(js|css)$',
+    r'-min\.js$',
+    r'\.bundle\.js$',
+    r'_pb2(_grpc)?\.py$',
+    r'\.pb(\.gw)?\.go$',
+    r'\.pb\.(cc|h)$',
+    r'\.(generated|g)\.(cs|dart|ts)$',
+    r'(^|/)generated/',
+    r'_generated\.go$',
+    r'\.designer\.cs$'
+]
+
+LANGUAGE_STATS = {
+    'min_share': 0.05,
+    'shebang_read_bytes': 128
 }
\ No newline at end of file
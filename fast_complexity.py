@@ -0,0 +1,166 @@
+import re
+from typing import Dict, Optional
+
+BASE_CONDITIONS = frozenset(['if', 'for', 'while', 'case', 'catch', '&&', '||', '?'])
+
+LANGUAGE_CONDITIONS = {
+    'javascript': BASE_CONDITIONS,
+    'typescript': BASE_CONDITIONS | {'elseif'},
+    'java': BASE_CONDITIONS,
+    'c': BASE_CONDITIONS,
+    'cpp': BASE_CONDITIONS,
+    'csharp': BASE_CONDITIONS | {'??'},
+    'go': BASE_CONDITIONS,
+    'rust': BASE_CONDITIONS | {'match', 'where'},
+    'php': BASE_CONDITIONS | {'elseif'},
+    'swift': BASE_CONDITIONS | {'guard'},
+    'kotlin': (BASE_CONDITIONS - {'case', '?'}) | {'?:'}
+}
+
+FUNCTION_KEYWORDS = frozenset(['function', 'func', 'fn', 'fun'])
+
+CONTROL_WORDS = frozenset([
+    'if', 'for', 'foreach', 'while', 'switch', 'catch', 'with', 'using', 'lock', 'synchronized',
+    'return', 'elseif', 'match', 'when', 'sizeof', 'typeof', 'await', 'new', 'throw', 'defined'
+])
+
+TYPE_KEYWORDS = frozenset([
+    'class', 'interface', 'struct', 'enum', 'union', 'impl', 'trait', 'namespace', 'object', 'record'
+])
+
+RESET_WORDS = frozenset(['let', 'var', 'val', 'return', 'throw', 'yield', 'else', 'do', 'try', 'finally', 'go', 'defer'])
+
+SCRIPT_RESET_WORDS = RESET_WORDS | {'const'}
+
+STATEMENT_END = frozenset([';', ',', '=', '?', '&&', '||', '==', '!=', '<=', '>=', '??', '?:', '?.', '::'])
+
+def _tokenizer(char_literal: str) -> 're.Pattern':
+    return re.compile(
+        r'(?P<skip>//[^\n]*|/\*.*?\*/|^[ \t]*\#[^\n]*)'
+        r'|(?P<string>"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`|' + char_literal + r')'
+        r'|(?P<word>[A-Za-z_$][\w$]*)'
+        r'|(?P<op>&&|\|\||\?\?|\?:|\?\.|=>|->|::|==|!=|<=|>=|[{}()\[\];?=])',
+        re.S | re.M
+    )
+
+TOKENIZERS = {
+    'script': _tokenizer(r"'(?:\\.|[^'\\\n])*'"),
+    'compiled': _tokenizer(r"'(?:\\.|[^'\\\n])'")
+}
+
+LANGUAGE_TOKENIZERS = {
+    'javascript': 'script',
+    'typescript': 'script',
+    'php': 'script'
+}
+
+class FastComplexityEstimator:
+    def supports(self, language: str) -> bool:
+        return language in LANGUAGE_CONDITIONS
+    
+    def analyze(self, content: str, language: str) -> Optional[Dict]:
+        conditions = LANGUAGE_CONDITIONS.get(language)
+        if conditions is None:
+            return None
+        
+        family = LANGUAGE_TOKENIZERS.get(language, 'compiled')
+        tokenizer = TOKENIZERS[family]
+        reset_words = SCRIPT_RESET_WORDS if family == 'script' else RESET_WORDS
+        complexities = []
+        function_lengths = []
+        function_lines = []
+        
+        line = 1
+        line_pos = 0
+        
+        def line_at(pos: int) -> int:
+            nonlocal line, line_pos
+            if pos < line_pos:
+                line -= content.count('\n', pos, line_pos)
+            else:
+                line += content.count('\n', line_pos, pos)
+            line_pos = pos
+            return line
+        
+        blocks = []
+        open_functions = []
+        parens = []
+        signature_pos = None
+        keyword_pos = None
+        arrow_pos = None
+        control = False
+        previous = None
+        previous_pos = 0
+        
+        for match in tokenizer.finditer(content):
+            kind = match.lastgroup
+            if kind == 'skip' or kind == 'string':
+                continue
+            
+            token = match.group()
+            pos = match.start()
+            
+            if token in conditions and open_functions:
+                complexities[open_functions[-1]] += 1
+            
+            if kind == 'word':
+                if token in FUNCTION_KEYWORDS and keyword_pos is None:
+                    keyword_pos = pos
+                elif token in CONTROL_WORDS:
+                    signature_pos = None
+                    control = True
+                elif token in TYPE_KEYWORDS or token in reset_words:
+                    signature_pos = keyword_pos = None
+            elif token == '(':
+                parens.append((previous, previous_pos))
+            elif token == ')':
+                owner, owner_pos = parens.pop() if parens else (None, pos)
+                if owner in CONTROL_WORDS:
+                    control = False
+                elif not parens and not control and owner is not None and (owner[0].isalpha() or owner[0] in '_$'):
+                    signature_pos = owner_pos
+            elif token == '=>':
+                arrow_pos = pos
+            elif token == '{':
+                start = keyword_pos if keyword_pos is not None else signature_pos
+                if previous == '=>':
+                    start = arrow_pos
+                is_function = start is not None
+                if is_function:
+                    open_functions.append(len(complexities))
+                    complexities.append(1)
+                    function_lines.append(line_at(start))
+                    function_lengths.append(0)
+                blocks.append((is_function, parens))
+                parens = []
+                signature_pos = keyword_pos = arrow_pos = None
+                control = False
+            elif token == '}':
+                if blocks:
+                    is_function, parens = blocks.pop()
+                    if is_function:
+                        index = open_functions.pop()
+                        function_lengths[index] = line_at(pos) - function_lines[index] + 1
+                signature_pos = keyword_pos = arrow_pos = None
+                control = False
+            elif token in STATEMENT_END and not parens:
+                signature_pos = keyword_pos = arrow_pos = None
+            
+            if previous == '=>' and token != '{':
+                complexities.append(1)
+                function_lines.append(line_at(previous_pos))
+                function_lengths.append(1)
+                arrow_pos = None
+            
+            previous = token
+            previous_pos = pos
+        
+        while open_functions:
+            index = open_functions.pop()
+            function_lengths[index] = line_at(len(content)) - function_lines[index] + 1
+        
+        return {
+            'complexities': complexities,
+            'function_lengths': function_lengths,
+            'function_lines': function_lines
+        }
\ No newline at end of file
@@ -0,0 +1,146 @@
+import os
+import math
+import time
+import hashlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from config import CODE_EXTENSIONS, SAMPLING_DEFAULTS
+
+class FileSampler:
+    def __init__(self, target_files: Optional[int] = None, time_budget: Optional[float] = None,
+                 seed: int = SAMPLING_DEFAULTS['seed']):
+        self.target_files = target_files
+        self.time_budget = time_budget
+        self.seed = seed
+        self.z = SAMPLING_DEFAULTS['confidence_z']
+        self.language_by_extension = {}
+        for language, exts in CODE_EXTENSIONS.items():
+            for ext in exts:
+                self.language_by_extension.setdefault(ext, language)
+        self.population = {}
+        self.deadline = None
+    
+    def stratum_key(self, relative_path: str) -> Tuple[str, str]:
+        parts = relative_path.replace(os.sep, '/').split('/')
+        directory = parts[0] if len(parts) > 1 else '.'
+        language = self.language_by_extension.get(os.path.splitext(relative_path)[1], 'other')
+        return directory, language
+    
+    def _rank(self, relative_path: str) -> str:
+        return hashlib.sha1(f"{self.seed}:{relative_path}".encode('utf-8')).hexdigest()
+    
+    def _allocate(self, sizes: Dict[Tuple[str, str], int], target: int) -> Dict[Tuple[str, str], int]:
+        total = sum(sizes.values())
+        if target >= total:
+            return dict(sizes)
+        
+        allocation = dict.fromkeys(sizes, 0)
+        for key in sorted(sizes, key=lambda key: (-sizes[key], key))[:target]:
+            allocation[key] = 1
+        
+        remaining = target - sum(allocation.values())
+        if remaining <= 0:
+            return allocation
+        
+        spare_total = total - sum(allocation.values())
+        remainders = []
+        for key, size in sizes.items():
+            share = (size - allocation[key]) * remaining / spare_total
+            allocation[key] += int(share)
+            remainders.append((share - int(share), key))
+        
+        remaining = target - sum(allocation.values())
+        for _, key in sorted(remainders, key=lambda item: (-item[0], item[1])):
+            if remaining <= 0:
+                break
+            if allocation[key] < sizes[key]:
+                allocation[key] += 1
+                remaining -= 1
+        
+        return allocation
+    
+    def select(self, paths: List[str], root: str) -> List[str]:
+        strata = defaultdict(list)
+        for path in paths:
+            relative = os.path.relpath(path, root)
+            strata[self.stratum_key(relative)].append((self._rank(relative), path))
+        
+        self.population = {key: len(members) for key, members in strata.items()}
+        target = self.target_files if self.target_files is not None else len(paths)
+        allocation = self._allocate(self.population, target)
+        
+        ordered = []
+        for key, members in strata.items():
+            members.sort()
+            quota = allocation[key]
+            for position, (rank, path) in enumerate(members[:quota]):
+                ordered.append(((position + 0.5) / quota, rank, path))
+        
+        ordered.sort()
+        
+        if self.time_budget is not None:
+            self.deadline = time.monotonic() + self.time_budget
+        
+        return [path for _, _, path in ordered]
+    
+    def expired(self) -> bool:
+        return self.deadline is not None and time.monotonic() > self.deadline
+    
+    def extrapolate(self, observations: Dict[Tuple[str, str], List[Dict[str, float]]],
+                    metrics: List[str]) -> Dict[str, Dict[str, float]]:
+        pooled = defaultdict(list)
+        for rows in observations.values():
+            for row in rows:
+                for metric in metrics:
+                    pooled[metric].append(row[metric])
+        
+        estimates = {}
+        for metric in metrics:
+            pooled_values = pooled[metric]
+            pooled_mean = sum(pooled_values) / len(pooled_values) if pooled_values else 0.0
+            pooled_var = _sample_variance(pooled_values, pooled_mean)
+            
+            total = 0.0
+            variance = 0.0
+            for key, population in self.population.items():
+                values = [row[metric] for row in observations.get(key, [])]
+                sampled = len(values)
+                
+                if sampled == 0:
+                    total += population * pooled_mean
+                    if pooled_values:
+                        variance += population ** 2 * pooled_var / len(pooled_values)
+                    continue
+                
+                mean = sum(values) / sampled
+                stratum_var = _sample_variance(values, mean) if sampled > 1 else pooled_var
+                total += population * mean
+                variance += population ** 2 * (1 - sampled / population) * stratum_var / sampled
+            
+            margin = self.z * math.sqrt(variance)
+            estimates[metric] = {
+                'estimate': total,
+                'low': max(0.0, total - margin),
+                'high': total + margin,
+                'relative_error': margin / total if total > 0 else 0.0
+            }
+        
+        return estimates
+    
+    def describe(self, sampled: int) -> Dict:
+        population = sum(self.population.values())
+        return {
+            'seed': self.seed,
+            'target_files': self.target_files,
+            'time_budget': self.time_budget,
+            'population': population,
+            'sampled': sampled,
+            'strata': len(self.population),
+            'sampling_fraction': round(sampled / population, 4) if population else 0.0,
+            'confidence_level': SAMPLING_DEFAULTS['confidence_level']
+        }
+
+def _sample_variance(values: List[float], mean: float) -> float:
+    if len(values) < 2:
+        return 0.0
+    return sum((value - mean) ** 2 for value in values) / (len(values) - 1)
\ No newline at end of file
@@ -1,13 +1,58 @@
 import re
+import time
 from datetime import datetime, timedelta
 from collections import defaultdict
-from typing import List
-from git import Repo
+from typing import Iterator, List, TYPE_CHECKING
 from models import GitMetrics
+from worker_pool import WorkerPool, WorkerDied
+
+if TYPE_CHECKING:
+    from git import Repo
+
+_open_repository = {}
+
+def commit_size(commit, paths: List[str] = None) -> int:
+    try:
+        if paths:
+            prefixes = tuple(path.rstrip('/') + '/' for path in paths)
+            return sum(
+                stats['insertions'] + stats['deletions']
+                for name, stats in commit.stats.files.items() if name.startswith(prefixes)
+            )
+        stats = commit.stats.total
+        return stats['insertions'] + stats['deletions']
+    except:
+        return 0
+
+def is_partial_clone(repo: 'Repo') -> bool:
+    reader = repo.config_reader('repository')
+    if reader.has_option('extensions', 'partialclone'):
+        return True
+    return any(reader.get_value(section, 'promisor', False)
+               for section in reader.sections() if section.startswith('remote '))
+
+def commit_sizes_batch(git_dir: str, paths: List[str], shas: List[str]) -> List[int]:
+    from git import Repo
+    
+    repo = _open_repository.get(git_dir)
+    if repo is None:
+        for stale in _open_repository.values():
+            stale.close()
+        _open_repository.clear()
+        repo = _open_repository[git_dir] = Repo(git_dir)
+    return [commit_size(repo.commit(sha), paths) for sha in shas]
 
 class GitAnalyzer:
-    def __init__(self, git_repo: Repo):
+    def __init__(self, git_repo: 'Repo', max_commits: int = None, time_budget: float = None,
+                 worker_pool: WorkerPool = None, paths: List[str] = None):
         self.repo = git_repo
+        self.paths = paths or []
+        self.worker_pool = worker_pool
+        self.max_commits = max_commits
+        self.time_budget = time_budget
+        self.complete = True
+        self.size_complete = True
+        self.partial_clone = is_partial_clone(git_repo)
     
     def analyze_commit_message(self, message: str) -> bool:
         message = message.strip()
@@ -36,16 +81,42 @@ class GitAnalyzer:
         return any(good_indicators)
     
     def calculate_commit_size(self, commit) -> int:
+        return commit_size(commit, self.paths)
+    
+    def _commit_sizes(self, commits: list) -> Iterator[int]:
+        if self.partial_clone:
+            print("  Partial clone: commit sizes skipped to avoid fetching historical blobs")
+            self.size_complete = False
+            for _ in commits:
+                yield 0
+            return
+        
+        if self.worker_pool is None:
+            for commit in commits:
+                yield self.calculate_commit_size(commit)
+            return
+        
+        sizes = self.worker_pool.imap_chunked(
+            commit_sizes_batch, [commit.hexsha for commit in commits], args=(self.repo.git_dir, self.paths),
+            lost=0, on_lost=self._worker_lost
+        )
         try:
-            stats = commit.stats.total
-            return stats['insertions'] + stats['deletions']
-        except:
-            return 0
+            yield from sizes
+        finally:
+            sizes.close()
+    
+    def _worker_lost(self, error: WorkerDied, commits: int):
+        print(f"  Warning: {error}; sizes of {commits} commits skipped")
+        self.size_complete = False
     
     def analyze(self) -> GitMetrics:
-        commits = list(self.repo.iter_commits())
+        deadline = time.monotonic() + self.time_budget if self.time_budget is not None else None
+        commits = list(self.repo.iter_commits(max_count=self.max_commits, paths=self.paths))
         total_commits = len(commits)
         
+        if self.max_commits is not None and total_commits >= self.max_commits:
+            total_commits = int(self.repo.git.rev_list('--count', 'HEAD', '--', *self.paths))
+        
         if total_commits == 0:
             return GitMetrics(
                 total_commits=0,
@@ -70,7 +141,13 @@ class GitAnalyzer:
         large_commits = 0
         incremental_commits = 0
         
+        analyzed = 0
+        sizes = self._commit_sizes(commits)
         for commit in commits:
+            if deadline is not None and time.monotonic() > deadline:
+                break
+            
+            analyzed += 1
             authors.add(commit.author.email)
             commit_dates.append(commit.committed_datetime)
             
@@ -82,18 +159,22 @@ class GitAnalyzer:
             else:
                 poor_messages += 1
             
-            commit_size = self.calculate_commit_size(commit)
-            if commit_size > 500:
+            size = next(sizes)
+            if size > 500:
                 large_commits += 1
-            elif commit_size > 0:
+            elif size > 0:
                 incremental_commits += 1
         
+        sizes.close()
+        self.complete = analyzed == total_commits
+        scale = total_commits / analyzed if analyzed else 1
+        
         commit_dates.sort()
         
         if len(commit_dates) >= 2:
             date_range = (commit_dates[-1] - commit_dates[0]).total_seconds()
             weeks = max(date_range / (7 * 24 * 3600), 1)
-            avg_commits_per_week = total_commits / weeks
+            avg_commits_per_week = len(commit_dates) / weeks
         else:
             avg_commits_per_week = 0
         
@@ -119,11 +200,12 @@ class GitAnalyzer:
             avg_commits_per_week=round(avg_commits_per_week, 2),
             commit_frequency_trend=trend,
             avg_commit_message_length=round(avg_message_length, 2),
-            good_commit_messages=good_messages,
-            poor_commit_messages=poor_messages,
+            good_commit_messages=int(round(good_messages * scale)),
+            poor_commit_messages=int(round(poor_messages * scale)),
             total_branches=total_branches,
             total_prs=0,
             merge_pr_ratio=0,
-            large_commits=large_commits,
-            incremental_commits=incremental_commits
+            large_commits=int(round(large_commits * scale)),
+            incremental_commits=int(round(incremental_commits * scale)),
+            commit_sizes_known=not self.partial_clone
         )
\ No newline at end of file
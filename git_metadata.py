@@ -0,0 +1,76 @@
+import os
+import re
+from typing import Optional, Tuple, TYPE_CHECKING
+from models import RepositoryMetadata
+
+if TYPE_CHECKING:
+    from git import Repo
+
+REMOTE_PATTERN = re.compile(r'[:/]([^/:]+)/([^/]+?)(?:\.git)?/?$')
+
+def _remote_url(git_repo: 'Repo') -> Optional[str]:
+    try:
+        return git_repo.remotes.origin.url
+    except (AttributeError, ValueError):
+        return None
+
+def _default_branch(git_repo: 'Repo') -> str:
+    try:
+        origin_head = git_repo.git.symbolic_ref('refs/remotes/origin/HEAD')
+        return origin_head.rsplit('/', 1)[-1]
+    except Exception:
+        pass
+    
+    try:
+        return git_repo.head.reference.name
+    except TypeError:
+        return 'HEAD'
+
+def _size_kb(git_repo: 'Repo') -> int:
+    counts = {}
+    for line in git_repo.git.count_objects('-v').splitlines():
+        key, _, value = line.partition(':')
+        if value.strip().isdigit():
+            counts[key.strip()] = int(value)
+    return counts.get('size', 0) + counts.get('size-pack', 0)
+
+def _history_bounds(git_repo: 'Repo'):
+    head = git_repo.head.commit
+    roots = git_repo.git.rev_list('--max-parents=0', 'HEAD').split()
+    created = min(git_repo.commit(sha).committed_datetime for sha in roots)
+    return created, head.committed_datetime
+
+def repository_identity(git_repo: 'Repo') -> Tuple[str, str, str]:
+    root = os.path.abspath(git_repo.git_dir if git_repo.bare else git_repo.working_tree_dir)
+    remote_url = _remote_url(git_repo)
+    
+    match = REMOTE_PATTERN.search(remote_url) if remote_url else None
+    if match:
+        return match.group(1), match.group(2), remote_url
+    
+    name = os.path.basename(root)
+    name = name[:-len('.git')] if name.endswith('.git') else name
+    return os.path.basename(os.path.dirname(root)) or 'local', name, remote_url or root
+
+def read_repository_metadata(git_repo: 'Repo') -> RepositoryMetadata:
+    owner, name, url = repository_identity(git_repo)
+    created_at, updated_at = _history_bounds(git_repo)
+    
+    return RepositoryMetadata(
+        name=name,
+        owner=owner,
+        url=url,
+        default_branch=_default_branch(git_repo),
+        created_at=created_at,
+        updated_at=updated_at,
+        stars=None,
+        forks=None,
+        open_issues=None,
+        size_kb=_size_kb(git_repo),
+        primary_language=None,
+        languages={},
+        has_wiki=None,
+        has_issues=None,
+        has_projects=None,
+        archived=None
+    )
\ No newline at end of file
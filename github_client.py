@@ -1,33 +1,46 @@
 import re
 from typing import Optional, Tuple
-from github import Github, GithubException
 from models import RepositoryMetadata
 from config import GITHUB_TOKEN
 
+REPO_URL_PATTERNS = [
+    re.compile(r'^(?:https?://|ssh://git@|git@)?(?:www\.)?github\.com[:/]'
+               r'([A-Za-z0-9][A-Za-z0-9-]*)/([A-Za-z0-9_.-]+?)(?:\.git)?(?:[/?#].*)?$'),
+    re.compile(r'^([A-Za-z0-9][A-Za-z0-9-]*)/([A-Za-z0-9_.-]+?)(?:\.git)?$')
+]
+
+def parse_repo_url(url: str) -> Tuple[str, str]:
+    for pattern in REPO_URL_PATTERNS:
+        match = pattern.match(url.strip())
+        if match and match.group(2) not in ('.', '..'):
+            return match.group(1), match.group(2)
+    
+    raise ValueError(f"Invalid GitHub repository URL: {url}")
+
+def repository_url(owner: str, repo_name: str) -> str:
+    return f"https://github.com/{owner}/{repo_name}"
+
 class GitHubClient:
     def __init__(self, token: Optional[str] = None):
         self.token = token or GITHUB_TOKEN
-        self.client = Github(self.token) if self.token else Github()
+        self._client = None
+    
+    @property
+    def client(self):
+        if self._client is None:
+            from github import Github
+            self._client = Github(self.token) if self.token else Github()
+        return self._client
     
     def parse_repo_url(self, url: str) -> Tuple[str, str]:
-        patterns = [
-            r'github\.com[:/]([^/]+)/([^/\.]+)',
-            r'^([^/]+)/([^/]+)$'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1), match.group(2)
-        
-        raise ValueError(f"Invalid GitHub repository URL: {url}")
+        return parse_repo_url(url)
     
     def get_repository_metadata(self, owner: str, repo_name: str) -> RepositoryMetadata:
+        from github import GithubException
+        
         try:
             repo = self.client.get_repo(f"{owner}/{repo_name}")
             
-            languages = repo.get_languages()
-            
             return RepositoryMetadata(
                 name=repo.name,
                 owner=repo.owner.login,
@@ -40,11 +53,12 @@ class GitHubClient:
                 open_issues=repo.open_issues_count,
                 size_kb=repo.size,
                 primary_language=repo.language,
-                languages=languages,
+                languages={},
                 has_wiki=repo.has_wiki,
                 has_issues=repo.has_issues,
                 has_projects=repo.has_projects,
-                archived=repo.archived
+                archived=repo.archived,
+                fork_source=repo.source.full_name if repo.fork and repo.source else None
             )
         except GithubException as e:
             raise Exception(f"Failed to fetch repository metadata: {str(e)}")
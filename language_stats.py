@@ -0,0 +1,99 @@
+import os
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
+from config import (
+    CODE_EXTENSIONS, LANGUAGE_FILENAMES, LANGUAGE_INTERPRETERS,
+    LANGUAGE_ALIASES, VENDORED_PATTERNS, LANGUAGE_STATS
+)
+
+VENDORED_PATTERN = re.compile('|'.join(f"(?:{pattern})" for pattern in VENDORED_PATTERNS))
+
+SHEBANG_PATTERN = re.compile(rb'^#!\s*(?:\S*/)?(?:env\s+(?:-\S+\s+)*)?([A-Za-z][\w.-]*)')
+
+EXTENSION_LANGUAGES = defaultdict(list)
+for _language, _exts in CODE_EXTENSIONS.items():
+    for _ext in _exts:
+        EXTENSION_LANGUAGES[_ext].append(_language)
+
+def language_key(name: Optional[str]) -> Optional[str]:
+    if not name:
+        return None
+    lowered = name.lower()
+    return LANGUAGE_ALIASES.get(lowered, lowered)
+
+def is_vendored(relative_path: str) -> bool:
+    return VENDORED_PATTERN.search(relative_path.replace(os.sep, '/')) is not None
+
+def interpreter_language(path: str) -> Optional[str]:
+    try:
+        with open(path, 'rb') as f:
+            first_line = f.read(LANGUAGE_STATS['shebang_read_bytes']).split(b'\n', 1)[0]
+    except OSError:
+        return None
+    
+    match = SHEBANG_PATTERN.match(first_line)
+    if not match:
+        return None
+    
+    interpreter = match.group(1).decode('ascii', 'ignore')
+    return LANGUAGE_INTERPRETERS.get(interpreter) or LANGUAGE_INTERPRETERS.get(re.sub(r'[\d.]+$', '', interpreter))
+
+class LanguageStats:
+    def __init__(self):
+        self.bytes = defaultdict(int)
+        self.ambiguous = defaultdict(int)
+        self.vendored_files = 0
+    
+    def detect(self, relative_path: str, path: str) -> Optional[str]:
+        name = os.path.basename(relative_path)
+        if name in LANGUAGE_FILENAMES:
+            return LANGUAGE_FILENAMES[name]
+        
+        ext = os.path.splitext(name)[1]
+        candidates = EXTENSION_LANGUAGES.get(ext)
+        if candidates:
+            return candidates[0] if len(candidates) == 1 else ext
+        
+        if not ext:
+            return interpreter_language(path)
+        return None
+    
+    def add(self, relative_path: str, path: str, size: int):
+        if is_vendored(relative_path):
+            self.vendored_files += 1
+            return
+        
+        language = self.detect(relative_path, path)
+        if language is None:
+            return
+        
+        if language in EXTENSION_LANGUAGES:
+            self.ambiguous[language] += size
+        else:
+            self.bytes[language] += size
+    
+    def _resolve_ambiguous(self) -> Dict[str, int]:
+        resolved = dict(self.bytes)
+        for ext, size in self.ambiguous.items():
+            candidates = EXTENSION_LANGUAGES[ext]
+            language = max(candidates, key=lambda candidate: (resolved.get(candidate, 0), -candidates.index(candidate)))
+            resolved[language] = resolved.get(language, 0) + size
+        return resolved
+    
+    def breakdown(self) -> Dict[str, int]:
+        resolved = self._resolve_ambiguous()
+        return dict(sorted(resolved.items(), key=lambda item: (-item[1], item[0])))
+
+def significant_languages(languages: Dict[str, int], primary: str = None,
+                          min_share: float = LANGUAGE_STATS['min_share']) -> List[str]:
+    total = sum(languages.values())
+    selected = [
+        language for language, size in languages.items()
+        if total and size / total >= min_share and language in CODE_EXTENSIONS
+    ]
+    
+    primary = language_key(primary)
+    if primary in CODE_EXTENSIONS and primary not in selected:
+        selected.insert(0, primary)
+    return selected
\ No newline at end of file
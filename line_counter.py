@@ -0,0 +1,80 @@
+import io
+import codecs
+from typing import Dict
+from config import LARGE_FILES
+
+COMMENT_PREFIXES = ('#', '//', '/*', '*', '"""', "'''")
+
+class StreamingLineCounter:
+    def __init__(self):
+        self.total = 0
+        self.blank = 0
+        self.comment = 0
+        self.in_block_comment = False
+        self.head = ''
+        self.tail = ''
+        self.triple_quote = False
+    
+    def _extend(self, piece: str):
+        if not piece:
+            return
+        
+        if not self.head:
+            self.head = piece.lstrip()[:3]
+        elif len(self.head) < 3:
+            self.head = (self.head + piece)[:3]
+        
+        if not self.triple_quote:
+            boundary = self.tail + piece[:2]
+            self.triple_quote = ('"""' in boundary or "'''" in boundary
+                                 or '"""' in piece or "'''" in piece)
+        self.tail = piece[-2:] if len(piece) >= 2 else (self.tail + piece)[-2:]
+    
+    def _end_line(self):
+        self.total += 1
+        if not self.head:
+            self.blank += 1
+        
+        if self.triple_quote:
+            self.in_block_comment = not self.in_block_comment
+            self.comment += 1
+        elif self.in_block_comment or self.head.startswith(COMMENT_PREFIXES):
+            self.comment += 1
+        
+        self.head = ''
+        self.tail = ''
+        self.triple_quote = False
+    
+    def feed(self, text: str):
+        pieces = text.split('\n')
+        for piece in pieces[:-1]:
+            self._extend(piece)
+            self._end_line()
+        self._extend(pieces[-1])
+    
+    def close(self) -> Dict[str, int]:
+        self._end_line()
+        code = self.total - self.blank - self.comment
+        
+        return {
+            'total': self.total,
+            'code': max(0, code),
+            'comment': self.comment,
+            'blank': self.blank
+        }
+
+def count_file_lines(path: str, chunk_bytes: int = LARGE_FILES['chunk_bytes']) -> Dict[str, int]:
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(errors='ignore'), translate=True)
+    counter = StreamingLineCounter()
+    buffer = bytearray(chunk_bytes)
+    view = memoryview(buffer)
+    
+    with open(path, 'rb', buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            counter.feed(decoder.decode(view[:read]))
+    
+    counter.feed(decoder.decode(b'', final=True))
+    return counter.close()
\ No newline at end of file
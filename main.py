@@ -3,6 +3,8 @@ import sys
 import json
 import argparse
 from repository_mirror import RepositoryMirror
+from result_cache import ResultCache
+from config import RESULT_CACHE, RESULT_STORE, SERVICE, MIRROR_STORE, WORKER_POOL
 
 def print_banner():
     banner = """
@@ -58,6 +60,118 @@ def print_summary(output: dict):
     
     print(f"\n{'='*70}\n")
 
+def rescore_cached(args) -> int:
+    from batch_rescorer import BatchRescorer
+    
+    if not args.cache_dir:
+        print("ERROR: --rescore needs --cache-dir or REPO_MIRROR_CACHE_DIR", file=sys.stderr)
+        return 1
+    
+    cached = ResultCache(args.cache_dir).results()
+    rescored = BatchRescorer().rescore(cached)
+    
+    if not args.quiet:
+        print(f"Re-scored {len(rescored)} cached result(s)\n")
+        for before, after in zip(cached, rescored):
+            name = f"{after.repository.owner}/{after.repository.name}"
+            print(f"  {name:40s} {before.overall_score:6.2f} -> {after.overall_score:6.2f}  "
+                  f"{after.tier:12s} {after.confidence}")
+    
+    if args.output:
+        mirror = RepositoryMirror(github_token=args.token)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump([mirror.generate_output(a) for a in rescored], f, indent=2, ensure_ascii=False)
+    
+    return 0
+
+def query_store(args) -> int:
+    from result_store import ResultStore
+    
+    if not args.store:
+        print("ERROR: store queries need --store or REPO_MIRROR_STORE", file=sys.stderr)
+        return 1
+    
+    with ResultStore(args.store) as store:
+        if args.history:
+            owner, _, name = args.history.partition('/')
+            rows = store.history(owner, name)
+        elif args.top:
+            rows = store.top_by_dimension(args.top, owner=args.org, limit=args.limit)
+        else:
+            rows = store.latest_scores(owner=args.org)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+    
+    if not args.quiet:
+        for row in rows:
+            name = f"{row['owner']}/{row['name']}" if 'owner' in row else args.history
+            extra = f"{row['percentage']:.0%}" if 'percentage' in row else f"{row['tier']:12s} {row['confidence']}"
+            print(f"  {row['analyzed_at'][:19]}  {name:40s} {row['score']:6.2f}  {extra}")
+    
+    return 0
+
+def local_identity(path: str) -> tuple:
+    from git import Repo
+    from git_metadata import repository_identity
+    
+    owner, repo_name, _ = repository_identity(Repo(path))
+    return owner, repo_name
+
+def print_monorepo_summary(output: dict):
+    rollup = output['rollup']
+    print(f"\n{'='*70}")
+    print(f"MONOREPO RESULTS")
+    print(f"{'='*70}")
+    print(f"\nRepository: {output['metadata']['repository']['name']}")
+    print(f"Owner: {output['metadata']['repository']['owner']}")
+    print(f"\n{'─'*70}")
+    print(f"ROLLUP SCORE: {rollup['overall_score']}/100 across {rollup['packages']} package(s)")
+    print(f"TIER: {rollup['tier']}")
+    print(f"CONFIDENCE: {rollup['confidence']}")
+    if rollup['unassigned_files']:
+        print(f"NOT ANALYZED: {rollup['unassigned_files']} file(s) outside every package "
+              f"({rollup['unassigned_code_files']} code)")
+    print(f"{'─'*70}")
+    
+    print("\nDIMENSION SCORES (weighted by code lines):")
+    for dim_name, percentage in rollup['dimension_percentages'].items():
+        bar_length = int(percentage * 30)
+        bar = '█' * bar_length + '░' * (30 - bar_length)
+        print(f"  {dim_name:30s} [{bar}] {percentage:.0%}")
+    
+    print(f"\n{'─'*70}")
+    print("PACKAGES:")
+    print(f"{'─'*70}")
+    for package_path, package in sorted(output['packages'].items(), key=lambda item: -item[1]['score']):
+        language = package['metadata']['repository']['primary_language'] or '-'
+        lines = package['metadata']['metrics']['total_lines']
+        print(f"  {package_path:40s} {package['score']:6.2f}  {package['tier']:12s} {language:12s} {lines:>9} lines")
+    print()
+
+def make_worker_pool(args, shared: bool):
+    if args.workers == 0 or (args.workers is None and not shared):
+        return None
+    
+    from worker_pool import WorkerPool
+    return WorkerPool(workers=args.workers or WORKER_POOL['workers']).start()
+
+def read_batch_file(path: str) -> list:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+def export_columnar(args, analyses: list):
+    from columnar_export import export_results
+    
+    written = export_results(
+        analyses, args.export, format=args.export_format, file_metrics_path=args.file_metrics
+    )
+    if not args.quiet:
+        print(f"Exported {written['results']} result row(s) to: {args.export}")
+        if args.file_metrics:
+            print(f"Exported {written['files']} file row(s) to: {args.file_metrics}")
+
 def main():
     parser = argparse.ArgumentParser(
         description='Repository Mirror - Analyze GitHub repositories',
@@ -67,17 +181,60 @@ Examples:
   python main.py https://github.com/user/repo
   python main.py https://github.com/user/repo --output result.json
   python main.py https://github.com/user/repo --quiet --output result.json
+  python main.py https://github.com/user/repo --sample-files 2000 --sample-seed 7
+  python main.py https://github.com/user/repo --time-budget 30 --output result.json
+  python main.py --batch-file repos.txt --store results.db --output results.json
+  python main.py --batch-file repos.txt --prefetch 2 --output results.json
+  python main.py --batch-file repos.txt --workers 8
+  python main.py --store results.db --history user/repo
+  python main.py --store results.db --top code_quality --org user
+  python main.py --batch-file repos.txt --export results.parquet --file-metrics files.parquet
+  python main.py --serve --port 8765
+  python main.py --local . --output result.json
+  python main.py https://github.com/user/monorepo --monorepo --output packages.json
+  python main.py https://github.com/user/monorepo --package packages/api
 
 Environment Variables:
-  GITHUB_TOKEN    GitHub personal access token (optional, for higher rate limits)
+  GITHUB_TOKEN            GitHub personal access token (optional, for higher rate limits)
+  REPO_MIRROR_CACHE_DIR   Enable the result cache in this directory
+  REPO_MIRROR_STORE       Append every analysis to this SQLite result store
+  REPO_MIRROR_MIRRORS     Keep bare mirrors here and clone forks against them
         """
     )
     
     parser.add_argument(
-        'repo_url',
+        'repo_urls',
+        nargs='*',
+        metavar='repo_url',
         help='GitHub repository URL (e.g., https://github.com/user/repo)'
     )
     
+    parser.add_argument(
+        '--local',
+        help='Treat the arguments as local checkouts or bare repositories and skip the GitHub API',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--monorepo',
+        help='Detect package roots and analyze each package separately, with a repository rollup',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--package',
+        help='Analyze only this package path with a sparse checkout (repeatable; implies --monorepo)',
+        action='append',
+        metavar='PATH',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--batch-file',
+        help='File with one repository URL per line to analyze in a batch',
+        default=None
+    )
+    
     parser.add_argument(
         '-o', '--output',
         help='Output JSON file path (optional)',
@@ -96,21 +253,345 @@ Environment Variables:
         default=None
     )
     
+    parser.add_argument(
+        '--sample-files',
+        help='Analyze a stratified sample of this many code files and extrapolate totals',
+        type=int,
+        default=None
+    )
+    
+    parser.add_argument(
+        '--sample-budget',
+        help='Stop sampling code files after this many seconds',
+        type=float,
+        default=None
+    )
+    
+    parser.add_argument(
+        '--sample-seed',
+        help='Seed for reproducible sampling (default: 0)',
+        type=int,
+        default=0
+    )
+    
+    parser.add_argument(
+        '--time-budget',
+        help='Return the best available score within this many seconds, refining progressively',
+        type=float,
+        default=None
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for cached results keyed by HEAD commit (default: REPO_MIRROR_CACHE_DIR)',
+        default=RESULT_CACHE['directory']
+    )
+    
+    parser.add_argument(
+        '--mirrors',
+        help='Directory of bare mirrors that forks are cloned against (default: REPO_MIRROR_MIRRORS)',
+        default=MIRROR_STORE['path']
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        help='Ignore and do not update the result cache',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--invalidate-cache',
+        help='Drop cached results for this repository before analyzing',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--rescore',
+        help='Re-score every cached result with the current config instead of analyzing',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--no-schedule',
+        help='Analyze a batch in the given order instead of shortest-estimated-job first',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        help='Analysis worker processes (default: one per CPU for batches and the service, '
+             'none for a single repository; 0 disables)',
+        type=int,
+        default=None,
+        metavar='N'
+    )
+    
+    parser.add_argument(
+        '--prefetch',
+        help='Clone up to N upcoming batch repositories while the current one is analyzed (default: 0)',
+        type=int,
+        default=0,
+        metavar='N'
+    )
+    
+    parser.add_argument(
+        '--store',
+        help='SQLite result store that keeps every analysis (default: REPO_MIRROR_STORE)',
+        default=RESULT_STORE['path']
+    )
+    
+    parser.add_argument(
+        '--latest',
+        help='List the latest stored score per repository instead of analyzing',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--history',
+        help='List stored score history for OWNER/NAME instead of analyzing',
+        metavar='OWNER/NAME',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--top',
+        help='List the stored repositories ranked highest on this dimension instead of analyzing',
+        metavar='DIMENSION',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--org',
+        help='Restrict --latest and --top to repositories of this owner',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--limit',
+        help='Number of rows returned by --top (default: 10)',
+        type=int,
+        default=10
+    )
+    
+    parser.add_argument(
+        '--export',
+        help='Write results as a typed columnar table with flattened dimension scores',
+        metavar='PATH',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--export-format',
+        help='Columnar format for --export and --file-metrics (default: parquet)',
+        choices=['parquet', 'arrow'],
+        default='parquet'
+    )
+    
+    parser.add_argument(
+        '--file-metrics',
+        help='Record per-file metrics and write them as a columnar table to this path',
+        metavar='PATH',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--serve',
+        help='Run a local HTTP analysis service instead of analyzing once',
+        action='store_true'
+    )
+    
+    parser.add_argument(
+        '--host',
+        help=f"Address for --serve (default: {SERVICE['host']})",
+        default=SERVICE['host']
+    )
+    
+    parser.add_argument(
+        '--port',
+        help=f"Port for --serve (default: {SERVICE['port']})",
+        type=int,
+        default=SERVICE['port']
+    )
+    
     args = parser.parse_args()
     
+    if args.serve:
+        from service import serve
+        worker_pool = make_worker_pool(args, shared=True)
+        try:
+            serve(args.host, args.port, github_token=args.token,
+                  cache_dir='' if args.no_cache else args.cache_dir, mirror_dir=args.mirrors,
+                  worker_pool=worker_pool)
+        finally:
+            if worker_pool is not None:
+                worker_pool.close()
+        return 0
+    
+    if args.rescore:
+        return rescore_cached(args)
+    
+    if args.latest or args.history or args.top:
+        return query_store(args)
+    
+    if args.batch_file:
+        args.repo_urls.extend(read_batch_file(args.batch_file))
+    
+    if not args.repo_urls:
+        parser.error('repo_url is required unless --rescore or a store query is given')
+    
+    if args.time_budget is not None and (len(args.repo_urls) > 1 or args.local):
+        parser.error('--time-budget analyzes a single remote repository')
+    
+    if (args.monorepo or args.package) and (len(args.repo_urls) != 1 or args.time_budget is not None):
+        parser.error('--monorepo and --package analyze a single repository without --time-budget')
+    
+    if args.file_metrics and not args.export:
+        parser.error('--file-metrics is written alongside --export')
+    
     if not args.quiet:
         print_banner()
     
+    worker_pool = None
+    store = None
     try:
-        mirror = RepositoryMirror(github_token=args.token)
+        result_cache = None
+        if args.cache_dir and not args.no_cache:
+            result_cache = ResultCache(args.cache_dir)
         
-        analysis = mirror.analyze(args.repo_url)
+        mirror_store = None
+        if args.mirrors:
+            from mirror_store import MirrorStore
+            mirror_store = MirrorStore(args.mirrors)
         
-        output = mirror.generate_output(analysis)
+        shared = len(args.repo_urls) > 1 or args.monorepo or len(args.package or []) > 1
+        worker_pool = make_worker_pool(args, shared=shared)
+        mirror = RepositoryMirror(github_token=args.token, result_cache=result_cache, mirror_store=mirror_store,
+                                  worker_pool=worker_pool)
         
-        if args.output:
+        if result_cache is not None and args.invalidate_cache:
+            for repo_url in args.repo_urls:
+                if args.local:
+                    owner, repo_name = local_identity(repo_url)
+                else:
+                    owner, repo_name = mirror.github_client.parse_repo_url(repo_url)
+                removed = result_cache.invalidate(owner, repo_name)
+                if not args.quiet:
+                    print(f"Invalidated {removed} cached result(s) for {owner}/{repo_name}")
+        
+        if args.store:
+            from result_store import ResultStore
+            store = ResultStore(args.store)
+        
+        def save_output(output):
             with open(args.output, 'w', encoding='utf-8') as f:
                 json.dump(output, f, indent=2, ensure_ascii=False)
+        
+        if len(args.repo_urls) > 1:
+            from batch_runner import BatchRunner
+            
+            runner = BatchRunner(mirror, store=store)
+            results = runner.run(
+                args.repo_urls, local=args.local, schedule=not args.no_schedule, prefetch=args.prefetch,
+                record_files=bool(args.file_metrics)
+            )
+            
+            if args.export:
+                export_columnar(args, [result['analysis'] for result in results if result['analysis']])
+            
+            if args.output:
+                save_output([
+                    {key: value for key, value in result.items() if key != 'analysis'}
+                    for result in results
+                ])
+                if not args.quiet:
+                    print(f"\nResults saved to: {args.output}")
+            
+            if not args.quiet:
+                print(f"\n{'='*70}")
+                print(f"BATCH RESULTS")
+                print(f"{'='*70}")
+                for result in results:
+                    if result['error']:
+                        print(f"  {result['url']:50s} ERROR: {result['error']}")
+                    else:
+                        print(f"  {result['url']:50s} {result['output']['score']:6.2f}  {result['output']['tier']:12s} "
+                              f"{result['seconds']:7.1f}s")
+                
+                stats = runner.stats
+                print(f"\n  {stats['repositories']} repositories in {stats['wall_seconds']:.1f}s")
+                for label in ('turnaround', 'runtime'):
+                    latency = '  '.join(f"{name} {value:.1f}s" for name, value in stats[label].items())
+                    print(f"  {label:12s} {latency}")
+                if 'prefetch' in stats:
+                    prefetch = stats['prefetch']
+                    print(f"  {'prefetch':12s} queue {prefetch['mean_queue_occupancy']:.1f}/{prefetch['depth']}  "
+                          f"empty {prefetch['empty_queue_ratio']:.0%}  "
+                          f"analyzer idle {prefetch['analyzer_idle_seconds']:.1f}s  "
+                          f"prefetch blocked {prefetch['prefetch_blocked_seconds']:.1f}s")
+                if worker_pool is not None:
+                    pool = worker_pool.stats
+                    print(f"  {'workers':12s} {worker_pool.size} processes  {pool['tasks']} tasks  "
+                          f"spawned {pool['spawned']}  recycled {pool['recycled']}  died {pool['died']} "
+                          f"({pool['killed_for_memory']} over memory limit)")
+            
+            return 0 if all(result['error'] is None for result in results) else 1
+        
+        repo_url = args.repo_urls[0]
+        
+        if args.monorepo or args.package:
+            monorepo = mirror.analyze_monorepo(
+                repo_url,
+                packages=args.package,
+                local=args.local,
+                sample_files=args.sample_files,
+                sample_budget=args.sample_budget,
+                sample_seed=args.sample_seed,
+                record_files=bool(args.file_metrics)
+            )
+            output = mirror.generate_monorepo_output(monorepo)
+            
+            if store is not None and not args.quiet:
+                print("Package results are not added to the result store; see --output or --export")
+            
+            if args.export:
+                export_columnar(args, list(monorepo.packages.values()))
+            
+            if args.output:
+                save_output(output)
+                if not args.quiet:
+                    print(f"\nResults saved to: {args.output}")
+            
+            if not args.quiet:
+                print_monorepo_summary(output)
+            return 0
+        
+        if args.time_budget is not None:
+            analysis = mirror.analyze_progressive(
+                repo_url,
+                args.time_budget,
+                on_result=(lambda result: save_output(mirror.generate_output(result))) if args.output else None,
+                sample_seed=args.sample_seed
+            )
+        else:
+            analyze = mirror.analyze_local if args.local else mirror.analyze
+            analysis = analyze(
+                repo_url,
+                sample_files=args.sample_files,
+                sample_budget=args.sample_budget,
+                sample_seed=args.sample_seed,
+                record_files=bool(args.file_metrics)
+            )
+        
+        output = mirror.generate_output(analysis)
+        
+        if store is not None:
+            store.add(analysis)
+        
+        if args.export:
+            export_columnar(args, [analysis])
+        
+        if args.output:
+            save_output(output)
             if not args.quiet:
                 print(f"\nResults saved to: {args.output}")
         
@@ -129,6 +610,12 @@ Environment Variables:
             import traceback
             traceback.print_exc()
         return 1
+    
+    finally:
+        if store is not None:
+            store.close()
+        if worker_pool is not None:
+            worker_pool.close()
 
 if __name__ == '__main__':
     sys.exit(main())
\ No newline at end of file
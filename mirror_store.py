@@ -0,0 +1,167 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+import subprocess
+from typing import Dict, List, Optional
+from github_client import repository_url
+from models import RepositoryMetadata
+from result_cache import _safe
+from config import MIRROR_STORE
+
+MIRROR_REFSPEC = '+refs/remotes/origin/*:refs/mirror/*'
+
+def _git(args: List[str], timeout: float = MIRROR_STORE['git_timeout'], input: str = None) -> subprocess.CompletedProcess:
+    return subprocess.run(['git'] + args, capture_output=True, text=True, timeout=timeout, input=input)
+
+def remote_tips(repo_url: str) -> List[str]:
+    try:
+        completed = _git(['ls-remote', '--', repo_url])
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    
+    if completed.returncode != 0:
+        return []
+    
+    tips = [line.split()[0] for line in completed.stdout.splitlines() if line.strip()]
+    return list(dict.fromkeys(tips))[:MIRROR_STORE['max_tips']]
+
+def root_commits(repo_path: str) -> List[str]:
+    try:
+        completed = _git(['-C', repo_path, 'rev-list', '--max-parents=0', '--all'])
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    
+    if completed.returncode != 0:
+        return []
+    return sorted(set(completed.stdout.split()))
+
+class MirrorStore:
+    def __init__(self, root: str = MIRROR_STORE['path']):
+        self.root = root
+        self.index_path = os.path.join(root, 'index.json')
+        self.lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        self.index = self._load_index()
+    
+    def _load_index(self) -> Dict[str, dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+    
+    def _key(self, owner: str, name: str) -> str:
+        return f"{owner.lower()}/{name.lower()}"
+    
+    def path_for(self, owner: str, name: str) -> str:
+        return os.path.join(self.root, _safe(owner.lower()), f"{_safe(name.lower())}.git")
+    
+    def has(self, owner: str, name: str) -> bool:
+        return self._key(owner, name) in self.index and os.path.isdir(self.path_for(owner, name))
+    
+    def _contains_any(self, mirror_path: str, shas: List[str]) -> bool:
+        try:
+            completed = _git(['-C', mirror_path, 'cat-file', '--batch-check'], input='\n'.join(shas) + '\n')
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+        return any(line and not line.endswith(' missing') for line in completed.stdout.splitlines())
+    
+    def find_reference(self, repo_url: str, owner: str, name: str,
+                       repo_metadata: RepositoryMetadata = None) -> Optional[str]:
+        if self.has(owner, name):
+            return self.path_for(owner, name)
+        
+        if repo_metadata is not None and repo_metadata.fork_source:
+            source_owner, _, source_name = repo_metadata.fork_source.partition('/')
+            if self.has(source_owner, source_name):
+                return self.path_for(source_owner, source_name)
+        
+        with self.lock:
+            entries = dict(self.index)
+        if not entries:
+            return None
+        
+        tips = remote_tips(repository_url(owner, name))
+        if not tips:
+            return None
+        
+        for key, entry in entries.items():
+            mirror_path = self.path_for(*key.split('/', 1))
+            if os.path.isdir(mirror_path) and self._contains_any(mirror_path, tips):
+                return mirror_path
+        return None
+    
+    def family_of(self, roots: List[str]) -> Optional[str]:
+        if not roots:
+            return None
+        
+        with self.lock:
+            entries = dict(self.index)
+        
+        for key, entry in entries.items():
+            if set(roots) & set(entry['roots']):
+                mirror_path = self.path_for(*key.split('/', 1))
+                if os.path.isdir(mirror_path):
+                    return mirror_path
+        return None
+    
+    def add(self, checkout_path: str, repo_url: str, owner: str, name: str, reference: str = None) -> Optional[str]:
+        mirror_path = self.path_for(owner, name)
+        roots = root_commits(checkout_path)
+        family = reference if reference and reference != mirror_path else self.family_of(roots)
+        
+        if os.path.isdir(mirror_path):
+            try:
+                completed = _git(['-C', mirror_path, 'fetch', '--quiet', checkout_path, MIRROR_REFSPEC])
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            if completed.returncode != 0:
+                return None
+        else:
+            os.makedirs(os.path.dirname(mirror_path), exist_ok=True)
+            staging = tempfile.mkdtemp(prefix='.staging_', dir=self.root)
+            command = ['clone', '--quiet', '--bare', '--no-local']
+            if family and family != mirror_path:
+                command.extend(['--reference', family])
+            command.extend(['--', checkout_path, staging])
+            
+            try:
+                completed = _git(command)
+            except (OSError, subprocess.TimeoutExpired):
+                shutil.rmtree(staging, ignore_errors=True)
+                return None
+            
+            if completed.returncode != 0:
+                shutil.rmtree(staging, ignore_errors=True)
+                return None
+            
+            _git(['-C', staging, 'config', 'gc.auto', '0'])
+            _git(['-C', staging, 'fetch', '--quiet', checkout_path, MIRROR_REFSPEC])
+            try:
+                os.rename(staging, mirror_path)
+            except OSError:
+                shutil.rmtree(staging, ignore_errors=True)
+                return None
+        
+        with self.lock:
+            self.index = self._load_index()
+            self.index[self._key(owner, name)] = {
+                'url': repo_url,
+                'roots': roots,
+                'alternate': family if family and family != mirror_path else None
+            }
+            self._save_index()
+        return mirror_path
+    
+    def disk_usage(self) -> int:
+        from repo_cloner import directory_size
+        
+        return directory_size(self.root)
\ No newline at end of file
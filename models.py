@@ -1,4 +1,5 @@
-from dataclasses import dataclass, field
+import re
+from dataclasses import dataclass, field, asdict
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -10,16 +11,26 @@ class RepositoryMetadata:
     default_branch: str
     created_at: datetime
     updated_at: datetime
-    stars: int
-    forks: int
-    open_issues: int
+    stars: Optional[int]
+    forks: Optional[int]
+    open_issues: Optional[int]
     size_kb: int
     primary_language: Optional[str]
     languages: Dict[str, int]
-    has_wiki: bool
-    has_issues: bool
-    has_projects: bool
-    archived: bool
+    has_wiki: Optional[bool]
+    has_issues: Optional[bool]
+    has_projects: Optional[bool]
+    archived: Optional[bool]
+    fork_source: Optional[str] = None
+
+@dataclass
+class ClonePlan:
+    strategy: str
+    reason: str
+    size_kb: Optional[int] = None
+    estimated_files: Optional[int] = None
+    depth: Optional[int] = None
+    paths: Optional[List[str]] = None
 
 @dataclass
 class FileStructure:
@@ -31,6 +42,8 @@ class FileStructure:
     key_files_present: Dict[str, bool]
     file_types: Dict[str, int]
     largest_files: List[tuple]
+    languages: Dict[str, int] = field(default_factory=dict)
+    size_quantiles: Dict[str, int] = field(default_factory=dict)
 
 @dataclass
 class CodeMetrics:
@@ -47,6 +60,19 @@ class CodeMetrics:
     avg_complexity: float
     max_complexity: int
     complexity_distribution: Dict[str, int]
+    sampling: Optional[Dict[str, any]] = None
+
+@dataclass
+class FileMetrics:
+    path: str
+    language: str
+    total_lines: int
+    code_lines: int
+    comment_lines: int
+    blank_lines: int
+    functions: int
+    avg_complexity: float
+    max_complexity: int
 
 @dataclass
 class GitMetrics:
@@ -62,6 +88,7 @@ class GitMetrics:
     merge_pr_ratio: float
     large_commits: int
     incremental_commits: int
+    commit_sizes_known: bool = True
 
 @dataclass
 class TestingMetrics:
@@ -82,6 +109,8 @@ class MaturityMetrics:
     deployment_tools: List[str]
     real_world_features: Dict[str, bool]
     error_handling_score: float
+    error_handling_constructs: Dict[str, int] = field(default_factory=dict)
+    error_handling_files_scanned: int = 0
 
 @dataclass
 class DimensionScore:
@@ -109,6 +138,37 @@ class AnalysisResult:
     strengths: List[str]
     weaknesses: List[str]
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    partial: bool = False
+    commit_sha: Optional[str] = None
+    file_metrics: List[FileMetrics] = field(default_factory=list)
+    clone_strategy: Optional[str] = None
+    package_path: Optional[str] = None
+    directory_tree: Optional[Dict[str, list]] = None
+
+@dataclass
+class PackageRollup:
+    packages: int
+    overall_score: float
+    tier: str
+    confidence: str
+    dimension_percentages: Dict[str, float]
+    total_files: int
+    code_files: int
+    total_lines: int
+    code_lines: int
+    strongest_package: Optional[str]
+    weakest_package: Optional[str]
+    partial: bool = False
+    unassigned_files: int = 0
+    unassigned_code_files: int = 0
+
+@dataclass
+class MonorepoAnalysis:
+    repository: RepositoryMetadata
+    packages: Dict[str, AnalysisResult]
+    rollup: PackageRollup
+    commit_sha: Optional[str] = None
+    clone_strategy: Optional[str] = None
 
 @dataclass
 class RoadmapItem:
@@ -127,4 +187,39 @@ class FinalOutput:
     strengths: List[str]
     weaknesses: List[str]
     roadmap: List[Dict[str, any]]
-    metadata: Dict[str, any]
\ No newline at end of file
+    metadata: Dict[str, any]
+
+def dimension_key(name: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+def _parse_datetime(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+def analysis_to_dict(analysis: AnalysisResult) -> Dict[str, any]:
+    data = asdict(analysis)
+    data['repository']['created_at'] = analysis.repository.created_at.isoformat()
+    data['repository']['updated_at'] = analysis.repository.updated_at.isoformat()
+    data['timestamp'] = analysis.timestamp.isoformat()
+    return data
+
+def analysis_from_dict(data: Dict[str, any]) -> AnalysisResult:
+    repository = dict(data['repository'])
+    repository['created_at'] = _parse_datetime(repository['created_at'])
+    repository['updated_at'] = _parse_datetime(repository['updated_at'])
+    
+    file_structure = dict(data['file_structure'])
+    file_structure['largest_files'] = [tuple(item) for item in file_structure['largest_files']]
+    
+    fields = dict(data)
+    fields.update(
+        repository=RepositoryMetadata(**repository),
+        file_structure=FileStructure(**file_structure),
+        code_metrics=CodeMetrics(**data['code_metrics']),
+        git_metrics=GitMetrics(**data['git_metrics']),
+        testing_metrics=TestingMetrics(**data['testing_metrics']),
+        maturity_metrics=MaturityMetrics(**data['maturity_metrics']),
+        dimension_scores=[DimensionScore(**score) for score in data['dimension_scores']],
+        file_metrics=[FileMetrics(**item) for item in data.get('file_metrics', [])],
+        timestamp=_parse_datetime(data['timestamp'])
+    )
+    return AnalysisResult(**fields)
\ No newline at end of file
@@ -0,0 +1,84 @@
+import os
+from typing import Dict, List, Sequence
+from models import AnalysisResult, PackageRollup
+from path_index import PathIndex
+from scoring_engine import ScoringEngine
+from config import MONOREPO, CODE_EXTENSIONS, EXCLUDED_EXTENSIONS
+
+CONFIDENCE_ORDER = ['Low', 'Medium', 'High']
+
+ALL_CODE_EXTENSIONS = {ext for exts in CODE_EXTENSIONS.values() for ext in exts}
+
+def detect_packages(path_index: PathIndex, max_packages: int = MONOREPO['max_packages']) -> List[str]:
+    ignored = set(MONOREPO['ignored_dirs'])
+    packages = []
+    
+    for root in path_index.package_roots:
+        if not root or ignored.intersection(root.split('/')):
+            continue
+        if any(root.startswith(f"{parent}/") for parent in packages):
+            continue
+        packages.append(root)
+    
+    return packages[:max_packages]
+
+def unassigned_files(path_index: PathIndex, packages: List[str]) -> List[str]:
+    if not packages or '' in packages:
+        return []
+    
+    prefixes = tuple(f"{package}/" for package in packages)
+    unassigned = []
+    for path in path_index.files:
+        relative = os.path.relpath(path, path_index.repo_path).replace(os.sep, '/')
+        if not relative.startswith(prefixes) and os.path.splitext(relative)[1] not in EXCLUDED_EXTENSIONS:
+            unassigned.append(relative)
+    return unassigned
+
+def rollup(packages: Dict[str, AnalysisResult], scoring_engine: ScoringEngine = None,
+           unassigned: Sequence[str] = ()) -> PackageRollup:
+    scoring_engine = scoring_engine or ScoringEngine()
+    weights = {path: max(result.code_metrics.code_lines, 1) for path, result in packages.items()}
+    total_weight = sum(weights.values())
+    
+    def weighted(value_of) -> float:
+        if not total_weight:
+            return 0.0
+        return sum(value_of(result) * weights[path] for path, result in packages.items()) / total_weight
+    
+    overall_score = round(weighted(lambda result: result.overall_score), 2)
+    
+    dimension_names = []
+    for result in packages.values():
+        for dim in result.dimension_scores:
+            if dim.name not in dimension_names:
+                dimension_names.append(dim.name)
+    
+    dimension_percentages = {
+        name: round(weighted(lambda result: next(
+            (dim.percentage for dim in result.dimension_scores if dim.name == name), 0.0
+        )), 3)
+        for name in dimension_names
+    }
+    
+    confidence_rank = round(weighted(lambda result: CONFIDENCE_ORDER.index(result.confidence)))
+    confidence = CONFIDENCE_ORDER[confidence_rank] if packages else 'Low'
+    partial = any(result.partial for result in packages.values())
+    
+    ranked = sorted(packages, key=lambda path: (packages[path].overall_score, path))
+    
+    return PackageRollup(
+        packages=len(packages),
+        overall_score=overall_score,
+        tier=scoring_engine.determine_tier(overall_score),
+        confidence=confidence,
+        dimension_percentages=dimension_percentages,
+        total_files=sum(result.file_structure.total_files for result in packages.values()),
+        code_files=sum(result.file_structure.total_code_files for result in packages.values()),
+        total_lines=sum(result.code_metrics.total_lines for result in packages.values()),
+        code_lines=sum(result.code_metrics.code_lines for result in packages.values()),
+        strongest_package=ranked[-1] if ranked else None,
+        weakest_package=ranked[0] if ranked else None,
+        partial=partial,
+        unassigned_files=len(unassigned),
+        unassigned_code_files=sum(os.path.splitext(path)[1] in ALL_CODE_EXTENSIONS for path in unassigned)
+    )
\ No newline at end of file
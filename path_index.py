@@ -0,0 +1,155 @@
+import os
+import re
+import time
+from collections import defaultdict
+from typing import Iterable, List, Set
+from config import EXCLUDED_DIRS, PACKAGE_MANAGERS, PACKAGE_ROOT_MAX_DEPTH
+
+MANIFEST_FILES = {name for names in PACKAGE_MANAGERS.values() for name in names}
+
+TOKEN_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+def tokenize(name: str) -> Set[str]:
+    return {token.lower() for token in TOKEN_PATTERN.findall(name)}
+
+class PathIndex:
+    def __init__(self, repo_path: str, recursive: bool = True, deadline: float = None):
+        self.repo_path = str(repo_path)
+        self.recursive = recursive
+        self.deadline = deadline
+        self.complete = True
+        self.files = []
+        self.dirs = []
+        self.names = set()
+        self.dir_paths = set()
+        self.file_tokens = defaultdict(set)
+        self.dir_tokens = defaultdict(set)
+        self.suffixes = defaultdict(list)
+        self.entries = defaultdict(dict)
+        self.folded_entries = defaultdict(dict)
+        self.package_roots = ['']
+        self._scan()
+    
+    def _scan(self):
+        if not self.recursive:
+            try:
+                with os.scandir(self.repo_path) as listing:
+                    for entry in listing:
+                        self._record('', entry.name, entry.is_dir())
+            except OSError:
+                pass
+            return
+        
+        for root, dirs, files in os.walk(self.repo_path):
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                self.complete = False
+                break
+            
+            relative_root = os.path.relpath(root, self.repo_path)
+            relative_root = '' if relative_root == '.' else relative_root.replace(os.sep, '/')
+            
+            for d in dirs:
+                self._record(relative_root, d, True)
+            
+            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
+            
+            for d in dirs:
+                self._add_dir(os.path.join(root, d), f"{relative_root}/{d}" if relative_root else d)
+            
+            for f in files:
+                self._record(relative_root, f, False)
+                self._add_file(os.path.join(root, f), f)
+            
+            if relative_root and relative_root.count('/') < PACKAGE_ROOT_MAX_DEPTH and \
+                    MANIFEST_FILES.intersection(files):
+                self.package_roots.append(relative_root)
+        
+        self.package_roots.sort()
+    
+    def _record(self, relative_root: str, name: str, is_dir: bool):
+        self.entries[relative_root][name] = is_dir
+        self.folded_entries[relative_root.lower()][name.lower()] = is_dir
+    
+    def _lookup(self, relative_path: str, case_sensitive: bool):
+        parent, _, name = relative_path.strip('/').rpartition('/')
+        if case_sensitive:
+            return self.entries.get(parent, {}).get(name)
+        return self.folded_entries.get(parent.lower(), {}).get(name.lower())
+    
+    def exists(self, relative_path: str, case_sensitive: bool = True) -> bool:
+        return self._lookup(relative_path, case_sensitive) is not None
+    
+    def is_dir(self, relative_path: str, case_sensitive: bool = True) -> bool:
+        return self._lookup(relative_path, case_sensitive) is True
+    
+    def find_in_package_roots(self, relative_path: str, case_sensitive: bool = True) -> List[str]:
+        return [
+            root for root in self.package_roots
+            if self.exists(f"{root}/{relative_path}" if root else relative_path, case_sensitive)
+        ]
+    
+    def _add_dir(self, path: str, relative: str):
+        index = len(self.dirs)
+        self.dirs.append(path)
+        
+        lowered = relative.lower()
+        parts = lowered.split('/')
+        self.names.add(parts[-1])
+        for start in range(len(parts)):
+            self.dir_paths.add('/'.join(parts[start:]))
+        
+        for token in tokenize(os.path.basename(path)):
+            self.dir_tokens[token].add(index)
+    
+    def _add_file(self, path: str, name: str):
+        index = len(self.files)
+        self.files.append(path)
+        self.names.add(name.lower())
+        self.suffixes[os.path.splitext(name)[1]].append(index)
+        
+        for token in tokenize(name):
+            self.file_tokens[token].add(index)
+    
+    def files_with_suffix(self, suffixes: Iterable[str]) -> List[str]:
+        indices = []
+        for suffix in suffixes:
+            indices.extend(self.suffixes.get(suffix, []))
+        return [self.files[i] for i in sorted(set(indices))]
+    
+    def dirs_with_token(self, tokens: Iterable[str]) -> Set[int]:
+        matches = set()
+        for token in tokens:
+            matches |= self.dir_tokens.get(token, set())
+        return matches
+    
+    def files_with_token(self, tokens: Iterable[str]) -> Set[int]:
+        matches = set()
+        for token in tokens:
+            matches |= self.file_tokens.get(token, set())
+        return matches
+    
+    def _has_all_tokens(self, postings: dict, tokens: Set[str]) -> bool:
+        matches = None
+        for token in tokens:
+            hits = postings.get(token)
+            if not hits:
+                return False
+            matches = hits if matches is None else matches & hits
+            if not matches:
+                return False
+        return bool(matches)
+    
+    def contains(self, indicator: str) -> bool:
+        normalized = indicator.lower().strip('/')
+        
+        if '/' in normalized:
+            return normalized in self.dir_paths
+        
+        if normalized in self.names:
+            return True
+        
+        tokens = tokenize(indicator)
+        if not tokens:
+            return False
+        
+        return self._has_all_tokens(self.dir_tokens, tokens) or self._has_all_tokens(self.file_tokens, tokens)
\ No newline at end of file
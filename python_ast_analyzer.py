@@ -0,0 +1,133 @@
+import ast
+import hashlib
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Dict, Optional
+from config import PYTHON_AST
+
+BRANCH_NODES = (ast.If, ast.IfExp, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler)
+TRY_NODES = tuple(getattr(ast, name) for name in ('Try', 'TryStar') if hasattr(ast, name))
+FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+DOCUMENTED_NODES = FUNCTION_NODES + (ast.ClassDef, ast.Module)
+LEAF_NODES = frozenset(
+    [ast.Name, ast.Constant, ast.alias] +
+    [leaf for base in (ast.operator, ast.unaryop, ast.cmpop, ast.boolop, ast.expr_context)
+     for leaf in base.__subclasses__()]
+)
+
+def _docstring_lines(node: ast.AST) -> range:
+    body = node.body
+    if body and isinstance(body[0], ast.Expr):
+        value = body[0].value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return range(body[0].lineno, body[0].end_lineno + 1)
+    return range(0)
+
+def walk_tree(tree: ast.AST) -> Dict:
+    complexities = []
+    function_lengths = []
+    function_lines = []
+    docstring_lines = set()
+    classes = 0
+    
+    stack = [(tree, -1)]
+    while stack:
+        node, owner = stack.pop()
+        node_type = type(node)
+        
+        if node_type in FUNCTION_NODES:
+            owner = len(complexities)
+            complexities.append(1)
+            function_lengths.append(node.end_lineno - node.lineno + 1)
+            function_lines.append(node.lineno)
+        elif node_type is ast.ClassDef:
+            classes += 1
+        elif owner >= 0:
+            if node_type in BRANCH_NODES:
+                complexities[owner] += 1
+            elif node_type is ast.BoolOp:
+                complexities[owner] += len(node.values) - 1
+            elif node_type is ast.comprehension:
+                complexities[owner] += 1 + len(node.ifs)
+            elif node_type in TRY_NODES and node.finalbody:
+                complexities[owner] += 1
+        
+        if node_type in DOCUMENTED_NODES:
+            docstring_lines.update(_docstring_lines(node))
+        
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, list):
+                for item in reversed(value):
+                    if type(item) not in LEAF_NODES and isinstance(item, ast.AST):
+                        stack.append((item, owner))
+            elif type(value) not in LEAF_NODES and isinstance(value, ast.AST):
+                stack.append((value, owner))
+    
+    return {
+        'complexities': complexities,
+        'function_lengths': function_lengths,
+        'function_lines': function_lines,
+        'classes': classes,
+        'docstring_lines': docstring_lines
+    }
+
+class PythonAstAnalyzer:
+    cache = OrderedDict()
+    cache_lock = threading.Lock()
+    
+    def __init__(self, cache_entries: int = PYTHON_AST['cache_entries']):
+        self.cache_entries = cache_entries
+    
+    def _parse(self, content: str) -> Optional[Dict]:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            try:
+                tree = ast.parse(content)
+            except (SyntaxError, ValueError, RecursionError, MemoryError):
+                return None
+        
+        walked = walk_tree(tree)
+        
+        lines = content.split('\n')
+        blank_lines = set()
+        comment_lines = walked.pop('docstring_lines')
+        for number, line in enumerate(lines, 1):
+            stripped = line.lstrip()
+            if not stripped:
+                blank_lines.add(number)
+            elif stripped[0] == '#':
+                comment_lines.add(number)
+        comment_lines -= blank_lines
+        
+        total = len(lines)
+        walked['line_counts'] = {
+            'total': total,
+            'code': total - len(blank_lines) - len(comment_lines),
+            'comment': len(comment_lines),
+            'blank': len(blank_lines)
+        }
+        return walked
+    
+    def analyze(self, content: str) -> Optional[Dict]:
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        
+        with self.cache_lock:
+            if digest in self.cache:
+                self.cache.move_to_end(digest)
+                return self.cache[digest]
+        
+        result = self._parse(content)
+        
+        if self.cache_entries:
+            with self.cache_lock:
+                self.cache[digest] = result
+                while len(self.cache) > self.cache_entries:
+                    self.cache.popitem(last=False)
+        return result
+    
+    @classmethod
+    def clear_cache(cls):
+        with cls.cache_lock:
+            cls.cache.clear()
\ No newline at end of file
@@ -1,45 +1,134 @@
 import os
+import time
+import signal
 import shutil
 import tempfile
+import subprocess
 from pathlib import Path
-from git import Repo, GitCommandError
+from typing import TYPE_CHECKING
+from models import ClonePlan
+from config import CLONE_ADMISSION
+
+if TYPE_CHECKING:
+    from git import Repo
+
+class CloneAborted(Exception):
+    pass
+
+class AdmissionRefused(Exception):
+    pass
+
+def directory_size(path: str) -> int:
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                continue
+    return total
 
 class RepositoryCloner:
-    def __init__(self, clone_dir: str = None):
+    def __init__(self, clone_dir: str = None, timeout: float = CLONE_ADMISSION['timeout'],
+                 max_disk_mb: int = CLONE_ADMISSION['max_disk_mb']):
+        self.owns_clone_dir = clone_dir is None
         self.clone_dir = clone_dir or tempfile.mkdtemp(prefix='repo_mirror_')
+        self.timeout = timeout
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024 if max_disk_mb else None
         self.repo_path = None
         self.git_repo = None
     
-    def clone(self, url: str, depth: int = 1) -> str:
-        try:
-            repo_name = url.rstrip('/').split('/')[-1].replace('.git', '')
-            self.repo_path = os.path.join(self.clone_dir, repo_name)
+    def clone_command(self, url: str, plan: ClonePlan, reference: str = None) -> list:
+        command = ['git', 'clone', '--quiet']
+        if reference:
+            command.extend(['--reference-if-able', reference])
+        if plan.strategy in ('blobless', 'shallow', 'sparse') or plan.paths:
+            command.append('--filter=blob:none')
+        if plan.depth:
+            command.extend(['--depth', str(plan.depth), '--no-single-branch'])
+        if plan.strategy == 'sparse' or plan.paths:
+            command.append('--sparse')
+        return command + ['--', url, self.repo_path]
+    
+    def clone(self, url: str, plan: ClonePlan = None, reference: str = None) -> str:
+        from git import Repo
+        
+        plan = plan or ClonePlan('full', 'no admission plan')
+        if plan.strategy == 'refuse':
+            raise AdmissionRefused(f"Refused to clone repository: {plan.reason}")
+        
+        repo_name = url.rstrip('/').split('/')[-1].replace('.git', '')
+        self.repo_path = os.path.join(self.clone_dir, repo_name)
+        
+        if os.path.exists(self.repo_path):
+            shutil.rmtree(self.repo_path)
+        
+        self._run(self.clone_command(url, plan, reference), "Failed to clone repository")
+        if plan.paths:
+            self._run(['git', '-C', self.repo_path, 'sparse-checkout', 'set', '--cone', '--'] + list(plan.paths),
+                      "Failed to check out package paths")
+        
+        self.git_repo = Repo(self.repo_path)
+        return self.repo_path
+    
+    def _run(self, command: list, failure: str):
+        with tempfile.TemporaryFile() as stderr:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=stderr,
+                start_new_session=True
+            )
+            self._supervise(process)
             
-            if os.path.exists(self.repo_path):
-                shutil.rmtree(self.repo_path)
+            if process.returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode('utf-8', 'replace').strip()
+                self.cleanup()
+                raise Exception(f"{failure}: {message}")
+    
+    def _supervise(self, process: subprocess.Popen):
+        started = time.monotonic()
+        next_disk_check = started
+        
+        while process.poll() is None:
+            now = time.monotonic()
             
-            self.git_repo = Repo.clone_from(
-                url,
-                self.repo_path,
-                depth=None
-            )
+            if self.timeout and now - started > self.timeout:
+                self._abort(process, f"clone did not finish within {self.timeout:.0f}s")
             
-            return self.repo_path
-        except GitCommandError as e:
-            raise Exception(f"Failed to clone repository: {str(e)}")
+            if self.max_disk_bytes and now >= next_disk_check:
+                next_disk_check = now + CLONE_ADMISSION['disk_check_interval']
+                used = directory_size(self.repo_path) if os.path.exists(self.repo_path) else 0
+                if used > self.max_disk_bytes:
+                    self._abort(process, f"clone exceeded {self.max_disk_bytes // (1024 * 1024)} MB on disk")
+            
+            try:
+                process.wait(timeout=CLONE_ADMISSION['poll_interval'])
+            except subprocess.TimeoutExpired:
+                pass
+    
+    def _abort(self, process: subprocess.Popen, reason: str):
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            process.kill()
+        process.wait()
+        self.cleanup()
+        raise CloneAborted(f"Clone aborted: {reason}")
     
     def get_repo_path(self) -> str:
         return self.repo_path
     
-    def get_git_repo(self) -> Repo:
+    def get_git_repo(self) -> 'Repo':
         return self.git_repo
     
     def cleanup(self):
-        if self.repo_path and os.path.exists(self.repo_path):
+        path = self.clone_dir if self.owns_clone_dir else self.repo_path
+        if path and os.path.exists(path):
             try:
-                shutil.rmtree(self.repo_path)
+                shutil.rmtree(path)
             except Exception as e:
-                print(f"Warning: Failed to cleanup directory {self.repo_path}: {e}")
+                print(f"Warning: Failed to cleanup directory {path}: {e}")
     
     def __enter__(self):
         return self
@@ -1,56 +1,631 @@
+import os
 import sys
+import time
+import threading
 from datetime import datetime
+from dataclasses import asdict, replace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
 from github_client import GitHubClient
-from repo_cloner import RepositoryCloner
+from repo_cloner import RepositoryCloner, AdmissionRefused, CloneAborted
 from structure_analyzer import StructureAnalyzer
 from code_analyzer import CodeAnalyzer
 from git_analyzer import GitAnalyzer
 from testing_maturity_analyzer import TestingMaturityAnalyzer
 from scoring_engine import ScoringEngine
 from insight_generator import InsightGenerator
-from models import AnalysisResult
+from file_sampler import FileSampler
+from path_index import PathIndex
+from admission import AdmissionController, DEGRADED_STRATEGIES
+from git_metadata import read_repository_metadata, repository_identity
+from language_stats import significant_languages
+from result_cache import ResultCache, resolve_head
+from mirror_store import MirrorStore
+from rollup_tree import DirectoryTree
+from worker_pool import WorkerPool
+from monorepo import detect_packages, unassigned_files, rollup
+from models import (AnalysisResult, ClonePlan, RepositoryMetadata, MonorepoAnalysis, FileStructure, CodeMetrics,
+                    GitMetrics, TestingMetrics, MaturityMetrics)
+from config import SAMPLING_DEFAULTS, PROGRESSIVE_ANALYSIS, MONOREPO, CLONE_ADMISSION
+
+class AnalysisCancelled(Exception):
+    pass
+
+class PreparedCheckout:
+    def __init__(self, repo_url: str, owner: str, repo_name: str, options: dict):
+        self.repo_url = repo_url
+        self.owner = owner
+        self.repo_name = repo_name
+        self.options = options
+        self.use_cache = False
+        self.cache_variant = ''
+        self.cached = None
+        self.repo_metadata = None
+        self.clone_plan = None
+        self.cloner = None
+        self.clone_seconds = 0.0
+    
+    def cleanup(self):
+        if self.cloner is not None:
+            self.cloner.cleanup()
+            self.cloner = None
 
 class RepositoryMirror:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, result_cache: ResultCache = None,
+                 scoring_engine: ScoringEngine = None, admission: AdmissionController = None,
+                 mirror_store: MirrorStore = None, worker_pool: WorkerPool = None):
         self.github_client = GitHubClient(github_token)
-        self.scoring_engine = ScoringEngine()
+        self.result_cache = result_cache
+        self.mirror_store = mirror_store
+        self.worker_pool = worker_pool
+        self.admission = admission or AdmissionController()
+        self.scoring_engine = scoring_engine or ScoringEngine()
         self.insight_generator = InsightGenerator()
     
-    def analyze(self, repo_url: str) -> AnalysisResult:
+    def _make_sampler(self, sample_files: int, sample_budget: float, sample_seed: int) -> FileSampler:
+        if sample_files is None and sample_budget is None:
+            return None
+        return FileSampler(target_files=sample_files, time_budget=sample_budget, seed=sample_seed)
+    
+    def _cache_variant(self, sample_files: int, sample_seed: int, record_files: bool) -> str:
+        variant = f"sample={sample_files}:{sample_seed}" if sample_files is not None else ''
+        return f"{variant}:files" if record_files else variant
+    
+    def _cache_key(self, owner: str, repo_name: str, commit_sha: str, variant: str) -> str:
+        return self.result_cache.make_key(owner, repo_name, commit_sha, variant, scoring_engine=self.scoring_engine)
+    
+    def _plan_clone(self, repo_metadata) -> ClonePlan:
+        clone_plan = self.admission.plan(repo_metadata)
+        if clone_plan.strategy == 'refuse':
+            raise AdmissionRefused(f"Refused to clone repository: {clone_plan.reason}")
+        
+        print(f"  Clone strategy: {clone_plan.strategy} ({clone_plan.reason})")
+        return clone_plan
+    
+    def _apply_languages(self, repo_metadata, file_structure) -> list:
+        repo_metadata.languages = file_structure.languages
+        if not repo_metadata.primary_language:
+            repo_metadata.primary_language = next(iter(file_structure.languages), None)
+        return significant_languages(file_structure.languages, repo_metadata.primary_language)
+    
+    def _checkpoint(self, cancel_event: threading.Event):
+        if cancel_event is not None and cancel_event.is_set():
+            raise AnalysisCancelled("Analysis cancelled")
+    
+    def prepare(self, repo_url: str, sample_files: int = None, sample_budget: float = None,
+                sample_seed: int = SAMPLING_DEFAULTS['seed'], record_files: bool = False,
+                cancel_event: threading.Event = None, repo_metadata: RepositoryMetadata = None) -> PreparedCheckout:
         print(f"Analyzing repository: {repo_url}")
         
         owner, repo_name = self.github_client.parse_repo_url(repo_url)
         print(f"  Owner: {owner}, Repository: {repo_name}")
         
+        prepared = PreparedCheckout(repo_url, owner, repo_name, dict(
+            sample_files=sample_files, sample_budget=sample_budget,
+            sample_seed=sample_seed, record_files=record_files
+        ))
+        
+        prepared.use_cache = self.result_cache is not None and sample_budget is None
+        prepared.cache_variant = self._cache_variant(sample_files, sample_seed, record_files)
+        if prepared.use_cache:
+            head_sha = resolve_head(owner, repo_name)
+            if head_sha:
+                prepared.cached = self.result_cache.get(
+                    self._cache_key(owner, repo_name, head_sha, prepared.cache_variant)
+                )
+                if prepared.cached is not None:
+                    print(f"Using cached result for {head_sha[:12]}")
+                    return prepared
+        
+        self._checkpoint(cancel_event)
+        
+        if repo_metadata is None:
+            print("Fetching repository metadata...")
+            repo_metadata = self.github_client.get_repository_metadata(owner, repo_name)
+        prepared.repo_metadata = repo_metadata
+        prepared.clone_plan = self._plan_clone(repo_metadata)
+        
+        reference = None
+        if self.mirror_store is not None:
+            reference = self.mirror_store.find_reference(repo_url, owner, repo_name, repo_metadata)
+        
+        prepared.cloner = RepositoryCloner()
+        via = f", objects from {reference}" if reference else ''
+        print(f"Cloning repository ({prepared.clone_plan.strategy}{via})...")
+        started = time.monotonic()
+        try:
+            prepared.cloner.clone(repo_url, prepared.clone_plan, reference)
+        except BaseException:
+            prepared.cleanup()
+            raise
+        prepared.clone_seconds = time.monotonic() - started
+        
+        if self.mirror_store is not None and prepared.clone_plan.strategy == 'full':
+            self.mirror_store.add(prepared.cloner.get_repo_path(), repo_url, owner, repo_name, reference)
+        return prepared
+    
+    def analyze_prepared(self, prepared: PreparedCheckout, cancel_event: threading.Event = None) -> AnalysisResult:
+        if prepared.cached is not None:
+            return prepared.cached
+        
+        analysis = self._analyze_checkout(
+            prepared.cloner.get_repo_path(), prepared.cloner.get_git_repo(), prepared.repo_metadata,
+            cancel_event=cancel_event, clone_plan=prepared.clone_plan, **prepared.options
+        )
+        
+        if prepared.use_cache:
+            self.result_cache.put(
+                self._cache_key(prepared.owner, prepared.repo_name, analysis.commit_sha, prepared.cache_variant),
+                analysis
+            )
+        
+        print("Analysis complete!")
+        return analysis
+    
+    def analyze(self, repo_url: str, sample_files: int = None, sample_budget: float = None,
+                sample_seed: int = SAMPLING_DEFAULTS['seed'], record_files: bool = False,
+                cancel_event: threading.Event = None, repo_metadata: RepositoryMetadata = None) -> AnalysisResult:
+        prepared = self.prepare(
+            repo_url, sample_files=sample_files, sample_budget=sample_budget, sample_seed=sample_seed,
+            record_files=record_files, cancel_event=cancel_event, repo_metadata=repo_metadata
+        )
+        try:
+            return self.analyze_prepared(prepared, cancel_event)
+        finally:
+            prepared.cleanup()
+    
+    def _analyze_checkout(self, repo_path: str, git_repo, repo_metadata, path_index: PathIndex = None,
+                          sample_files: int = None, sample_budget: float = None,
+                          sample_seed: int = SAMPLING_DEFAULTS['seed'], record_files: bool = False,
+                          cancel_event: threading.Event = None, clone_plan: ClonePlan = None,
+                          package_path: str = None) -> AnalysisResult:
+        commit_sha = git_repo.head.commit.hexsha
+        git_paths = None
+        if package_path:
+            repo_path = os.path.join(repo_path, package_path)
+            git_paths = [package_path]
+        path_index = path_index or PathIndex(repo_path)
+        
+        self._checkpoint(cancel_event)
+        
+        print("Analyzing file structure...")
+        structure_analyzer = StructureAnalyzer(repo_path, path_index)
+        file_structure = structure_analyzer.analyze()
+        languages = self._apply_languages(repo_metadata, file_structure)
+        
+        self._checkpoint(cancel_event)
+        
+        print("Analyzing code metrics...")
+        code_analyzer = CodeAnalyzer(
+            repo_path,
+            repo_metadata.primary_language,
+            sampler=self._make_sampler(sample_files, sample_budget, sample_seed),
+            record_files=record_files,
+            languages=languages,
+            worker_pool=self.worker_pool,
+            directory_tree=structure_analyzer.directory_tree
+        )
+        code_metrics = code_analyzer.analyze()
+        
+        self._checkpoint(cancel_event)
+        
+        print("Analyzing git history...")
+        git_analyzer = GitAnalyzer(git_repo, worker_pool=self.worker_pool, paths=git_paths)
+        git_metrics = git_analyzer.analyze()
+        
+        self._checkpoint(cancel_event)
+        
+        print("Analyzing testing and maturity...")
+        test_maturity_analyzer = TestingMaturityAnalyzer(
+            repo_path, 
+            repo_metadata.primary_language,
+            sampler=self._make_sampler(sample_files, sample_budget, sample_seed),
+            path_index=path_index,
+            worker_pool=self.worker_pool
+        )
+        testing_metrics = test_maturity_analyzer.analyze_testing()
+        maturity_metrics = test_maturity_analyzer.analyze_maturity()
+        
+        self._checkpoint(cancel_event)
+        
+        print("Calculating scores...")
+        degraded = clone_plan is not None and clone_plan.strategy in DEGRADED_STRATEGIES
+        workers_lost = not (code_analyzer.complete and git_analyzer.size_complete and test_maturity_analyzer.complete)
+        analysis = self.build_result(
+            repo_metadata, file_structure, code_metrics,
+            git_metrics, testing_metrics, maturity_metrics,
+            partial=degraded or workers_lost
+        )
+        analysis.commit_sha = commit_sha
+        analysis.file_metrics = code_analyzer.file_metrics
+        analysis.clone_strategy = clone_plan.strategy if clone_plan else None
+        analysis.package_path = package_path or None
+        analysis.directory_tree = structure_analyzer.directory_tree.to_dict()
+        return analysis
+    
+    def analyze_local(self, path: str, sample_files: int = None, sample_budget: float = None,
+                      sample_seed: int = SAMPLING_DEFAULTS['seed'], record_files: bool = False,
+                      cancel_event: threading.Event = None) -> AnalysisResult:
+        from git import Repo, InvalidGitRepositoryError, NoSuchPathError
+        
+        print(f"Analyzing local repository: {path}")
+        
+        try:
+            git_repo = Repo(path)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            raise Exception(f"Not a git repository: {path}")
+        
+        owner, repo_name, _ = repository_identity(git_repo)
+        commit_sha = git_repo.head.commit.hexsha
+        print(f"  Owner: {owner}, Repository: {repo_name}, Commit: {commit_sha[:12]}")
+        
+        use_cache = self.result_cache is not None and sample_budget is None
+        cache_variant = self._cache_variant(sample_files, sample_seed, record_files)
+        if not git_repo.bare and git_repo.is_dirty(untracked_files=True):
+            use_cache = False
+        
+        if use_cache:
+            cached = self.result_cache.get(
+                self._cache_key(owner, repo_name, commit_sha, cache_variant)
+            )
+            if cached is not None:
+                print(f"Using cached result for {commit_sha[:12]}")
+                return cached
+        
+        options = dict(
+            sample_files=sample_files, sample_budget=sample_budget, sample_seed=sample_seed,
+            record_files=record_files, cancel_event=cancel_event
+        )
+        
+        repo_metadata = read_repository_metadata(git_repo)
+        
+        if git_repo.bare:
+            with RepositoryCloner() as cloner:
+                print("Checking out bare repository...")
+                repo_path = cloner.clone(git_repo.git_dir)
+                analysis = self._analyze_checkout(repo_path, cloner.get_git_repo(), repo_metadata, **options)
+        else:
+            analysis = self._analyze_checkout(git_repo.working_tree_dir, git_repo, repo_metadata, **options)
+        
+        if use_cache:
+            self.result_cache.put(
+                self._cache_key(owner, repo_name, commit_sha, cache_variant),
+                analysis
+            )
+        
+        print("Analysis complete!")
+        return analysis
+    
+    def analyze_packages(self, repo_path: str, repo_metadata: RepositoryMetadata, packages: List[str],
+                         clone_plan: ClonePlan = None, cache_identity: tuple = None,
+                         **options) -> Dict[str, AnalysisResult]:
+        from git import Repo
+        
+        cache_variant = self._cache_variant(options.get('sample_files'), options.get('sample_seed'),
+                                            options.get('record_files'))
+        use_cache = self.result_cache is not None and cache_identity is not None and options.get('sample_budget') is None
+        
+        def analyze_package(package_path: str) -> AnalysisResult:
+            cache_key = None
+            if use_cache:
+                cache_key = self._cache_key(*cache_identity, f"{cache_variant}:package={package_path}")
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    print(f"Using cached result for package {package_path or '.'}")
+                    return cached
+            
+            print(f"Analyzing package: {package_path or '.'}")
+            package_metadata = replace(repo_metadata, primary_language=None, languages={})
+            git_repo = Repo(repo_path)
+            try:
+                analysis = self._analyze_checkout(
+                    repo_path, git_repo, package_metadata, clone_plan=clone_plan, package_path=package_path,
+                    **options
+                )
+            finally:
+                git_repo.close()
+            
+            if cache_key is not None:
+                self.result_cache.put(cache_key, analysis)
+            return analysis
+        
+        with ThreadPoolExecutor(max_workers=MONOREPO['parallel_packages'], thread_name_prefix='package') as executor:
+            futures = {package_path: executor.submit(analyze_package, package_path) for package_path in packages}
+            return {package_path: future.result() for package_path, future in futures.items()}
+    
+    def _analyze_monorepo_checkout(self, repo_path: str, repo_metadata: RepositoryMetadata, commit_sha: str,
+                                   packages: List[str], clone_plan: ClonePlan = None, cache_identity: tuple = None,
+                                   **options) -> MonorepoAnalysis:
+        unassigned = []
+        if packages:
+            for package_path in packages:
+                if not os.path.isdir(os.path.join(repo_path, package_path)):
+                    raise Exception(f"Package path not found: {package_path}")
+        else:
+            path_index = PathIndex(repo_path)
+            packages = detect_packages(path_index)
+            print(f"  Found {len(packages)} package(s)" + (f": {', '.join(packages)}" if packages else
+                                                          "; analyzing the repository as one package"))
+            packages = packages or ['']
+            unassigned = unassigned_files(path_index, packages)
+            if unassigned:
+                print(f"  {len(unassigned)} file(s) outside every package are not analyzed")
+        
+        results = self.analyze_packages(
+            repo_path, repo_metadata, packages, clone_plan=clone_plan, cache_identity=cache_identity, **options
+        )
+        
+        print("Analysis complete!")
+        return MonorepoAnalysis(
+            repository=repo_metadata,
+            packages=results,
+            rollup=rollup(results, self.scoring_engine, unassigned),
+            commit_sha=commit_sha,
+            clone_strategy=clone_plan.strategy if clone_plan else None
+        )
+    
+    def analyze_monorepo(self, repo_url: str, packages: List[str] = None, local: bool = False,
+                         sample_files: int = None, sample_budget: float = None,
+                         sample_seed: int = SAMPLING_DEFAULTS['seed'], record_files: bool = False,
+                         cancel_event: threading.Event = None) -> MonorepoAnalysis:
+        options = dict(
+            sample_files=sample_files, sample_budget=sample_budget, sample_seed=sample_seed,
+            record_files=record_files, cancel_event=cancel_event
+        )
+        packages = [package.strip('/') for package in packages if package.strip('/')] if packages else None
+        
+        if local:
+            from git import Repo, InvalidGitRepositoryError, NoSuchPathError
+            
+            print(f"Analyzing local monorepo: {repo_url}")
+            try:
+                git_repo = Repo(repo_url)
+            except (InvalidGitRepositoryError, NoSuchPathError):
+                raise Exception(f"Not a git repository: {repo_url}")
+            
+            owner, repo_name, _ = repository_identity(git_repo)
+            commit_sha = git_repo.head.commit.hexsha
+            repo_metadata = read_repository_metadata(git_repo)
+            cache_identity = (owner, repo_name, commit_sha)
+            if not git_repo.bare and git_repo.is_dirty(untracked_files=True):
+                cache_identity = None
+            
+            if not git_repo.bare:
+                return self._analyze_monorepo_checkout(
+                    git_repo.working_tree_dir, repo_metadata, commit_sha, packages,
+                    cache_identity=cache_identity, **options
+                )
+            
+            with RepositoryCloner() as cloner:
+                print("Checking out bare repository...")
+                repo_path = cloner.clone(git_repo.git_dir)
+                return self._analyze_monorepo_checkout(
+                    repo_path, repo_metadata, commit_sha, packages, cache_identity=cache_identity, **options
+                )
+        
+        print(f"Analyzing monorepo: {repo_url}")
+        owner, repo_name = self.github_client.parse_repo_url(repo_url)
+        print(f"  Owner: {owner}, Repository: {repo_name}")
+        
+        self._checkpoint(cancel_event)
+        
         print("Fetching repository metadata...")
         repo_metadata = self.github_client.get_repository_metadata(owner, repo_name)
+        clone_plan = self._plan_clone(repo_metadata)
+        if packages:
+            clone_plan = replace(clone_plan, paths=packages)
+        
+        reference = None
+        if self.mirror_store is not None:
+            reference = self.mirror_store.find_reference(repo_url, owner, repo_name, repo_metadata)
         
         with RepositoryCloner() as cloner:
-            print("Cloning repository...")
-            repo_path = cloner.clone(repo_url)
+            only = f", packages {', '.join(packages)} only" if packages else ''
+            print(f"Cloning repository ({clone_plan.strategy}{only})...")
+            repo_path = cloner.clone(repo_url, clone_plan, reference)
+            commit_sha = cloner.get_git_repo().head.commit.hexsha
+            return self._analyze_monorepo_checkout(
+                repo_path, repo_metadata, commit_sha, packages, clone_plan=clone_plan,
+                cache_identity=(owner, repo_name, commit_sha), **options
+            )
+    
+    def analyze_progressive(self, repo_url: str, time_budget: float,
+                            on_result: Callable[[AnalysisResult], None] = None,
+                            sample_seed: int = SAMPLING_DEFAULTS['seed']) -> AnalysisResult:
+        deadline = time.monotonic() + time_budget
+        print(f"Analyzing repository: {repo_url} (time budget: {time_budget:.0f}s)")
+        
+        owner, repo_name = self.github_client.parse_repo_url(repo_url)
+        repo_metadata = self.github_client.get_repository_metadata(owner, repo_name)
+        
+        best = None
+        
+        clone_plan = self._plan_clone(repo_metadata)
+        degraded = clone_plan.strategy in DEGRADED_STRATEGIES
+        
+        def metadata_only(commit_sha: str = None) -> AnalysisResult:
+            print("Time budget reached before the first estimate, returning repository metadata only.")
+            result = self.metadata_only_result(repo_metadata)
+            result.commit_sha = commit_sha
+            result.clone_strategy = clone_plan.strategy
+            if on_result:
+                on_result(result)
+            return result
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return metadata_only()
+        
+        with RepositoryCloner(timeout=min(CLONE_ADMISSION['timeout'], remaining)) as cloner:
+            print(f"Cloning repository ({clone_plan.strategy})...")
+            try:
+                repo_path = cloner.clone(repo_url, clone_plan)
+            except CloneAborted:
+                if time.monotonic() < deadline:
+                    raise
+                return metadata_only()
             git_repo = cloner.get_git_repo()
+            commit_sha = git_repo.head.commit.hexsha
             
-            print("Analyzing file structure...")
-            structure_analyzer = StructureAnalyzer(repo_path)
+            print("Building quick estimate...")
+            path_index = PathIndex(repo_path, deadline=deadline)
+            structure_analyzer = StructureAnalyzer(repo_path, path_index, deadline=deadline)
             file_structure = structure_analyzer.analyze()
+            if not (path_index.complete and structure_analyzer.complete):
+                return metadata_only(commit_sha)
+            languages = self._apply_languages(repo_metadata, file_structure)
             
-            print("Analyzing code metrics...")
-            code_analyzer = CodeAnalyzer(repo_path, repo_metadata.primary_language)
-            code_metrics = code_analyzer.analyze()
+            sample_files = PROGRESSIVE_ANALYSIS['initial_sample_files']
             
-            print("Analyzing git history...")
-            git_analyzer = GitAnalyzer(git_repo)
-            git_metrics = git_analyzer.analyze()
-            
-            print("Analyzing testing and maturity...")
             test_maturity_analyzer = TestingMaturityAnalyzer(
-                repo_path, 
-                repo_metadata.primary_language
+                repo_path,
+                repo_metadata.primary_language,
+                path_index=path_index,
+                worker_pool=self.worker_pool
             )
             testing_metrics = test_maturity_analyzer.analyze_testing()
-            maturity_metrics = test_maturity_analyzer.analyze_maturity()
+            
+            git_analyzer = GitAnalyzer(git_repo, max_commits=PROGRESSIVE_ANALYSIS['initial_max_commits'],
+                                       time_budget=max(deadline - time.monotonic(), 0),
+                                       worker_pool=self.worker_pool)
+            git_metrics = git_analyzer.analyze()
+            
+            def publish(code_metrics, code_complete, directory_tree):
+                result = self.build_result(
+                    repo_metadata, file_structure, code_metrics,
+                    git_metrics, testing_metrics, maturity_metrics,
+                    partial=degraded or not (code_complete and git_analyzer.complete and git_analyzer.size_complete
+                                             and test_maturity_analyzer.complete)
+                )
+                result.commit_sha = commit_sha
+                result.clone_strategy = clone_plan.strategy
+                result.directory_tree = directory_tree.to_dict()
+                print(f"  Refined score: {result.overall_score} "
+                      f"({code_metrics.files_analyzed} code files, confidence {result.confidence})")
+                if on_result:
+                    on_result(result)
+                return result
+            
+            while True:
+                remaining = max(deadline - time.monotonic(), 0)
+                test_maturity_analyzer.sampler = FileSampler(
+                    target_files=sample_files, time_budget=remaining / 4, seed=sample_seed
+                )
+                maturity_metrics = test_maturity_analyzer.analyze_maturity()
+                
+                remaining = max(deadline - time.monotonic(), 0)
+                sampler = FileSampler(target_files=sample_files, time_budget=remaining, seed=sample_seed)
+                directory_tree = DirectoryTree.from_dict(structure_analyzer.directory_tree.to_dict())
+                code_analyzer = CodeAnalyzer(
+                    repo_path,
+                    repo_metadata.primary_language,
+                    sampler=sampler,
+                    languages=languages,
+                    worker_pool=self.worker_pool,
+                    directory_tree=directory_tree
+                )
+                code_metrics = code_analyzer.analyze()
+                code_complete = (sample_files >= code_metrics.sampling['population'] and not sampler.expired()
+                                 and code_analyzer.complete)
+                
+                if best is None or code_metrics.files_analyzed > best.code_metrics.files_analyzed:
+                    best = publish(code_metrics, code_complete, directory_tree)
+                    best_complete = code_complete
+                    best_tree = directory_tree
+                
+                if code_complete or time.monotonic() >= deadline:
+                    break
+                
+                sample_files *= PROGRESSIVE_ANALYSIS['sample_growth']
+            
+            if not git_analyzer.complete and time.monotonic() < deadline:
+                git_analyzer = GitAnalyzer(git_repo, time_budget=deadline - time.monotonic(),
+                                           worker_pool=self.worker_pool)
+                git_metrics = git_analyzer.analyze()
+                best = publish(best.code_metrics, best_complete, best_tree)
         
-        print("Calculating scores...")
+        print("Analysis complete!" if not best.partial else "Time budget reached, returning best estimate.")
+        return best
+    
+    def metadata_only_result(self, repo_metadata: RepositoryMetadata) -> AnalysisResult:
+        file_structure = FileStructure(
+            total_files=0,
+            total_code_files=0,
+            max_depth=0,
+            avg_depth=0,
+            directories=0,
+            key_files_present={},
+            file_types={},
+            largest_files=[]
+        )
+        code_metrics = CodeMetrics(
+            total_lines=0,
+            code_lines=0,
+            comment_lines=0,
+            blank_lines=0,
+            avg_file_length=0,
+            avg_function_length=0,
+            comment_ratio=0,
+            files_analyzed=0,
+            functions_count=0,
+            classes_count=0,
+            avg_complexity=0,
+            max_complexity=0,
+            complexity_distribution={}
+        )
+        git_metrics = GitMetrics(
+            total_commits=0,
+            unique_authors=0,
+            avg_commits_per_week=0,
+            commit_frequency_trend='unknown',
+            avg_commit_message_length=0,
+            good_commit_messages=0,
+            poor_commit_messages=0,
+            total_branches=0,
+            total_prs=0,
+            merge_pr_ratio=0,
+            large_commits=0,
+            incremental_commits=0
+        )
+        testing_metrics = TestingMetrics(
+            has_test_directory=False,
+            test_files_count=0,
+            test_to_code_ratio=0,
+            has_ci_cd=False,
+            ci_cd_tools=[],
+            has_linter_config=False,
+            linter_tools=[]
+        )
+        maturity_metrics = MaturityMetrics(
+            has_package_manager=False,
+            package_managers=[],
+            has_config_example=False,
+            has_deployment_config=False,
+            deployment_tools=[],
+            real_world_features={},
+            error_handling_score=0
+        )
+        return self.build_result(
+            repo_metadata, file_structure, code_metrics,
+            git_metrics, testing_metrics, maturity_metrics,
+            partial=True
+        )
+    
+    def rescore(self, analysis: AnalysisResult) -> AnalysisResult:
+        result = self.build_result(
+            analysis.repository, analysis.file_structure, analysis.code_metrics,
+            analysis.git_metrics, analysis.testing_metrics, analysis.maturity_metrics,
+            partial=analysis.partial
+        )
+        result.timestamp = analysis.timestamp
+        result.commit_sha = analysis.commit_sha
+        result.clone_strategy = analysis.clone_strategy
+        result.package_path = analysis.package_path
+        result.directory_tree = analysis.directory_tree
+        return result
+    
+    def build_result(self, repo_metadata, file_structure, code_metrics, git_metrics,
+                     testing_metrics, maturity_metrics, partial: bool = False) -> AnalysisResult:
         dimension_scores = []
         
         code_quality_score = self.scoring_engine.score_code_quality(code_metrics)
@@ -77,12 +652,15 @@ class RepositoryMirror:
         
         overall_score = self.scoring_engine.calculate_overall_score(dimension_scores)
         tier = self.scoring_engine.determine_tier(overall_score)
+        sampling_error = code_metrics.sampling['sampling_error'] if code_metrics.sampling else 0.0
         confidence = self.scoring_engine.determine_confidence(
             file_structure.total_files,
-            git_metrics.total_commits
+            git_metrics.total_commits,
+            sampling_error
         )
+        if partial:
+            confidence = self.scoring_engine.lower_confidence(confidence)
         
-        print("Generating insights...")
         analysis = AnalysisResult(
             repository=repo_metadata,
             file_structure=file_structure,
@@ -95,15 +673,35 @@ class RepositoryMirror:
             tier=tier,
             confidence=confidence,
             strengths=[],
-            weaknesses=[]
+            weaknesses=[],
+            partial=partial
         )
         
         analysis.strengths = self.insight_generator.generate_strengths(analysis)
         analysis.weaknesses = self.insight_generator.generate_weaknesses(analysis)
         
-        print("Analysis complete!")
         return analysis
     
+    def generate_monorepo_output(self, monorepo: MonorepoAnalysis) -> dict:
+        return {
+            "rollup": asdict(monorepo.rollup),
+            "packages": {
+                package_path or '.': self.generate_output(analysis)
+                for package_path, analysis in monorepo.packages.items()
+            },
+            "metadata": {
+                "repository": {
+                    "name": monorepo.repository.name,
+                    "owner": monorepo.repository.owner,
+                    "url": monorepo.repository.url,
+                    "stars": monorepo.repository.stars,
+                    "forks": monorepo.repository.forks
+                },
+                "commit_sha": monorepo.commit_sha,
+                "clone_strategy": monorepo.clone_strategy
+            }
+        }
+    
     def generate_output(self, analysis: AnalysisResult) -> dict:
         summary = self.insight_generator.generate_summary(analysis)
         roadmap_items = self.insight_generator.generate_roadmap(analysis)
@@ -151,12 +749,20 @@ class RepositoryMirror:
                 "metrics": {
                     "total_files": analysis.file_structure.total_files,
                     "code_files": analysis.file_structure.total_code_files,
+                    "file_size_quantiles": analysis.file_structure.size_quantiles,
                     "total_commits": analysis.git_metrics.total_commits,
                     "total_lines": analysis.code_metrics.total_lines,
                     "functions": analysis.code_metrics.functions_count,
-                    "avg_complexity": analysis.code_metrics.avg_complexity
+                    "avg_complexity": analysis.code_metrics.avg_complexity,
+                    "error_handling_constructs": analysis.maturity_metrics.error_handling_constructs
                 },
                 "dimensions": dimension_details,
+                "sampling": analysis.code_metrics.sampling,
+                "partial": analysis.partial,
+                "clone_strategy": analysis.clone_strategy,
+                "package": analysis.package_path,
+                "directories": DirectoryTree.from_dict(analysis.directory_tree).drill_down()
+                if analysis.directory_tree else None,
                 "analyzed_at": analysis.timestamp.isoformat()
             }
         }
\ No newline at end of file
@@ -0,0 +1,169 @@
+import os
+import re
+import copy
+import json
+import hashlib
+import subprocess
+import threading
+from collections import OrderedDict
+from typing import Optional, TYPE_CHECKING
+import config
+from github_client import repository_url
+from models import AnalysisResult, analysis_to_dict, analysis_from_dict
+from config import ANALYZER_VERSION, RESULT_CACHE
+
+if TYPE_CHECKING:
+    from scoring_engine import ScoringEngine
+
+UNHASHED_SETTINGS = ('GITHUB_TOKEN', 'RESULT_CACHE', 'RESULT_STORE', 'COLUMNAR_EXPORT', 'SERVICE',
+                     'MIRROR_STORE', 'PREFETCH', 'WORKER_POOL', 'MONOREPO', 'BATCH_SCHEDULING')
+
+def config_hash(scoring_engine: 'ScoringEngine' = None) -> str:
+    settings = {
+        name: value for name, value in vars(config).items()
+        if name.isupper() and name not in UNHASHED_SETTINGS
+    }
+    if scoring_engine is not None:
+        settings.update(
+            SCORING_WEIGHTS=scoring_engine.weights,
+            TIER_THRESHOLDS=scoring_engine.tier_thresholds,
+            CONFIDENCE_THRESHOLDS=scoring_engine.confidence_thresholds
+        )
+    encoded = json.dumps(settings, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+def resolve_head(owner: str, repo_name: str, timeout: float = RESULT_CACHE['ls_remote_timeout']) -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ['git', 'ls-remote', '--', repository_url(owner, repo_name), 'HEAD'],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    
+    if completed.returncode != 0 or not completed.stdout.strip():
+        return None
+    
+    return completed.stdout.split()[0]
+
+def _safe(part: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', part)
+
+class ResultCache:
+    def __init__(self, cache_dir: str = RESULT_CACHE['directory'],
+                 max_entries: int = RESULT_CACHE['max_entries'],
+                 memory_entries: int = RESULT_CACHE['memory_entries']):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.memory = OrderedDict()
+        self.memory_lock = threading.Lock()
+        self.config_hash = config_hash()
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def make_key(self, owner: str, name: str, head_sha: str, variant: str = '',
+                 scoring_engine: 'ScoringEngine' = None) -> str:
+        settings = self.config_hash if scoring_engine is None else config_hash(scoring_engine)
+        parts = [_safe(owner.lower()), _safe(name.lower()), head_sha, settings, _safe(ANALYZER_VERSION)]
+        if variant:
+            parts.append(hashlib.sha256(variant.encode('utf-8')).hexdigest()[:12])
+        return '__'.join(parts)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, key: str) -> Optional[AnalysisResult]:
+        with self.memory_lock:
+            analysis = self.memory.get(key)
+            if analysis is not None:
+                self.memory.move_to_end(key)
+        
+        path = self._path(key)
+        if analysis is not None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return copy.deepcopy(analysis)
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                analysis = analysis_from_dict(json.load(f))
+            os.utime(path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        self._remember(key, copy.deepcopy(analysis))
+        return analysis
+    
+    def put(self, key: str, analysis: AnalysisResult):
+        path = self._path(key)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(analysis_to_dict(analysis), f, ensure_ascii=False)
+        os.replace(temp_path, path)
+        
+        self._remember(key, copy.deepcopy(analysis))
+        self._evict()
+    
+    def _remember(self, key: str, analysis: AnalysisResult):
+        with self.memory_lock:
+            self.memory[key] = analysis
+            self.memory.move_to_end(key)
+            while len(self.memory) > self.memory_entries:
+                self.memory.popitem(last=False)
+    
+    def _entries(self) -> list:
+        return [name for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+    
+    def _evict(self):
+        entries = self._entries()
+        if len(entries) <= self.max_entries:
+            return
+        
+        modified = []
+        for name in entries:
+            try:
+                modified.append((os.path.getmtime(os.path.join(self.cache_dir, name)), name))
+            except OSError:
+                continue
+        
+        modified.sort()
+        for _, name in modified[:len(modified) - self.max_entries]:
+            self._remove(name[:-len('.json')])
+    
+    def _remove(self, key: str):
+        with self.memory_lock:
+            self.memory.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+    
+    def results(self) -> list:
+        loaded = []
+        for entry in sorted(self._entries()):
+            analysis = self.get(entry[:-len('.json')])
+            if analysis is not None:
+                loaded.append(analysis)
+        return loaded
+    
+    def invalidate(self, owner: str, name: str = None) -> int:
+        prefix = f"{_safe(owner.lower())}__"
+        if name is not None:
+            prefix += f"{_safe(name.lower())}__"
+        
+        removed = 0
+        for entry in self._entries():
+            if entry.startswith(prefix):
+                self._remove(entry[:-len('.json')])
+                removed += 1
+        return removed
+    
+    def clear(self) -> int:
+        entries = self._entries()
+        for entry in entries:
+            self._remove(entry[:-len('.json')])
+        with self.memory_lock:
+            self.memory.clear()
+        return len(entries)
\ No newline at end of file
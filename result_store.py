@@ -0,0 +1,189 @@
+import json
+import sqlite3
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from models import AnalysisResult, analysis_to_dict, analysis_from_dict, dimension_key
+from config import ANALYZER_VERSION
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    commit_sha TEXT,
+    analyzed_at TEXT NOT NULL,
+    score REAL NOT NULL,
+    tier TEXT NOT NULL,
+    confidence TEXT NOT NULL,
+    partial INTEGER NOT NULL DEFAULT 0,
+    analyzer_version TEXT NOT NULL,
+    analysis_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_repo_time ON analyses (owner, name, analyzed_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_score ON analyses (score);
+CREATE TABLE IF NOT EXISTS dimension_scores (
+    analysis_id INTEGER NOT NULL REFERENCES analyses (id) ON DELETE CASCADE,
+    dimension TEXT NOT NULL,
+    score REAL NOT NULL,
+    percentage REAL NOT NULL,
+    weighted_score REAL NOT NULL,
+    PRIMARY KEY (analysis_id, dimension)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_dimension_rank ON dimension_scores (dimension, percentage);
+CREATE TABLE IF NOT EXISTS runtimes (
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    size_kb INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_runtimes_repo ON runtimes (owner, name, recorded_at);
+"""
+
+LATEST_IDS = """
+SELECT id FROM (
+    SELECT id, MAX(analyzed_at) FROM analyses
+    WHERE (:owner IS NULL OR owner = :owner)
+    GROUP BY owner, name
+)
+"""
+
+class ResultStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        self._normalize_dimensions()
+    
+    def _normalize_dimensions(self):
+        names = [row['dimension'] for row in self.connection.execute("SELECT DISTINCT dimension FROM dimension_scores")]
+        renamed = [(dimension_key(name), name) for name in names if dimension_key(name) != name]
+        if renamed:
+            with self.connection:
+                self.connection.executemany("UPDATE dimension_scores SET dimension = ? WHERE dimension = ?", renamed)
+    
+    def _insert(self, analysis: AnalysisResult) -> int:
+        existing = self.connection.execute(
+            "SELECT id FROM analyses WHERE owner = ? AND name = ? AND analyzed_at = ?",
+            (analysis.repository.owner, analysis.repository.name, analysis.timestamp.isoformat())
+        ).fetchone()
+        if existing:
+            return existing['id']
+        
+        cursor = self.connection.execute(
+            """
+            INSERT INTO analyses (owner, name, commit_sha, analyzed_at, score, tier,
+                                  confidence, partial, analyzer_version, analysis_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                analysis.repository.owner,
+                analysis.repository.name,
+                analysis.commit_sha,
+                analysis.timestamp.isoformat(),
+                analysis.overall_score,
+                analysis.tier,
+                analysis.confidence,
+                int(analysis.partial),
+                ANALYZER_VERSION,
+                json.dumps(analysis_to_dict(analysis), ensure_ascii=False)
+            )
+        )
+        analysis_id = cursor.lastrowid
+        
+        self.connection.executemany(
+            """
+            INSERT INTO dimension_scores (analysis_id, dimension, score, percentage, weighted_score)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (analysis_id, dimension_key(dim.name), dim.score, dim.percentage, dim.weighted_score)
+                for dim in analysis.dimension_scores
+            ]
+        )
+        return analysis_id
+    
+    def add(self, analysis: AnalysisResult) -> int:
+        with self.connection:
+            return self._insert(analysis)
+    
+    def add_many(self, analyses: Iterable[AnalysisResult]) -> List[int]:
+        with self.connection:
+            return [self._insert(analysis) for analysis in analyses]
+    
+    def latest_scores(self, owner: Optional[str] = None) -> List[Dict]:
+        rows = self.connection.execute(
+            f"""
+            SELECT id, owner, name, commit_sha, analyzed_at, score, tier, confidence, partial
+            FROM analyses WHERE id IN ({LATEST_IDS})
+            ORDER BY score DESC
+            """,
+            {'owner': owner}
+        )
+        return [dict(row) for row in rows]
+    
+    def history(self, owner: str, name: str) -> List[Dict]:
+        rows = self.connection.execute(
+            """
+            SELECT id, commit_sha, analyzed_at, score, tier, confidence, partial
+            FROM analyses WHERE owner = ? AND name = ?
+            ORDER BY analyzed_at
+            """,
+            (owner, name)
+        )
+        return [dict(row) for row in rows]
+    
+    def top_by_dimension(self, dimension: str, owner: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        rows = self.connection.execute(
+            f"""
+            SELECT a.id, a.owner, a.name, a.commit_sha, a.analyzed_at,
+                   d.score, d.percentage, d.weighted_score
+            FROM dimension_scores d JOIN analyses a ON a.id = d.analysis_id
+            WHERE d.dimension = :dimension AND a.id IN ({LATEST_IDS})
+            ORDER BY d.percentage DESC, a.score DESC
+            LIMIT :limit
+            """,
+            {'dimension': dimension_key(dimension), 'owner': owner, 'limit': limit}
+        )
+        return [dict(row) for row in rows]
+    
+    def record_runtimes(self, runtimes: Iterable[tuple]):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO runtimes (owner, name, recorded_at, seconds, size_kb) VALUES (?, ?, ?, ?, ?)",
+                runtimes
+            )
+    
+    def runtime_history(self) -> Dict[tuple, List[float]]:
+        history = defaultdict(list)
+        rows = self.connection.execute(
+            "SELECT owner, name, seconds FROM runtimes ORDER BY owner, name, recorded_at"
+        )
+        for row in rows:
+            history[(row['owner'].lower(), row['name'].lower())].append(row['seconds'])
+        return dict(history)
+    
+    def load(self, analysis_id: int) -> Optional[AnalysisResult]:
+        row = self.connection.execute(
+            "SELECT analysis_json FROM analyses WHERE id = ?", (analysis_id,)
+        ).fetchone()
+        return analysis_from_dict(json.loads(row['analysis_json'])) if row else None
+    
+    def load_latest(self, owner: Optional[str] = None) -> List[AnalysisResult]:
+        rows = self.connection.execute(
+            f"SELECT analysis_json FROM analyses WHERE id IN ({LATEST_IDS}) ORDER BY owner, name",
+            {'owner': owner}
+        )
+        return [analysis_from_dict(json.loads(row['analysis_json'])) for row in rows]
+    
+    def close(self):
+        self.connection.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
\ No newline at end of file
@@ -0,0 +1,166 @@
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+METRICS = ('files', 'code_files', 'bytes', 'lines', 'code_lines', 'functions', 'complexity')
+
+class DirectoryTree:
+    def __init__(self):
+        self.names = ['']
+        self.parent = array('q', [-1])
+        self.first_child = array('q', [-1])
+        self.next_sibling = array('q', [-1])
+        self.depth = array('q', [0])
+        self.own = {metric: array('q', [0]) for metric in METRICS}
+        self.own_max_complexity = array('q', [0])
+        self.total = None
+        self.max_complexity = None
+        self.index = {'': 0}
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    @property
+    def aggregated(self) -> bool:
+        return self.total is not None
+    
+    def directory(self, relative_dir: str) -> int:
+        relative_dir = '' if relative_dir in ('', '.') else relative_dir.strip('/')
+        node = self.index.get(relative_dir)
+        if node is not None:
+            return node
+        
+        parent_dir, _, name = relative_dir.rpartition('/')
+        parent = self.directory(parent_dir)
+        
+        node = len(self.names)
+        self.names.append(name)
+        self.parent.append(parent)
+        self.first_child.append(-1)
+        self.next_sibling.append(self.first_child[parent])
+        self.first_child[parent] = node
+        self.depth.append(self.depth[parent] + 1)
+        for metric in METRICS:
+            self.own[metric].append(0)
+        self.own_max_complexity.append(0)
+        if self.total is not None:
+            for metric in METRICS:
+                self.total[metric].append(0)
+            self.max_complexity.append(0)
+        
+        self.index[relative_dir] = node
+        return node
+    
+    def find(self, relative_dir: str) -> Optional[int]:
+        return self.index.get('' if relative_dir in ('', '.') else relative_dir.strip('/'))
+    
+    def path_of(self, node: int) -> str:
+        parts = []
+        while node > 0:
+            parts.append(self.names[node])
+            node = self.parent[node]
+        return '/'.join(reversed(parts))
+    
+    def children(self, node: int) -> Iterator[int]:
+        child = self.first_child[node]
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
+    
+    def _add(self, node: int, metric: str, amount: int):
+        self.own[metric][node] += amount
+        if self.total is not None:
+            total = self.total[metric]
+            while node != -1:
+                total[node] += amount
+                node = self.parent[node]
+    
+    def _raise_max(self, node: int, value: int):
+        if value <= self.own_max_complexity[node]:
+            return
+        self.own_max_complexity[node] = value
+        if self.max_complexity is not None:
+            while node != -1 and self.max_complexity[node] < value:
+                self.max_complexity[node] = value
+                node = self.parent[node]
+    
+    def add_file(self, node: int, size: int, is_code: bool = False):
+        self._add(node, 'files', 1)
+        self._add(node, 'bytes', size)
+        if is_code:
+            self._add(node, 'code_files', 1)
+    
+    def add_metrics(self, node: int, lines: int = 0, code_lines: int = 0, functions: int = 0,
+                    complexity: int = 0, max_complexity: int = 0):
+        self._add(node, 'lines', lines)
+        self._add(node, 'code_lines', code_lines)
+        self._add(node, 'functions', functions)
+        self._add(node, 'complexity', complexity)
+        self._raise_max(node, max_complexity)
+    
+    def aggregate(self) -> 'DirectoryTree':
+        self.total = {metric: array('q', values) for metric, values in self.own.items()}
+        self.max_complexity = array('q', self.own_max_complexity)
+        
+        for node in range(len(self.names) - 1, 0, -1):
+            parent = self.parent[node]
+            for metric in METRICS:
+                self.total[metric][parent] += self.total[metric][node]
+            if self.max_complexity[node] > self.max_complexity[parent]:
+                self.max_complexity[parent] = self.max_complexity[node]
+        return self
+    
+    def summary(self, node: int) -> Dict:
+        if self.total is None:
+            self.aggregate()
+        
+        functions = self.total['functions'][node]
+        return {
+            'path': self.path_of(node),
+            'files': self.total['files'][node],
+            'code_files': self.total['code_files'][node],
+            'bytes': self.total['bytes'][node],
+            'lines': self.total['lines'][node],
+            'code_lines': self.total['code_lines'][node],
+            'functions': functions,
+            'avg_complexity': round(self.total['complexity'][node] / functions, 2) if functions else 0,
+            'max_complexity': self.max_complexity[node]
+        }
+    
+    def drill_down(self, relative_dir: str = '') -> List[Dict]:
+        node = self.find(relative_dir)
+        if node is None:
+            return []
+        return sorted((self.summary(child) for child in self.children(node)),
+                      key=lambda item: (-item['lines'], item['path']))
+    
+    def largest(self, metric: str = 'lines', limit: int = 10, max_depth: int = None) -> List[Dict]:
+        if self.total is None:
+            self.aggregate()
+        
+        values = self.max_complexity if metric == 'max_complexity' else self.total[metric]
+        nodes = [node for node in range(1, len(self.names)) if max_depth is None or self.depth[node] <= max_depth]
+        nodes.sort(key=lambda node: (-values[node], node))
+        return [self.summary(node) for node in nodes[:limit]]
+    
+    def to_dict(self) -> Dict[str, list]:
+        data = {
+            'names': list(self.names),
+            'parent': self.parent.tolist()
+        }
+        for metric in METRICS:
+            data[metric] = self.own[metric].tolist()
+        data['max_complexity'] = self.own_max_complexity.tolist()
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, list]) -> 'DirectoryTree':
+        tree = cls()
+        for node in range(1, len(data['names'])):
+            parent_path = tree.path_of(data['parent'][node])
+            name = data['names'][node]
+            tree.directory(f"{parent_path}/{name}" if parent_path else name)
+        
+        for metric in METRICS:
+            tree.own[metric] = array('q', data[metric])
+        tree.own_max_complexity = array('q', data['max_complexity'])
+        return tree.aggregate()
\ No newline at end of file
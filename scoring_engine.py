@@ -6,8 +6,11 @@ from models import (
 from config import SCORING_WEIGHTS, TIER_THRESHOLDS, CONFIDENCE_THRESHOLDS
 
 class ScoringEngine:
-    def __init__(self):
-        self.weights = SCORING_WEIGHTS
+    def __init__(self, weights: dict = None, tier_thresholds: dict = None,
+                 confidence_thresholds: dict = None):
+        self.weights = weights or SCORING_WEIGHTS
+        self.tier_thresholds = tier_thresholds or TIER_THRESHOLDS
+        self.confidence_thresholds = confidence_thresholds or CONFIDENCE_THRESHOLDS
     
     def score_code_quality(self, code_metrics: CodeMetrics) -> DimensionScore:
         max_score = 100
@@ -407,7 +410,11 @@ class ScoringEngine:
             signals['activity'] = 'unknown'
         
         incremental_ratio = git_metrics.incremental_commits / max(git_metrics.total_commits, 1)
-        if incremental_ratio >= 0.7:
+        if not git_metrics.commit_sizes_known:
+            score += 12
+            signals['commit_style'] = 'unknown'
+            reasons.append("Commit sizes unavailable for this clone")
+        elif incremental_ratio >= 0.7:
             score += 20
             signals['commit_style'] = 'incremental'
             reasons.append("Incremental development approach")
@@ -533,19 +540,27 @@ class ScoringEngine:
         return round(total_weighted, 2)
     
     def determine_tier(self, score: float) -> str:
-        if score >= TIER_THRESHOLDS['advanced']:
+        if score >= self.tier_thresholds['advanced']:
             return "Advanced"
-        elif score >= TIER_THRESHOLDS['intermediate']:
+        elif score >= self.tier_thresholds['intermediate']:
             return "Intermediate"
         else:
             return "Beginner"
     
-    def determine_confidence(self, total_files: int, total_commits: int) -> str:
-        if (total_files >= CONFIDENCE_THRESHOLDS['high']['min_files'] and 
-            total_commits >= CONFIDENCE_THRESHOLDS['high']['min_commits']):
+    def determine_confidence(self, total_files: int, total_commits: int,
+                             sampling_error: float = 0.0) -> str:
+        if (total_files >= self.confidence_thresholds['high']['min_files'] and 
+            total_commits >= self.confidence_thresholds['high']['min_commits'] and
+            sampling_error <= self.confidence_thresholds['high']['max_sampling_error']):
             return "High"
-        elif (total_files >= CONFIDENCE_THRESHOLDS['medium']['min_files'] and 
-              total_commits >= CONFIDENCE_THRESHOLDS['medium']['min_commits']):
+        elif (total_files >= self.confidence_thresholds['medium']['min_files'] and 
+              total_commits >= self.confidence_thresholds['medium']['min_commits'] and
+              sampling_error <= self.confidence_thresholds['medium']['max_sampling_error']):
             return "Medium"
         else:
-            return "Low"
\ No newline at end of file
+            return "Low"
+    
+    def lower_confidence(self, confidence: str) -> str:
+        if confidence == "High":
+            return "Medium"
+        return "Low"
\ No newline at end of file
@@ -0,0 +1,244 @@
+import json
+import math
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from github_client import parse_repo_url
+from repository_mirror import RepositoryMirror, AnalysisCancelled
+from result_cache import ResultCache
+from mirror_store import MirrorStore
+from worker_pool import WorkerPool
+from config import SERVICE, RESULT_CACHE, MIRROR_STORE
+
+ANALYZE_OPTIONS = ('sample_files', 'sample_seed', 'record_files')
+
+class Job:
+    def __init__(self, key: tuple, repo_url: str, options: dict):
+        self.key = key
+        self.repo_url = repo_url
+        self.options = options
+        self.cancel_event = threading.Event()
+        self.tickets = set()
+        self.status = 'queued'
+        self.output = None
+        self.error = None
+        self.done = threading.Event()
+
+class AnalysisService:
+    def __init__(self, github_token: str = None, cache_dir: str = RESULT_CACHE['directory'],
+                 workers: int = SERVICE['workers'], max_pending: int = SERVICE['max_pending'],
+                 ticket_retention: int = SERVICE['ticket_retention'], mirror_dir: str = MIRROR_STORE['path'],
+                 worker_pool: WorkerPool = None):
+        self.github_token = github_token
+        self.cache_dir = cache_dir
+        self.mirror_store = MirrorStore(mirror_dir) if mirror_dir else None
+        self.worker_pool = worker_pool
+        self.max_pending = max_pending
+        self.ticket_retention = ticket_retention
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analysis')
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.tickets = OrderedDict()
+        self.stats = {'submitted': 0, 'coalesced': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'cancelled': 0}
+    
+    def _mirror(self) -> RepositoryMirror:
+        if not hasattr(self.local, 'mirror'):
+            result_cache = ResultCache(self.cache_dir) if self.cache_dir else None
+            self.local.mirror = RepositoryMirror(github_token=self.github_token, result_cache=result_cache,
+                                                 mirror_store=self.mirror_store, worker_pool=self.worker_pool)
+        return self.local.mirror
+    
+    def submit(self, repo_url: str, options: dict) -> dict:
+        owner, repo_name = parse_repo_url(repo_url)
+        key = (owner.lower(), repo_name.lower(), json.dumps(options, sort_keys=True))
+        ticket = uuid.uuid4().hex
+        
+        with self.lock:
+            job = self.in_flight.get(key)
+            coalesced = job is not None
+            
+            if not coalesced:
+                if len(self.in_flight) >= self.max_pending:
+                    self.stats['rejected'] += 1
+                    return None
+                
+                job = Job(key, repo_url, options)
+                self.in_flight[key] = job
+                self.executor.submit(self._run, job)
+                self.stats['submitted'] += 1
+            else:
+                self.stats['coalesced'] += 1
+            
+            job.tickets.add(ticket)
+            self.tickets[ticket] = job
+            self._trim_tickets()
+        
+        return {'job': ticket, 'status': job.status, 'coalesced': coalesced}
+    
+    def _trim_tickets(self):
+        while len(self.tickets) > self.ticket_retention:
+            oldest = next(iter(self.tickets))
+            if not self.tickets[oldest].done.is_set():
+                break
+            del self.tickets[oldest]
+    
+    def _run(self, job: Job):
+        try:
+            if job.cancel_event.is_set():
+                raise AnalysisCancelled("Analysis cancelled")
+            
+            job.status = 'running'
+            mirror = self._mirror()
+            analysis = mirror.analyze(job.repo_url, cancel_event=job.cancel_event, **job.options)
+            job.output = mirror.generate_output(analysis)
+            job.status = 'completed'
+        except AnalysisCancelled:
+            job.status = 'cancelled'
+        except Exception as e:
+            job.error = str(e)
+            job.status = 'failed'
+        finally:
+            with self.lock:
+                if self.in_flight.get(job.key) is job:
+                    del self.in_flight[job.key]
+                self.stats[job.status] += 1
+            job.done.set()
+    
+    def status(self, ticket: str, wait: float = None) -> dict:
+        job = self.tickets.get(ticket)
+        if job is None:
+            return None
+        
+        if wait:
+            job.done.wait(wait)
+        
+        return {
+            'job': ticket,
+            'repository': job.repo_url,
+            'status': job.status,
+            'error': job.error,
+            'result': job.output
+        }
+    
+    def cancel(self, ticket: str) -> dict:
+        with self.lock:
+            job = self.tickets.get(ticket)
+            if job is None:
+                return None
+            
+            job.tickets.discard(ticket)
+            if not job.tickets and not job.done.is_set():
+                job.cancel_event.set()
+                if self.in_flight.get(job.key) is job:
+                    del self.in_flight[job.key]
+        
+        status = 'cancelling' if job.cancel_event.is_set() and not job.done.is_set() else job.status
+        return {'job': ticket, 'status': status}
+    
+    def health(self) -> dict:
+        with self.lock:
+            return {
+                'in_flight': len(self.in_flight),
+                'max_pending': self.max_pending,
+                'tickets': len(self.tickets),
+                'stats': dict(self.stats)
+            }
+    
+    def shutdown(self):
+        with self.lock:
+            for job in self.in_flight.values():
+                job.cancel_event.set()
+        self.executor.shutdown(wait=True)
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    service: AnalysisService = None
+    
+    def _send(self, status: int, body: dict, headers: dict = None):
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def _job_id(self) -> str:
+        parts = urlsplit(self.path).path.strip('/').split('/')
+        return parts[1] if len(parts) == 2 and parts[0] == 'jobs' else None
+    
+    def _wait(self) -> float:
+        values = parse_qs(urlsplit(self.path).query).get('wait')
+        if not values:
+            return None
+        
+        wait = float(values[-1])
+        if not math.isfinite(wait) or wait < 0:
+            raise ValueError(values[-1])
+        return min(wait, SERVICE['max_wait'])
+    
+    def do_GET(self):
+        if self.path == '/health':
+            return self._send(200, self.service.health())
+        
+        ticket = self._job_id()
+        try:
+            wait = self._wait()
+        except ValueError:
+            return self._send(400, {'error': 'wait must be a non-negative number of seconds'})
+        
+        status = self.service.status(ticket, wait) if ticket else None
+        if status is None:
+            return self._send(404, {'error': 'Unknown job'})
+        return self._send(200, status)
+    
+    def do_POST(self):
+        if self.path != '/analyze':
+            return self._send(404, {'error': 'Unknown endpoint'})
+        
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            repo_url = request['url']
+        except (ValueError, KeyError):
+            return self._send(400, {'error': 'Body must be JSON with a "url" field'})
+        
+        options = {name: request[name] for name in ANALYZE_OPTIONS if request.get(name) is not None}
+        
+        try:
+            submitted = self.service.submit(repo_url, options)
+        except ValueError as e:
+            return self._send(400, {'error': str(e)})
+        
+        if submitted is None:
+            return self._send(503, {'error': 'Too many analyses in progress'},
+                              {'Retry-After': str(SERVICE['retry_after'])})
+        return self._send(202, submitted)
+    
+    def do_DELETE(self):
+        ticket = self._job_id()
+        cancelled = self.service.cancel(ticket) if ticket else None
+        if cancelled is None:
+            return self._send(404, {'error': 'Unknown job'})
+        return self._send(200, cancelled)
+    
+    def log_message(self, format, *args):
+        pass
+
+def serve(host: str = SERVICE['host'], port: int = SERVICE['port'], **service_options):
+    service = AnalysisService(**service_options)
+    handler = type('BoundServiceHandler', (ServiceHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"Repository Mirror service listening on http://{host}:{server.server_port}")
+    
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
\ No newline at end of file
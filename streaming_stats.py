@@ -0,0 +1,97 @@
+import heapq
+import math
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+class RunningStats:
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+    
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+class TopK:
+    def __init__(self, k: int):
+        self.k = k
+        self.heap = []
+        self.sequence = count()
+    
+    def add(self, key, item: Any):
+        if self.k <= 0:
+            return
+        entry = (key, -next(self.sequence), item)
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, entry)
+        elif entry[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, entry)
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+    
+    def items(self) -> List[Any]:
+        return [item for _, _, item in sorted(self.heap, key=lambda entry: entry[:2], reverse=True)]
+
+class LogHistogram:
+    def __init__(self, sub_buckets: int = 8):
+        self.sub_buckets = sub_buckets
+        self.buckets = {}
+        self.zeros = 0
+        self.stats = RunningStats()
+    
+    def _bucket(self, value) -> int:
+        mantissa, exponent = math.frexp(value)
+        return exponent * self.sub_buckets + int((mantissa * 2 - 1) * self.sub_buckets)
+    
+    def _bounds(self, bucket: int) -> Tuple[float, float]:
+        exponent, step = divmod(bucket, self.sub_buckets)
+        base = math.ldexp(1.0, exponent - 1)
+        return base * (1 + step / self.sub_buckets), base * (1 + (step + 1) / self.sub_buckets)
+    
+    def add(self, value):
+        self.stats.add(value)
+        if value <= 0:
+            self.zeros += 1
+            return
+        bucket = self._bucket(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+    
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.stats.count:
+            return None
+        
+        rank = q * (self.stats.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return self.stats.minimum
+        
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if rank < seen:
+                low, high = self._bounds(bucket)
+                return min(max((low + high) / 2, self.stats.minimum), self.stats.maximum)
+        return self.stats.maximum
+    
+    def histogram(self) -> List[Tuple[float, float, int]]:
+        rows = [(0, 0, self.zeros)] if self.zeros else []
+        rows.extend(self._bounds(bucket) + (self.buckets[bucket],) for bucket in sorted(self.buckets))
+        return rows
+    
+    def summary(self, quantiles: List[float]) -> Dict[str, int]:
+        summary = {}
+        for q in quantiles:
+            value = self.quantile(q)
+            if value is not None:
+                summary[f"p{q * 100:g}"] = int(round(value))
+        return summary
\ No newline at end of file
@@ -1,19 +1,28 @@
 import os
+import time
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Tuple
 from models import FileStructure
-from config import KEY_FILES, EXCLUDED_DIRS, EXCLUDED_EXTENSIONS, CODE_EXTENSIONS
+from config import KEY_FILES, EXCLUDED_DIRS, EXCLUDED_EXTENSIONS, CODE_EXTENSIONS, STRUCTURE_STATS
+from path_index import PathIndex
+from language_stats import LanguageStats
+from rollup_tree import DirectoryTree
+from streaming_stats import RunningStats, TopK, LogHistogram
 
 class StructureAnalyzer:
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, path_index: PathIndex = None, deadline: float = None):
         self.repo_path = Path(repo_path)
+        self.path_index = path_index
+        self.deadline = deadline
+        self.complete = True
+        self.directory_tree = DirectoryTree()
         self.all_extensions = set()
         for exts in CODE_EXTENSIONS.values():
             self.all_extensions.update(exts)
     
     def should_exclude(self, path: Path) -> bool:
-        parts = path.parts
+        parts = path.relative_to(self.repo_path).parts
         for part in parts:
             if part in EXCLUDED_DIRS:
                 return True
@@ -35,26 +44,32 @@ class StructureAnalyzer:
     
     def find_key_files(self) -> Dict[str, bool]:
         found_files = {}
+        index = self.path_index or PathIndex(self.repo_path, recursive=False)
         
         for category, filenames in KEY_FILES.items():
-            found_files[category] = False
-            for filename in filenames:
-                file_path = self.repo_path / filename
-                if file_path.exists():
-                    found_files[category] = True
-                    break
+            found_files[category] = any(
+                index.exists(filename, case_sensitive=False) for filename in filenames
+            )
         
         return found_files
     
     def analyze(self) -> FileStructure:
         total_files = 0
         total_code_files = 0
-        depths = []
+        depths = RunningStats()
         directories = 0
         file_types = defaultdict(int)
-        file_sizes = []
+        largest = TopK(STRUCTURE_STATS['largest_files'])
+        self.size_histogram = LogHistogram(STRUCTURE_STATS['histogram_sub_buckets'])
+        language_stats = LanguageStats()
+        self.directory_tree = DirectoryTree()
+        self.complete = True
         
         for root, dirs, files in os.walk(self.repo_path):
+            if self.deadline is not None and time.monotonic() > self.deadline:
+                self.complete = False
+                break
+            
             root_path = Path(root)
             
             if self.should_exclude(root_path):
@@ -66,6 +81,8 @@ class StructureAnalyzer:
             if dirs:
                 directories += len(dirs)
             
+            node = self.directory_tree.directory(os.path.relpath(root, self.repo_path).replace(os.sep, '/'))
+            
             for file in files:
                 file_path = root_path / file
                 
@@ -73,35 +90,37 @@ class StructureAnalyzer:
                     continue
                 
                 total_files += 1
-                depth = self.calculate_depth(file_path)
-                depths.append(depth)
+                depths.add(self.calculate_depth(file_path))
                 
                 ext = file_path.suffix or 'no_extension'
                 file_types[ext] += 1
                 
-                if self.is_code_file(file_path):
+                is_code = self.is_code_file(file_path)
+                if is_code:
                     total_code_files += 1
                 
+                size = 0
                 try:
                     size = file_path.stat().st_size
-                    file_sizes.append((str(file_path.relative_to(self.repo_path)), size))
+                    relative = str(file_path.relative_to(self.repo_path))
+                    largest.add(size, (relative, size))
+                    self.size_histogram.add(size)
+                    language_stats.add(relative, str(file_path), size)
                 except:
                     pass
-        
-        max_depth = max(depths) if depths else 0
-        avg_depth = sum(depths) / len(depths) if depths else 0
-        
-        largest_files = sorted(file_sizes, key=lambda x: x[1], reverse=True)[:10]
+                self.directory_tree.add_file(node, size, is_code)
         
         key_files_present = self.find_key_files()
         
         return FileStructure(
             total_files=total_files,
             total_code_files=total_code_files,
-            max_depth=max_depth,
-            avg_depth=round(avg_depth, 2),
+            max_depth=depths.maximum or 0,
+            avg_depth=round(depths.mean, 2),
             directories=directories,
             key_files_present=key_files_present,
             file_types=dict(file_types),
-            largest_files=largest_files
+            largest_files=largest.items(),
+            languages=language_stats.breakdown(),
+            size_quantiles=self.size_histogram.summary(STRUCTURE_STATS['size_quantiles'])
         )
\ No newline at end of file
@@ -1,41 +1,80 @@
 import os
 import re
+import time
 from pathlib import Path
-from typing import List, Dict
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
 from models import TestingMetrics, MaturityMetrics
+from file_sampler import FileSampler
+from path_index import PathIndex, tokenize
+from worker_pool import WorkerPool, WorkerDied
 from config import (
     TEST_INDICATORS, LINTER_CONFIGS, PACKAGE_MANAGERS,
-    CONFIG_FILES, REAL_WORLD_INDICATORS, EXCLUDED_DIRS, CODE_EXTENSIONS
+    CONFIG_FILES, REAL_WORLD_INDICATORS, CODE_EXTENSIONS,
+    ERROR_HANDLING_CONSTRUCTS, ERROR_HANDLING_TIME_BUDGET, LARGE_FILES
 )
 
+TEST_TOKENS = set().union(*(tokenize(indicator) for indicator in TEST_INDICATORS))
+
+ERROR_HANDLING_PATTERN = re.compile(
+    '|'.join(f'(?P<{name}>{pattern})' for name, pattern in ERROR_HANDLING_CONSTRUCTS.items())
+)
+
+def count_error_handling(content: str) -> Dict[str, int]:
+    counts = defaultdict(int)
+    for match in ERROR_HANDLING_PATTERN.finditer(content):
+        counts[match.lastgroup] += 1
+    return dict(counts)
+
+def count_error_handling_streaming(f) -> Dict[str, int]:
+    counts = defaultdict(int)
+    for line in f:
+        for match in ERROR_HANDLING_PATTERN.finditer(line):
+            counts[match.lastgroup] += 1
+    return dict(counts)
+
+def scan_error_handling_file(file_path: str) -> Optional[Dict[str, int]]:
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            if LARGE_FILES['stream_above_bytes'] and os.fstat(f.fileno()).st_size > LARGE_FILES['stream_above_bytes']:
+                return count_error_handling_streaming(f)
+            content = f.read()
+    except:
+        return None
+    return count_error_handling(content)
+
+def scan_error_handling_batch(paths: List[str]) -> List[Optional[Dict[str, int]]]:
+    return [scan_error_handling_file(path) for path in paths]
+
 class TestingMaturityAnalyzer:
-    def __init__(self, repo_path: str, primary_language: str = None):
+    def __init__(self, repo_path: str, primary_language: str = None,
+                 error_handling_budget: float = ERROR_HANDLING_TIME_BUDGET,
+                 sampler: FileSampler = None, path_index: PathIndex = None, worker_pool: WorkerPool = None):
         self.repo_path = Path(repo_path)
         self.primary_language = primary_language
+        self.sampler = sampler
+        self.worker_pool = worker_pool
+        self.error_handling_budget = error_handling_budget
+        self.error_handling_constructs = {}
+        self.error_handling_files_scanned = 0
+        self.complete = True
+        self.index = path_index
         self.all_files = []
         self.all_dirs = []
         self._scan_repository()
     
     def _scan_repository(self):
-        for root, dirs, files in os.walk(self.repo_path):
-            dirs[:] = [d for d in dirs if d not in EXCLUDED_DIRS]
-            
-            self.all_dirs.extend([os.path.join(root, d) for d in dirs])
-            self.all_files.extend([os.path.join(root, f) for f in files])
+        if self.index is None:
+            self.index = PathIndex(self.repo_path)
+        self.all_dirs = self.index.dirs
+        self.all_files = self.index.files
+    
+    def _find(self, relative_path: str) -> bool:
+        return bool(self.index.find_in_package_roots(relative_path))
     
     def detect_test_files(self) -> tuple:
-        has_test_dir = False
-        test_files = []
-        
-        for dir_path in self.all_dirs:
-            dir_name = os.path.basename(dir_path).lower()
-            if any(indicator in dir_name for indicator in TEST_INDICATORS):
-                has_test_dir = True
-        
-        for file_path in self.all_files:
-            file_name = os.path.basename(file_path).lower()
-            if any(indicator in file_name for indicator in TEST_INDICATORS):
-                test_files.append(file_path)
+        has_test_dir = bool(self.index.dirs_with_token(TEST_TOKENS))
+        test_files = self.index.files_with_token(TEST_TOKENS)
         
         return has_test_dir, len(test_files)
     
@@ -54,8 +93,7 @@ class TestingMaturityAnalyzer:
         }
         
         for pattern, tool in ci_cd_patterns.items():
-            check_path = self.repo_path / pattern
-            if check_path.exists():
+            if self._find(pattern):
                 ci_cd_tools.append(tool)
         
         return len(ci_cd_tools) > 0, ci_cd_tools
@@ -71,8 +109,7 @@ class TestingMaturityAnalyzer:
                 relevant_configs.extend(configs)
         
         for config_file in relevant_configs:
-            check_path = self.repo_path / config_file
-            if check_path.exists():
+            if self._find(config_file):
                 linter_tools.append(config_file)
         
         return len(linter_tools) > 0, linter_tools
@@ -88,16 +125,14 @@ class TestingMaturityAnalyzer:
                 relevant_managers.extend(managers)
         
         for manager_file in relevant_managers:
-            check_path = self.repo_path / manager_file
-            if check_path.exists():
+            if self._find(manager_file):
                 found_managers.append(manager_file)
         
         return len(found_managers) > 0, found_managers
     
     def detect_config_examples(self) -> bool:
         for config_file in CONFIG_FILES:
-            check_path = self.repo_path / config_file
-            if check_path.exists():
+            if self._find(config_file):
                 return True
         return False
     
@@ -110,17 +145,13 @@ class TestingMaturityAnalyzer:
         
         found_tools = []
         for deploy_file in deployment_files:
-            check_path = self.repo_path / deploy_file
-            if check_path.exists():
+            if self._find(deploy_file):
                 found_tools.append(deploy_file)
         
-        k8s_path = self.repo_path / 'k8s'
-        if k8s_path.exists() and k8s_path.is_dir():
-            found_tools.append('k8s/')
-        
-        kubernetes_path = self.repo_path / 'kubernetes'
-        if kubernetes_path.exists() and kubernetes_path.is_dir():
-            found_tools.append('kubernetes/')
+        for manifest_dir in ['k8s', 'kubernetes']:
+            if any(self.index.is_dir(f"{root}/{manifest_dir}" if root else manifest_dir)
+                   for root in self.index.package_roots):
+                found_tools.append(f'{manifest_dir}/')
         
         return len(found_tools) > 0, found_tools
     
@@ -128,27 +159,40 @@ class TestingMaturityAnalyzer:
         features = {}
         
         for feature_type, indicators in REAL_WORLD_INDICATORS.items():
-            features[feature_type] = False
-            
-            for indicator in indicators:
-                for dir_path in self.all_dirs:
-                    if indicator.lower() in dir_path.lower():
-                        features[feature_type] = True
-                        break
-                
-                if features[feature_type]:
-                    break
-                
-                for file_path in self.all_files:
-                    if indicator.lower() in file_path.lower():
-                        features[feature_type] = True
-                        break
-                
-                if features[feature_type]:
-                    break
+            features[feature_type] = any(self.index.contains(indicator) for indicator in indicators)
         
         return features
     
+    def scan_error_handling(self, content: str) -> Dict[str, int]:
+        return count_error_handling(content)
+    
+    def _stopped(self, deadline: float) -> bool:
+        if (deadline is not None and time.monotonic() > deadline) or (self.sampler and self.sampler.expired()):
+            self.complete = False
+            return True
+        return False
+    
+    def _scan_results(self, code_files: List[str], deadline: float) -> Iterator[Optional[Dict[str, int]]]:
+        if self.worker_pool is None:
+            for file_path in code_files:
+                if self._stopped(deadline):
+                    return
+                yield scan_error_handling_file(file_path)
+            return
+        
+        results = self.worker_pool.imap_chunked(scan_error_handling_batch, code_files, on_lost=self._worker_lost)
+        try:
+            for counts in results:
+                if self._stopped(deadline):
+                    return
+                yield counts
+        finally:
+            results.close()
+    
+    def _worker_lost(self, error: WorkerDied, files: int):
+        print(f"  Warning: {error}; {files} files skipped")
+        self.complete = False
+    
     def analyze_error_handling(self) -> float:
         code_extensions = set()
         for exts in CODE_EXTENSIONS.values():
@@ -156,38 +200,29 @@ class TestingMaturityAnalyzer:
         
         files_with_error_handling = 0
         total_code_files = 0
+        construct_counts = defaultdict(int)
+        self.complete = True
         
-        error_patterns = [
-            r'\btry\b',
-            r'\bcatch\b',
-            r'\bexcept\b',
-            r'\bfinally\b',
-            r'\bthrow\b',
-            r'\braise\b',
-            r'\.catch\(',
-            r'\.then\(',
-            r'\bError\b',
-            r'\bException\b'
-        ]
+        deadline = None
+        if self.error_handling_budget is not None:
+            deadline = time.monotonic() + self.error_handling_budget
+        
+        code_files = self.index.files_with_suffix(code_extensions)
+        population = len(code_files)
+        code_files = (self.sampler or FileSampler()).select(code_files, str(self.repo_path))
         
-        for file_path in self.all_files[:100]:
-            path_obj = Path(file_path)
-            
-            if path_obj.suffix not in code_extensions:
-                continue
-            
+        for counts in self._scan_results(code_files, deadline):
             total_code_files += 1
-            
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                for pattern in error_patterns:
-                    if re.search(pattern, content):
-                        files_with_error_handling += 1
-                        break
-            except:
-                continue
+            if counts:
+                files_with_error_handling += 1
+                for construct, count in counts.items():
+                    construct_counts[construct] += count
+        
+        scale = population / total_code_files if total_code_files else 1
+        self.error_handling_constructs = {
+            construct: int(round(count * scale)) for construct, count in construct_counts.items()
+        }
+        self.error_handling_files_scanned = total_code_files
         
         if total_code_files == 0:
             return 0.0
@@ -203,7 +238,7 @@ class TestingMaturityAnalyzer:
         for exts in CODE_EXTENSIONS.values():
             code_extensions.update(exts)
         
-        code_files = sum(1 for f in self.all_files if Path(f).suffix in code_extensions)
+        code_files = len(self.index.files_with_suffix(code_extensions))
         
         test_ratio = test_files_count / code_files if code_files > 0 else 0
         
@@ -231,5 +266,7 @@ class TestingMaturityAnalyzer:
             has_deployment_config=has_deployment,
             deployment_tools=deployment_tools,
             real_world_features=real_world_features,
-            error_handling_score=error_handling_score
+            error_handling_score=error_handling_score,
+            error_handling_constructs=self.error_handling_constructs,
+            error_handling_files_scanned=self.error_handling_files_scanned
         )
\ No newline at end of file
@@ -0,0 +1,101 @@
+import random
+from datetime import datetime
+from models import (
+    RepositoryMetadata, FileStructure, CodeMetrics, GitMetrics,
+    TestingMetrics, MaturityMetrics, AnalysisResult
+)
+from repository_mirror import RepositoryMirror
+
+KEY_FILES = ['readme', 'license', 'contributing', 'changelog', 'code_of_conduct', 'gitignore']
+
+def make_metadata(owner: str = 'owner', name: str = 'repo', size_kb: int = 100) -> RepositoryMetadata:
+    return RepositoryMetadata(
+        name=name,
+        owner=owner,
+        url=f"https://github.com/{owner}/{name}",
+        default_branch='main',
+        created_at=datetime(2024, 1, 1),
+        updated_at=datetime(2024, 6, 1),
+        stars=1,
+        forks=1,
+        open_issues=1,
+        size_kb=size_kb,
+        primary_language='Python',
+        languages={'Python': 1000},
+        has_wiki=True,
+        has_issues=True,
+        has_projects=True,
+        archived=False
+    )
+
+def random_result(rng: random.Random, mirror: RepositoryMirror = None, owner: str = 'owner',
+                  name: str = 'repo') -> AnalysisResult:
+    mirror = mirror or RepositoryMirror()
+    file_types = {f".ext{i}": rng.randint(0, 5) for i in range(rng.randint(0, 8))}
+    if rng.random() < 0.5:
+        file_types['.md'] = rng.randint(0, 7)
+    
+    file_structure = FileStructure(
+        total_files=rng.choice([0, 1, 4, 5, 30, 50, 51, 100, 101, 150, 200, 201, 500]),
+        total_code_files=rng.randint(0, 300),
+        max_depth=rng.randint(0, 12),
+        avg_depth=1.0,
+        directories=rng.randint(0, 5),
+        key_files_present={key: rng.random() < 0.5 for key in KEY_FILES},
+        file_types=file_types,
+        largest_files=[]
+    )
+    code_metrics = CodeMetrics(
+        total_lines=100,
+        code_lines=rng.randint(0, 100),
+        comment_lines=1,
+        blank_lines=1,
+        avg_file_length=rng.choice([0, 300, 300.5, 500, 501, 1000]),
+        avg_function_length=rng.choice([0, 30, 31, 50, 51]),
+        comment_ratio=rng.choice([0, 0.0799, 0.08, 0.15, 0.2]),
+        files_analyzed=1,
+        functions_count=rng.randint(0, 50),
+        classes_count=0,
+        avg_complexity=rng.choice([0, 5, 5.01, 8, 10, 15, 15.1, 30]),
+        max_complexity=rng.randint(0, 40),
+        complexity_distribution={'high': rng.randint(0, 10), 'very_high': rng.randint(0, 5)},
+        sampling=rng.choice([None, {'sampling_error': rng.choice([0.0, 0.05, 0.06, 0.15, 0.2])}])
+    )
+    git_metrics = GitMetrics(
+        total_commits=rng.choice([0, 1, 4, 5, 9, 10, 19, 20, 100]),
+        unique_authors=1,
+        avg_commits_per_week=1,
+        commit_frequency_trend=rng.choice(['active', 'moderate', 'inactive', 'unknown']),
+        avg_commit_message_length=1,
+        good_commit_messages=rng.randint(0, 100),
+        poor_commit_messages=0,
+        total_branches=rng.randint(0, 3),
+        total_prs=0,
+        merge_pr_ratio=0,
+        large_commits=0,
+        incremental_commits=rng.randint(0, 100),
+        commit_sizes_known=rng.random() < 0.7
+    )
+    testing_metrics = TestingMetrics(
+        has_test_directory=rng.random() < 0.5,
+        test_files_count=1,
+        test_to_code_ratio=rng.choice([0, 0.01, 0.15, 0.3, 0.5]),
+        has_ci_cd=rng.random() < 0.5,
+        ci_cd_tools=['actions'],
+        has_linter_config=rng.random() < 0.5,
+        linter_tools=[]
+    )
+    maturity_metrics = MaturityMetrics(
+        has_package_manager=rng.random() < 0.5,
+        package_managers=['pip'],
+        has_config_example=rng.random() < 0.5,
+        has_deployment_config=rng.random() < 0.5,
+        deployment_tools=[],
+        real_world_features={feature: rng.random() < 0.5 for feature in 'abcde'},
+        error_handling_score=rng.choice([0, 0.1, 0.3, 0.6, 0.9])
+    )
+    return mirror.build_result(
+        make_metadata(owner, name), file_structure, code_metrics,
+        git_metrics, testing_metrics, maturity_metrics,
+        partial=rng.random() < 0.3
+    )
\ No newline at end of file
@@ -0,0 +1,41 @@
+import random
+from dataclasses import asdict
+from batch_rescorer import BatchRescorer
+from config import SCORING_WEIGHTS
+from repository_mirror import RepositoryMirror
+from scoring_engine import ScoringEngine
+from factories import random_result
+
+COMPARED_FIELDS = ['dimension_scores', 'overall_score', 'tier', 'confidence', 'strengths', 'weaknesses']
+
+def assert_parity(scoring_engine: ScoringEngine, count: int, seed: int):
+    mirror = RepositoryMirror(scoring_engine=scoring_engine)
+    rng = random.Random(seed)
+    results = [random_result(rng, mirror) for _ in range(count)]
+    
+    rescored = BatchRescorer(scoring_engine).rescore(results)
+    
+    assert len(rescored) == len(results)
+    for expected, actual in zip(results, rescored):
+        expected, actual = asdict(expected), asdict(actual)
+        for name in COMPARED_FIELDS:
+            assert actual[name] == expected[name], name
+
+def test_matches_scoring_engine_on_generated_results():
+    assert_parity(ScoringEngine(), count=2000, seed=1)
+
+def test_matches_scoring_engine_with_custom_settings():
+    weights = dict(SCORING_WEIGHTS, code_quality=SCORING_WEIGHTS['code_quality'] * 2)
+    scoring_engine = ScoringEngine(
+        weights=weights,
+        tier_thresholds={'advanced': 50, 'intermediate': 20},
+        confidence_thresholds={
+            'high': {'min_files': 10, 'min_commits': 5, 'max_sampling_error': 0.1},
+            'medium': {'min_files': 1, 'min_commits': 1, 'max_sampling_error': 0.2}
+        }
+    )
+    assert_parity(scoring_engine, count=500, seed=2)
+
+def test_takes_settings_from_scoring_engine():
+    scoring_engine = ScoringEngine(tier_thresholds={'advanced': 1, 'intermediate': 0})
+    assert BatchRescorer(scoring_engine).tier_thresholds is scoring_engine.tier_thresholds
\ No newline at end of file
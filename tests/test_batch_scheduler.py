@@ -0,0 +1,27 @@
+import pytest
+from batch_scheduler import ShortestJobFirstScheduler, percentile
+
+def test_pops_shortest_estimate_first_and_ties_in_push_order():
+    scheduler = ShortestJobFirstScheduler(clock=lambda: 0.0)
+    for job, cost in [('huge', 100.0), ('a', 1.0), ('b', 2.0), ('c', 1.0)]:
+        scheduler.push(job, cost)
+    
+    assert [scheduler.pop()[0] for _ in range(len(scheduler))] == ['a', 'c', 'b', 'huge']
+
+def test_reports_time_spent_queued():
+    now = [10.0]
+    scheduler = ShortestJobFirstScheduler(clock=lambda: now[0])
+    scheduler.push('job', 1.0)
+    now[0] = 25.0
+    
+    assert scheduler.pop() == ('job', 15.0)
+
+def test_pop_from_empty_scheduler_raises():
+    with pytest.raises(IndexError):
+        ShortestJobFirstScheduler().pop()
+
+def test_percentile_uses_nearest_rank():
+    values = [5.0, 1.0, 4.0, 2.0, 3.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 99) == 5.0
+    assert percentile([], 50) == 0.0
\ No newline at end of file
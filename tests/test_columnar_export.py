@@ -0,0 +1,74 @@
+import random
+import pytest
+from models import FileMetrics, dimension_key
+from repository_mirror import RepositoryMirror
+from columnar_export import (RESULT_SCHEMA, FILE_SCHEMA, export_results, read_table, detect_format,
+                             write_table, results_table)
+from factories import random_result
+
+def make_analyses():
+    rng = random.Random(3)
+    mirror = RepositoryMirror()
+    analyses = [random_result(rng, mirror, owner=owner, name=f"repo{i}")
+                for i, owner in enumerate(['alice', 'bob', 'alice'])]
+    analyses[0].package_path = 'packages/api'
+    analyses[0].file_metrics = [
+        FileMetrics('src/app.py', 'Python', 10, 7, 2, 1, 1, 2.0, 3),
+        FileMetrics('src/ui.ts', 'TypeScript', 20, 15, 3, 2, 4, 1.5, 2)
+    ]
+    return analyses
+
+@pytest.mark.parametrize('format', ['parquet', 'arrow'])
+def test_results_round_trip(tmp_path, format):
+    analyses = make_analyses()
+    path = str(tmp_path / f"results.{format}")
+    files_path = str(tmp_path / f"files.{format}")
+    
+    written = export_results(analyses, path, format, file_metrics_path=files_path)
+    assert written == {'results': 3, 'files': 2}
+    
+    table = read_table(path)
+    assert table.schema.equals(RESULT_SCHEMA)
+    rows = table.to_pylist()
+    for row, analysis in zip(rows, analyses):
+        assert (row['owner'], row['name'], row['package']) == \
+            (analysis.repository.owner, analysis.repository.name, analysis.package_path)
+        assert row['score'] == analysis.overall_score
+        assert row['tier'] == analysis.tier
+        assert row['analyzed_at'] == analysis.timestamp
+        for dim in analysis.dimension_scores:
+            assert row[f"{dimension_key(dim.name)}_percentage"] == dim.percentage
+    
+    files = read_table(files_path)
+    assert files.schema.equals(FILE_SCHEMA)
+    assert files.column('path').to_pylist() == ['src/app.py', 'src/ui.ts']
+
+@pytest.mark.parametrize('format', ['parquet', 'arrow'])
+def test_columns_and_filters(tmp_path, format):
+    path = str(tmp_path / 'results.out')
+    export_results(make_analyses(), path, format)
+    
+    table = read_table(path, columns=['owner', 'name'], filters={'owner': ['alice']})
+    assert table.column_names == ['owner', 'name']
+    assert table.to_pylist() == [{'owner': 'alice', 'name': 'repo0'}, {'owner': 'alice', 'name': 'repo2'}]
+
+def test_format_comes_from_magic_bytes_not_extension(tmp_path):
+    table = results_table(make_analyses())
+    arrow_named_parquet = str(tmp_path / 'results.parquet')
+    parquet_named_arrow = str(tmp_path / 'results.arrow')
+    write_table(table, arrow_named_parquet, 'arrow')
+    write_table(table, parquet_named_arrow, 'parquet')
+    
+    assert detect_format(arrow_named_parquet) == 'arrow'
+    assert detect_format(parquet_named_arrow) == 'parquet'
+    assert read_table(arrow_named_parquet).num_rows == 3
+    assert read_table(parquet_named_arrow, format='parquet').num_rows == 3
+
+def test_unknown_file_is_rejected(tmp_path):
+    path = tmp_path / 'results.parquet'
+    path.write_text('owner,name\n')
+    
+    with pytest.raises(Exception, match='Not a Parquet or Arrow IPC file'):
+        read_table(str(path))
+    with pytest.raises(Exception, match='Unsupported export format'):
+        read_table(str(path), format='csv')
\ No newline at end of file
@@ -0,0 +1,24 @@
+from code_analyzer import CodeAnalyzer
+from structure_analyzer import StructureAnalyzer
+
+def make_repo(root):
+    repo = root / 'build' / 'repo'
+    (repo / 'src').mkdir(parents=True)
+    (repo / 'src' / 'app.py').write_text('def main():\n    return 1\n')
+    (repo / 'node_modules' / 'dep').mkdir(parents=True)
+    (repo / 'node_modules' / 'dep' / 'index.js').write_text('module.exports = 1;\n')
+    return repo
+
+def test_excluded_dir_above_the_clone_does_not_hide_it(tmp_path):
+    repo = make_repo(tmp_path)
+    analyzer = CodeAnalyzer(str(repo), 'Python')
+    
+    assert analyzer.should_analyze(repo / 'src' / 'app.py')
+    assert analyzer.analyze().files_analyzed == 1
+
+def test_structure_counts_files_under_an_excluded_parent(tmp_path):
+    repo = make_repo(tmp_path)
+    structure = StructureAnalyzer(str(repo)).analyze()
+    
+    assert structure.total_files == 1
+    assert structure.total_code_files == 1
\ No newline at end of file
@@ -0,0 +1,77 @@
+import os
+import pytest
+from file_sampler import FileSampler
+
+ROOT = '/repo'
+
+def make_paths():
+    paths = [f"{ROOT}/src/module{i}.py" for i in range(60)]
+    paths += [f"{ROOT}/web/page{i}.js" for i in range(30)]
+    paths += [f"{ROOT}/scripts/tool{i}.sh" for i in range(9)]
+    paths.append(f"{ROOT}/setup.py")
+    return paths
+
+def test_allocation_is_proportional_and_covers_every_stratum():
+    sampler = FileSampler(target_files=20)
+    selected = sampler.select(make_paths(), ROOT)
+    
+    assert len(selected) == 20
+    counts = {}
+    for path in selected:
+        key = sampler.stratum_key(os.path.relpath(path, ROOT))
+        counts[key] = counts.get(key, 0) + 1
+    
+    assert set(counts) == set(sampler.population)
+    assert counts[('src', 'python')] > counts[('web', 'javascript')] > counts[('scripts', 'other')]
+
+def test_allocation_never_exceeds_a_stratum():
+    sizes = {('a', 'python'): 3, ('b', 'python'): 1, ('c', 'go'): 50}
+    allocation = FileSampler()._allocate(sizes, 40)
+    
+    assert sum(allocation.values()) == 40
+    assert all(0 < allocation[key] <= size for key, size in sizes.items())
+    assert FileSampler()._allocate(sizes, 100) == sizes
+
+def test_target_smaller_than_strata_picks_largest_strata():
+    sizes = {('a', 'python'): 5, ('b', 'python'): 9, ('c', 'go'): 2}
+    assert FileSampler()._allocate(sizes, 2) == {('a', 'python'): 1, ('b', 'python'): 1, ('c', 'go'): 0}
+
+def test_selection_is_seeded_and_order_independent():
+    paths = make_paths()
+    first = FileSampler(target_files=15, seed=1).select(paths, ROOT)
+    
+    assert FileSampler(target_files=15, seed=1).select(list(reversed(paths)), ROOT) == first
+    assert FileSampler(target_files=15, seed=2).select(paths, ROOT) != first
+
+def test_prefix_of_full_order_stays_stratified():
+    sampler = FileSampler(seed=5)
+    ordered = sampler.select(make_paths(), ROOT)
+    
+    assert len(ordered) == 100
+    prefix_strata = {sampler.stratum_key(os.path.relpath(path, ROOT)) for path in ordered[:10]}
+    assert {('src', 'python'), ('web', 'javascript')} <= prefix_strata
+
+def test_extrapolation_scales_stratum_means_to_population():
+    sampler = FileSampler()
+    sampler.population = {('src', 'python'): 10, ('web', 'javascript'): 4}
+    observations = {('src', 'python'): [{'lines': 10}, {'lines': 30}], ('web', 'javascript'): [{'lines': 5}]}
+    
+    estimate = sampler.extrapolate(observations, ['lines'])['lines']
+    assert estimate['estimate'] == pytest.approx(10 * 20 + 4 * 5)
+    assert estimate['low'] < estimate['estimate'] < estimate['high']
+
+def test_unsampled_stratum_uses_pooled_mean():
+    sampler = FileSampler()
+    sampler.population = {('src', 'python'): 2, ('docs', 'other'): 3}
+    observations = {('src', 'python'): [{'lines': 4}, {'lines': 8}]}
+    
+    assert sampler.extrapolate(observations, ['lines'])['lines']['estimate'] == pytest.approx(2 * 6 + 3 * 6)
+
+def test_fully_sampled_population_has_no_error():
+    sampler = FileSampler()
+    sampler.population = {('src', 'python'): 2}
+    observations = {('src', 'python'): [{'lines': 4}, {'lines': 8}]}
+    
+    estimate = sampler.extrapolate(observations, ['lines'])['lines']
+    assert estimate['estimate'] == 12
+    assert estimate['relative_error'] == 0.0
\ No newline at end of file
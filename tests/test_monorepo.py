@@ -0,0 +1,47 @@
+import random
+from dataclasses import replace
+from monorepo import detect_packages, unassigned_files, rollup
+from path_index import PathIndex
+from repository_mirror import RepositoryMirror
+from factories import random_result
+
+def make_results(partial: bool):
+    rng = random.Random(7)
+    mirror = RepositoryMirror()
+    results = {}
+    for path in ('packages/api', 'packages/web'):
+        result = random_result(rng, mirror, name=path.split('/')[-1])
+        results[path] = replace(result, confidence='Medium', partial=partial)
+    return results
+
+def test_partial_packages_lower_confidence_only_once():
+    assert rollup(make_results(partial=False)).confidence == 'Medium'
+    
+    partial = rollup(make_results(partial=True))
+    assert partial.partial
+    assert partial.confidence == 'Medium'
+
+def test_files_outside_every_package_are_reported(tmp_path):
+    for package in ('packages/api', 'packages/web'):
+        (tmp_path / package).mkdir(parents=True)
+        (tmp_path / package / 'package.json').write_text('{}')
+        (tmp_path / package / 'index.js').write_text('module.exports = 1;\n')
+    (tmp_path / 'scripts').mkdir()
+    (tmp_path / 'scripts' / 'release.py').write_text('print(1)\n')
+    (tmp_path / 'NOTES.txt').write_text('notes\n')
+    
+    path_index = PathIndex(str(tmp_path))
+    packages = detect_packages(path_index)
+    unassigned = unassigned_files(path_index, packages)
+    
+    assert packages == ['packages/api', 'packages/web']
+    assert sorted(unassigned) == ['NOTES.txt', 'scripts/release.py']
+    
+    summary = rollup(make_results(partial=False), unassigned=unassigned)
+    assert summary.unassigned_files == 2
+    assert summary.unassigned_code_files == 1
+
+def test_whole_repository_package_leaves_nothing_unassigned(tmp_path):
+    (tmp_path / 'app.py').write_text('print(1)\n')
+    
+    assert unassigned_files(PathIndex(str(tmp_path)), ['']) == []
\ No newline at end of file
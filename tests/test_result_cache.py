@@ -0,0 +1,94 @@
+import os
+import random
+from result_cache import ResultCache, config_hash
+from scoring_engine import ScoringEngine
+from factories import random_result
+
+SHA = 'a' * 40
+
+def make_result(name: str = 'repo'):
+    return random_result(random.Random(11), owner='Owner', name=name)
+
+def age(cache: ResultCache, key: str, mtime: float):
+    os.utime(cache._path(key), (mtime, mtime))
+
+def test_key_separates_identity_commit_variant_and_scoring(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.make_key('Owner', 'Repo', SHA)
+    
+    assert key == cache.make_key('owner', 'repo', SHA)
+    assert key != cache.make_key('owner', 'other', SHA)
+    assert key != cache.make_key('owner', 'repo', 'b' * 40)
+    assert key != cache.make_key('owner', 'repo', SHA, 'sample=100')
+    assert cache.make_key('owner', 'repo', SHA, 'sample=100') == cache.make_key('owner', 'repo', SHA, 'sample=100')
+    
+    custom = ScoringEngine()
+    assert cache.make_key('owner', 'repo', SHA, scoring_engine=custom) == key
+    custom.weights = {**custom.weights, 'code_quality': custom.weights['code_quality'] + 0.1}
+    assert cache.make_key('owner', 'repo', SHA, scoring_engine=custom) != key
+    assert config_hash(custom) != config_hash()
+
+def test_key_is_safe_as_a_file_name(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.make_key('../evil', 'a/b', SHA)
+    
+    assert os.path.dirname(cache._path(key)) == str(tmp_path)
+
+def test_round_trip_survives_a_new_process_cache(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.make_key('owner', 'repo', SHA)
+    analysis = make_result()
+    cache.put(key, analysis)
+    
+    loaded = ResultCache(str(tmp_path)).get(key)
+    assert loaded == analysis
+    assert ResultCache(str(tmp_path)).get(cache.make_key('owner', 'repo', 'c' * 40)) is None
+
+def test_callers_get_copies(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    key = cache.make_key('owner', 'repo', SHA)
+    analysis = make_result()
+    cache.put(key, analysis)
+    
+    analysis.overall_score = -1
+    first = cache.get(key)
+    first.strengths.append('mutated')
+    
+    assert first.overall_score != -1
+    assert 'mutated' not in cache.get(key).strengths
+
+def test_disk_eviction_drops_least_recently_used(tmp_path):
+    cache = ResultCache(str(tmp_path), max_entries=2, memory_entries=2)
+    keys = [cache.make_key('owner', f"repo{i}", SHA) for i in range(3)]
+    cache.put(keys[0], make_result('repo0'))
+    cache.put(keys[1], make_result('repo1'))
+    age(cache, keys[0], 1000)
+    age(cache, keys[1], 2000)
+    
+    cache.get(keys[0])
+    cache.put(keys[2], make_result('repo2'))
+    
+    assert sorted(os.listdir(tmp_path)) == sorted(f"{key}.json" for key in (keys[0], keys[2]))
+    assert keys[1] not in cache.memory
+
+def test_memory_tier_is_bounded(tmp_path):
+    cache = ResultCache(str(tmp_path), memory_entries=2)
+    keys = [cache.make_key('owner', f"repo{i}", SHA) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, make_result(f"repo{i}"))
+    
+    assert list(cache.memory) == keys[1:]
+    assert cache.get(keys[0]) is not None
+    assert list(cache.memory) == [keys[2], keys[0]]
+
+def test_invalidate_matches_owner_and_name(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    for owner, name in [('owner', 'repo'), ('owner', 'repo-two'), ('other', 'repo')]:
+        cache.put(cache.make_key(owner, name, SHA), make_result(name))
+    
+    assert cache.invalidate('Owner', 'repo') == 1
+    assert cache.get(cache.make_key('owner', 'repo', SHA)) is None
+    assert cache.get(cache.make_key('owner', 'repo-two', SHA)) is not None
+    assert cache.invalidate('owner') == 1
+    assert cache.clear() == 1
+    assert cache.memory == {}
\ No newline at end of file
@@ -0,0 +1,85 @@
+import random
+import sqlite3
+from dataclasses import replace
+from datetime import datetime
+from result_store import ResultStore
+from factories import random_result
+
+def make_result(rng: random.Random, owner: str, name: str, day: int, score: float):
+    result = random_result(rng, owner=owner, name=name)
+    return replace(result, timestamp=datetime(2025, 1, day), overall_score=score, commit_sha=f"sha{day}")
+
+def make_store(tmp_path) -> ResultStore:
+    rng = random.Random(5)
+    store = ResultStore(str(tmp_path / 'results.db'))
+    store.add_many([
+        make_result(rng, 'alice', 'api', 3, 70.0),
+        make_result(rng, 'alice', 'api', 9, 55.0),
+        make_result(rng, 'alice', 'api', 5, 90.0),
+        make_result(rng, 'alice', 'web', 2, 60.0),
+        make_result(rng, 'bob', 'cli', 4, 80.0)
+    ])
+    return store
+
+def test_latest_scores_use_the_newest_row_per_repository(tmp_path):
+    with make_store(tmp_path) as store:
+        latest = store.latest_scores()
+        
+        assert [(row['owner'], row['name'], row['score'], row['commit_sha']) for row in latest] == [
+            ('bob', 'cli', 80.0, 'sha4'),
+            ('alice', 'web', 60.0, 'sha2'),
+            ('alice', 'api', 55.0, 'sha9')
+        ]
+        assert [row['name'] for row in store.latest_scores(owner='alice')] == ['web', 'api']
+
+def test_history_is_in_time_order(tmp_path):
+    with make_store(tmp_path) as store:
+        assert [row['score'] for row in store.history('alice', 'api')] == [70.0, 90.0, 55.0]
+        assert store.history('alice', 'missing') == []
+
+def test_top_by_dimension_ranks_latest_rows_only(tmp_path):
+    with make_store(tmp_path) as store:
+        rows = store.top_by_dimension('Code Quality', limit=10)
+        ids = {row['id'] for row in store.latest_scores()}
+        
+        assert len(rows) == 3
+        assert {row['id'] for row in rows} == ids
+        assert [row['percentage'] for row in rows] == sorted((row['percentage'] for row in rows), reverse=True)
+        assert store.top_by_dimension('code_quality', limit=10) == rows
+        assert len(store.top_by_dimension('code_quality', owner='bob')) == 1
+
+def test_load_latest_round_trips_full_results(tmp_path):
+    rng = random.Random(5)
+    analysis = make_result(rng, 'carol', 'lib', 1, 42.0)
+    with ResultStore(str(tmp_path / 'results.db')) as store:
+        analysis_id = store.add(analysis)
+        
+        assert store.add(analysis) == analysis_id
+        assert store.load(analysis_id) == analysis
+        assert store.load_latest() == [analysis]
+        assert store.load(analysis_id + 1) is None
+
+def test_runtime_history_groups_case_insensitively(tmp_path):
+    with ResultStore(str(tmp_path / 'results.db')) as store:
+        store.record_runtimes([
+            ('Alice', 'API', '2025-01-01T00:00:00', 12.0, 100),
+            ('alice', 'api', '2025-01-02T00:00:00', 8.0, 100)
+        ])
+        
+        assert store.runtime_history() == {('alice', 'api'): [12.0, 8.0]}
+
+def test_legacy_dimension_names_are_normalized(tmp_path):
+    path = str(tmp_path / 'results.db')
+    with make_store(tmp_path) as store:
+        analysis_id = store.latest_scores()[0]['id']
+    
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute(
+            "UPDATE dimension_scores SET dimension = 'Code Quality' WHERE dimension = 'code_quality' "
+            "AND analysis_id = ?", (analysis_id,)
+        )
+    connection.close()
+    
+    with ResultStore(path) as store:
+        assert any(row['id'] == analysis_id for row in store.top_by_dimension('code_quality'))
\ No newline at end of file
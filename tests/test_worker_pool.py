@@ -0,0 +1,66 @@
+import os
+import pytest
+from worker_pool import WorkerPool, WorkerDied, chunked
+from config import WORKER_POOL
+
+CHUNK = WORKER_POOL['chunk_size']
+
+def double_batch(offset, chunk):
+    for item in chunk:
+        if item == 'raise':
+            raise ValueError('bad input')
+        if item == 'exit':
+            os._exit(3)
+        if item == 'oom':
+            raise MemoryError()
+    return [item * 2 + offset for item in chunk]
+
+@pytest.fixture(scope='module')
+def pool():
+    with WorkerPool(workers=2) as pool:
+        yield pool
+
+def run(pool, items):
+    lost = []
+    results = list(pool.imap_chunked(double_batch, items, args=(1,), lost=None,
+                                     on_lost=lambda error, count: lost.append((type(error), count))))
+    return results, lost
+
+def test_chunks_cover_items_in_order():
+    items = list(range(2 * CHUNK + 3))
+    assert [len(chunk) for chunk in chunked(items)] == [CHUNK, CHUNK, 3]
+    assert [item for chunk in chunked(items) for item in chunk] == items
+
+def test_results_stay_aligned_with_items(pool):
+    items = list(range(3 * CHUNK + 5))
+    results, lost = run(pool, items)
+    
+    assert results == [item * 2 + 1 for item in items]
+    assert lost == []
+
+@pytest.mark.parametrize('marker', ['raise', 'exit', 'oom'])
+def test_lost_chunk_is_padded_in_place(pool, marker):
+    items = list(range(3 * CHUNK + 5))
+    items[CHUNK + 4] = marker
+    results, lost = run(pool, items)
+    
+    assert len(results) == len(items)
+    assert results[CHUNK:2 * CHUNK] == [None] * CHUNK
+    assert results[:CHUNK] == [item * 2 + 1 for item in items[:CHUNK]]
+    assert results[2 * CHUNK:] == [item * 2 + 1 for item in items[2 * CHUNK:]]
+    assert lost == [(WorkerDied, CHUNK)]
+
+def test_short_last_chunk_reports_its_own_size(pool):
+    items = list(range(CHUNK + 2))
+    items[-1] = 'raise'
+    results, lost = run(pool, items)
+    
+    assert results[CHUNK:] == [None, None]
+    assert lost == [(WorkerDied, 2)]
+
+def test_pool_recovers_after_a_worker_dies(pool):
+    run(pool, ['exit'])
+    results, lost = run(pool, [1, 2, 3])
+    
+    assert results == [3, 5, 7]
+    assert lost == []
\ No newline at end of file
@@ -0,0 +1,323 @@
+import os
+import sys
+import threading
+import importlib
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from typing import Callable, Iterable, Iterator, List
+from config import WORKER_POOL
+
+class WorkerDied(Exception):
+    pass
+
+def resident_bytes(pid: int = None) -> int:
+    try:
+        with open(f"/proc/{pid or 'self'}/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        if pid is not None:
+            return 0
+        import resource
+        
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+
+def limit_address_space(limit_bytes: int):
+    try:
+        import resource
+    except ImportError:
+        return
+    
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit_bytes = min(limit_bytes, hard)
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+    except (ValueError, OSError):
+        pass
+
+def warm_up(modules: Iterable[str] = WORKER_POOL['preload']):
+    for module in modules:
+        importlib.import_module(module)
+
+def _worker_main(conn, max_tasks: int, max_memory_bytes: int, address_space_bytes: int):
+    warm_up()
+    if address_space_bytes:
+        limit_address_space(address_space_bytes)
+    completed = 0
+    
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        
+        function, args = task
+        out_of_memory = False
+        try:
+            reply = (True, function(*args))
+        except MemoryError as e:
+            reply = (False, e)
+            out_of_memory = True
+        except Exception as e:
+            reply = (False, e)
+        
+        completed += 1
+        recycle = None
+        if out_of_memory:
+            recycle = 'memory'
+        elif max_tasks and completed >= max_tasks:
+            recycle = 'tasks'
+        elif max_memory_bytes and resident_bytes() > max_memory_bytes:
+            recycle = 'memory'
+        
+        try:
+            conn.send(reply + (recycle,))
+        except Exception as e:
+            conn.send((False, Exception(f"Worker result could not be returned: {e}"), recycle))
+        
+        if recycle:
+            return
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.future = None
+        self.killed = None
+
+class WorkerPool:
+    def __init__(self, workers: int = WORKER_POOL['workers'],
+                 max_tasks_per_worker: int = WORKER_POOL['max_tasks_per_worker'],
+                 max_memory_mb: int = WORKER_POOL['max_memory_mb'],
+                 address_space_mb: int = WORKER_POOL['address_space_mb'],
+                 rss_limit_mb: int = WORKER_POOL['rss_limit_mb'],
+                 start_method: str = WORKER_POOL['start_method']):
+        self.size = max(1, workers or os.cpu_count() or 1)
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024 if max_memory_mb else None
+        self.address_space_bytes = address_space_mb * 1024 * 1024 if address_space_mb else None
+        self.rss_limit_bytes = rss_limit_mb * 1024 * 1024 if rss_limit_mb else None
+        
+        if start_method not in multiprocessing.get_all_start_methods():
+            start_method = 'spawn'
+        self.context = multiprocessing.get_context(start_method)
+        if start_method == 'forkserver':
+            self.context.set_forkserver_preload(list(WORKER_POOL['preload']))
+        
+        self.lock = threading.Lock()
+        self.pending = deque()
+        self.workers = []
+        self.wakeup_reader, self.wakeup_writer = self.context.Pipe(duplex=False)
+        self.closed = False
+        self.dispatcher = None
+        self.stats = {'tasks': 0, 'failed': 0, 'spawned': 0, 'recycled': 0, 'recycled_for_memory': 0, 'died': 0,
+                      'killed_for_memory': 0}
+    
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=_worker_main,
+            args=(child_conn, self.max_tasks_per_worker, self.max_memory_bytes, self.address_space_bytes),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self.stats['spawned'] += 1
+        return _Worker(process, parent_conn)
+    
+    def start(self) -> 'WorkerPool':
+        if self.dispatcher is None:
+            self.workers = [self._spawn() for _ in range(self.size)]
+            self.dispatcher = threading.Thread(target=self._dispatch, name='worker-pool', daemon=True)
+            self.dispatcher.start()
+        return self
+    
+    def _wake(self):
+        try:
+            self.wakeup_writer.send(None)
+        except OSError:
+            pass
+    
+    def submit(self, function: Callable, *args) -> Future:
+        future = Future()
+        with self.lock:
+            if self.closed:
+                raise RuntimeError("submit on a closed worker pool")
+            self.pending.append((future, function, args))
+        self._wake()
+        return future
+    
+    def _assign(self):
+        with self.lock:
+            for worker in self.workers:
+                if worker.future is not None:
+                    continue
+                while self.pending:
+                    future, function, args = self.pending.popleft()
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        worker.conn.send((function, args))
+                    except Exception as e:
+                        future.set_exception(e)
+                        continue
+                    worker.future = future
+                    break
+                if not self.pending:
+                    break
+    
+    def _replace(self, worker: _Worker):
+        worker.conn.close()
+        worker.process.join()
+        with self.lock:
+            if self.closed:
+                self.workers.remove(worker)
+            else:
+                self.workers[self.workers.index(worker)] = self._spawn()
+    
+    def _finish(self, worker: _Worker, ok: bool, value):
+        future, worker.future = worker.future, None
+        self.stats['tasks'] += 1
+        if ok:
+            future.set_result(value)
+        else:
+            self.stats['failed'] += 1
+            future.set_exception(value)
+    
+    def _dispatch(self):
+        while True:
+            self._assign()
+            
+            with self.lock:
+                if self.closed and not self.pending and all(w.future is None for w in self.workers):
+                    return
+                handles = {self.wakeup_reader: None}
+                for worker in self.workers:
+                    handles[worker.process.sentinel] = worker
+                    if worker.future is not None:
+                        handles[worker.conn] = worker
+            
+            ready = wait(list(handles), timeout=WORKER_POOL['poll_interval'])
+            if self.wakeup_reader in ready:
+                while self.wakeup_reader.poll():
+                    self.wakeup_reader.recv()
+            
+            for worker in {handles[handle] for handle in ready} - {None}:
+                if worker.future is not None and worker.conn.poll():
+                    try:
+                        ok, value, recycle = worker.conn.recv()
+                    except (EOFError, OSError):
+                        worker.process.join()
+                    else:
+                        self._finish(worker, ok, value)
+                        if recycle:
+                            self.stats['recycled'] += 1
+                            if recycle == 'memory':
+                                self.stats['recycled_for_memory'] += 1
+                            self._replace(worker)
+                            continue
+                
+                if not worker.process.is_alive():
+                    worker.process.join()
+                    self.stats['died'] += 1
+                    if worker.future is not None:
+                        self._finish(worker, False, WorkerDied(
+                            worker.killed or f"Analysis worker exited with code {worker.process.exitcode}"
+                        ))
+                    self._replace(worker)
+            
+            if self.rss_limit_bytes:
+                self._enforce_rss_limit()
+    
+    def _enforce_rss_limit(self):
+        with self.lock:
+            busy = [worker for worker in self.workers if worker.future is not None and worker.killed is None]
+        
+        for worker in busy:
+            resident = resident_bytes(worker.process.pid)
+            if resident > self.rss_limit_bytes:
+                worker.killed = f"Analysis worker killed at {resident // (1024 * 1024)} MB resident memory"
+                self.stats['killed_for_memory'] += 1
+                worker.process.kill()
+    
+    def imap(self, function: Callable, arg_tuples: Iterable[tuple], window: int = None,
+             return_exceptions: bool = False) -> Iterator:
+        window = window or self.size * 2
+        arg_tuples = iter(arg_tuples)
+        futures = deque()
+        
+        try:
+            for args in arg_tuples:
+                futures.append(self.submit(function, *args))
+                if len(futures) >= window:
+                    break
+            
+            while futures:
+                future = futures.popleft()
+                if return_exceptions and future.exception() is not None:
+                    result = future.exception()
+                else:
+                    result = future.result()
+                for args in arg_tuples:
+                    futures.append(self.submit(function, *args))
+                    break
+                yield result
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def imap_chunked(self, function: Callable, items: List, args: tuple = (), lost=None,
+                     on_lost: Callable = None) -> Iterator:
+        chunks = list(chunked(items))
+        batches = self.imap(function, (args + (chunk,) for chunk in chunks), return_exceptions=True)
+        try:
+            for chunk, batch in zip(chunks, batches):
+                if isinstance(batch, Exception):
+                    if not isinstance(batch, WorkerDied):
+                        batch = WorkerDied(f"Analysis worker failed with {batch!r}")
+                    if on_lost is not None:
+                        on_lost(batch, len(chunk))
+                    batch = [lost] * len(chunk)
+                yield from batch
+        finally:
+            batches.close()
+    
+    def map(self, function: Callable, arg_tuples: Iterable[tuple]) -> List:
+        return list(self.imap(function, arg_tuples))
+    
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+        self._wake()
+        
+        if self.dispatcher is not None:
+            self.dispatcher.join()
+        
+        for worker in self.workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self.workers:
+            worker.process.join(WORKER_POOL['poll_interval'] * 4)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+def chunked(items: List, size: int = WORKER_POOL['chunk_size']) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
\ No newline at end of file